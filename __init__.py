@@ -48,60 +48,95 @@ PACKAGE_NAME = 'ai-learning-generator'
 PACKAGE_DESCRIPTION = 'AI-powered educational content generation platform'
 PACKAGE_URL = 'https://github.com/yourusername/ai-learning-generator'
 
-# Import main components for easy access
-try:
-    from .app import create_app, app
+import importlib
+import importlib.util
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import create_app, app, QuizGenerator
     from .config import Config, DevelopmentConfig, ProductionConfig, TestingConfig
     from .openai_mw import OpenAIMiddleware
-    
-    # Import key models
     from .models.quiz_models import Quiz, Question, Answer
     from .models.user_models import User, UserProfile
-    from .models.content_models import Course, Lesson, Content
-    
-    # Import utilities
-    from .utils.ai_helpers import QuizGenerator, ContentAnalyzer
+    from .models.content_models import Course, Section
     from .utils.text_processing import TextProcessor
     from .utils.validation import InputValidator
-    from .utils.helpers import FileManager
-    
-    __all__ = [
-        # Core components
-        'create_app', 'app', 'Config', 'OpenAIMiddleware',
-        
-        # Models
-        'Quiz', 'Question', 'Answer', 'User', 'UserProfile',
-        'Course', 'Lesson', 'Content',
-        
-        # Utilities
-        'QuizGenerator', 'ContentAnalyzer', 'TextProcessor',
-        'InputValidator', 'FileManager',
-        
-        # Metadata
-        '__version__', 'VERSION', 'VERSION_INFO',
-        'PACKAGE_NAME', 'PACKAGE_DESCRIPTION', 'PACKAGE_URL',
-    ]
-    
-except ImportError as e:
-    # Handle import errors gracefully during development
-    import warnings
-    warnings.warn(f"Some components could not be imported: {e}")
-    
-    __all__ = [
-        '__version__', 'VERSION', 'VERSION_INFO',
-        'PACKAGE_NAME', 'PACKAGE_DESCRIPTION', 'PACKAGE_URL',
-    ]
+    from .utils.file_operations import FileManager
+
+# Public names resolved on first access (PEP 562), so that importing the
+# package for metadata or the CLI does not pull in Flask, openai or pandas.
+_LAZY_IMPORTS = {
+    # Core components
+    'create_app': ('.app', 'create_app'),
+    'app': ('.app', 'app'),
+    'QuizGenerator': ('.app', 'QuizGenerator'),
+    'Config': ('.config', 'Config'),
+    'DevelopmentConfig': ('.config', 'DevelopmentConfig'),
+    'ProductionConfig': ('.config', 'ProductionConfig'),
+    'TestingConfig': ('.config', 'TestingConfig'),
+    'OpenAIMiddleware': ('.openai_mw', 'OpenAIMiddleware'),
+
+    # Models
+    'Quiz': ('.models.quiz_models', 'Quiz'),
+    'Question': ('.models.quiz_models', 'Question'),
+    'Answer': ('.models.quiz_models', 'Answer'),
+    'User': ('.models.user_models', 'User'),
+    'UserProfile': ('.models.user_models', 'UserProfile'),
+    'Course': ('.models.content_models', 'Course'),
+    'Section': ('.models.content_models', 'Section'),
+
+    # Utilities
+    'TextProcessor': ('.utils.text_processing', 'TextProcessor'),
+    'InputValidator': ('.utils.validation', 'InputValidator'),
+    'FileManager': ('.utils.file_operations', 'FileManager'),
+}
+
+__all__ = [
+    # Core components
+    'create_app', 'app', 'QuizGenerator',
+    'Config', 'DevelopmentConfig', 'ProductionConfig', 'TestingConfig',
+    'OpenAIMiddleware',
+
+    # Models
+    'Quiz', 'Question', 'Answer', 'User', 'UserProfile',
+    'Course', 'Section',
+
+    # Utilities
+    'TextProcessor', 'InputValidator', 'FileManager',
+
+    # Metadata
+    '__version__', 'VERSION', 'VERSION_INFO',
+    'PACKAGE_NAME', 'PACKAGE_DESCRIPTION', 'PACKAGE_URL',
+]
+
+def __getattr__(name):
+    """Import public components lazily on first attribute access."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+# Package-wide constants are read-only: mappings are exposed through
+# MappingProxyType and sequences as tuples
 
 # Configuration for different environments
-ENVIRONMENTS = {
+ENVIRONMENTS = MappingProxyType({
     'development': 'config.DevelopmentConfig',
     'testing': 'config.TestingConfig',
     'production': 'config.ProductionConfig',
     'default': 'config.Config'
-}
+})
 
 # Feature flags
-FEATURES = {
+FEATURES = MappingProxyType({
     'ai_generation': True,
     'user_authentication': True,
     'rate_limiting': True,
@@ -112,19 +147,19 @@ FEATURES = {
     'email_notifications': False,
     'social_login': False,
     'premium_features': False,
-}
+})
 
 # Supported languages and models
-SUPPORTED_LANGUAGES = ['en', 'it', 'es', 'fr', 'de']
-SUPPORTED_MODELS = [
+SUPPORTED_LANGUAGES = ('en', 'it', 'es', 'fr', 'de')
+SUPPORTED_MODELS = (
     'gpt-3.5-turbo',
     'gpt-4',
     'gpt-4-turbo-preview',
     'text-davinci-003',
-]
+)
 
 # Default configuration values
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = MappingProxyType({
     'QUESTIONS_PER_QUIZ': 10,
     'MAX_CONTENT_LENGTH': 50000,
     'CACHE_TIMEOUT': 300,
@@ -132,7 +167,7 @@ DEFAULT_CONFIG = {
     'API_VERSION': 'v1',
     'DEFAULT_LANGUAGE': 'en',
     'DEFAULT_MODEL': 'gpt-3.5-turbo',
-}
+})
 
 def get_version():
     """Return the package version."""
@@ -151,19 +186,30 @@ def get_package_info():
         'copyright': __copyright__,
     }
 
+# Distribution name -> importable module name for required packages
+_REQUIRED_PACKAGES = {
+    'flask': 'flask',
+    'openai': 'openai',
+    'requests': 'requests',
+    'python-dotenv': 'dotenv',
+    'pyyaml': 'yaml',
+    'pandas': 'pandas',
+}
+
+_DEPS_OK = False
+
 def check_dependencies():
     """Check if all required dependencies are available."""
-    required_packages = [
-        'flask', 'openai', 'requests', 'python-dotenv',
-        'flask-cors', 'pyyaml', 'pandas'
-    ]
+    global _DEPS_OK
+    if _DEPS_OK:
+        return True
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only consults the import finders; the packages themselves
+    # are not executed
+    missing_packages = [
+        package for package, module in _REQUIRED_PACKAGES.items()
+        if importlib.util.find_spec(module) is None
+    ]
     
     if missing_packages:
         raise ImportError(
@@ -171,6 +217,7 @@ def check_dependencies():
             f"Install them with: pip install {' '.join(missing_packages)}"
         )
     
+    _DEPS_OK = True
     return True
 
 def create_sample_app():
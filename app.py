@@ -7,27 +7,38 @@ educational content and quizzes using OpenAI's GPT models.
 
 import sys
 import os
+import json
+import time
 import logging
-from typing import Dict, Any, Optional
-from flask import Flask, request, jsonify, Response
-from flask_cors import CORS
-import openai
-from dotenv import load_dotenv
-from config import get_config
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from flask import Blueprint, Flask, current_app, request, Response
+from werkzeug.http import generate_etag
+from config import Config, get_config
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib parser
+    orjson = None
 
-# Initialize Flask app
-app = Flask(__name__)
-config = get_config()
-app.config.from_object(config)
+try:
+    import msgspec
+except ImportError:  # optional typed decoder for generated content
+    msgspec = None
 
-# Setup CORS
-CORS(app, resources={r"/*": {"origins": config.CORS_ORIGINS}})
+class _QuizSchemaError(ValueError):
+    """Raised when decoded content does not match the quiz schema"""
 
-# Configure OpenAI
-openai.api_key = config.OPENAI_API_KEY
+# Errors raised when a completion is valid JSON but not quiz content;
+# msgspec.ValidationError subclasses msgspec.DecodeError, so check these first
+_SCHEMA_ERRORS: Tuple[type, ...] = (_QuizSchemaError,)
+# Errors raised when a completion is not valid JSON
+_DECODE_ERRORS: Tuple[type, ...] = (json.JSONDecodeError,)
+if msgspec is not None:
+    _SCHEMA_ERRORS += (msgspec.ValidationError,)
+    _DECODE_ERRORS += (msgspec.DecodeError,)
 
 # Setup logging
 logging.basicConfig(
@@ -36,13 +47,212 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+@lru_cache(maxsize=1)
+def _quiz_decoder() -> Any:
+    """Return a schema-bound msgspec decoder for quiz content, or None"""
+    if msgspec is None:
+        return None
+    from models.schemas import QuizResponse
+    return msgspec.json.Decoder(QuizResponse)
+
+def _quiz_content(data: Any) -> Dict[str, Any]:
+    """Check decoded JSON against the quiz schema, keeping only its fields
+
+    Mirrors models.schemas.QuizResponse for installs without msgspec, so
+    both parsing paths accept the same content and return the same keys.
+    """
+    if not isinstance(data, dict):
+        raise _QuizSchemaError("Expected an object at `$`")
+    for name in ('topic', 'sintesi'):
+        if not isinstance(data.get(name), str):
+            raise _QuizSchemaError(f"Expected `str` at `$.{name}`")
+    questions = data.get('questionario')
+    if not isinstance(questions, list):
+        raise _QuizSchemaError("Expected `array` at `$.questionario`")
+    
+    questionario = []
+    for i, question in enumerate(questions):
+        path = f"$.questionario[{i}]"
+        if not isinstance(question, dict):
+            raise _QuizSchemaError(f"Expected an object at `{path}`")
+        for name in ('domanda', 'risposta_corretta'):
+            if not isinstance(question.get(name), str):
+                raise _QuizSchemaError(f"Expected `str` at `{path}.{name}`")
+        risposte = question.get('risposte')
+        if not isinstance(risposte, dict) or not all(isinstance(v, str) for v in risposte.values()):
+            raise _QuizSchemaError(f"Expected an object of `str` at `{path}.risposte`")
+        questionario.append({
+            'domanda': question['domanda'],
+            'risposte': risposte,
+            'risposta_corretta': question['risposta_corretta']
+        })
+    
+    return {'topic': data['topic'], 'sintesi': data['sintesi'], 'questionario': questionario}
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Serialize obj into a compact JSON response
+
+    The body is fully encoded up front, so the response carries a
+    Content-Length and is never sent chunked.
+    """
+    return Response(_json_dumps(obj), status=status, mimetype='application/json')
+
+def _static_json_response(body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, answering 304 when the client's copy is current"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=5'
+    return response
+
+# Guards the per-app response cache, which is shared by request threads
+_cache_lock = threading.Lock()
+
+# Topic of the placeholder returned when a completion cannot be parsed
+_PARSE_ERROR_TOPIC = "Error"
+
+def _is_parse_error(result: Dict[str, Any]) -> bool:
+    """Return True for the placeholder built by QuizGenerator._parse_response"""
+    return result.get("topic") == _PARSE_ERROR_TOPIC and not result.get("questionario")
+
+def _cache_key(params: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """Return the response cache key for params, or None if uncacheable"""
+    # Random topics are expected to differ on every request
+    if params.get('random_topic', 'false') == 'true':
+        return None
+    return (
+        str(params.get('topic', '')).strip().lower(),
+        str(params.get('language', 'english')),
+        str(params.get('num_of_questions', '1')),
+        str(params.get('num_of_replies', '2')),
+    )
+
+def _create_openai_client(app_config: Config) -> Any:
+    """Build an OpenAI client on a pooled keep-alive HTTP connection
+
+    Returns None for legacy (<1.0) SDKs or when no API key is configured,
+    in which case the module-level openai API is used.
+    """
+    import openai
+    if not hasattr(openai, 'OpenAI') or not app_config.OPENAI_API_KEY:
+        return None
+    
+    import httpx
+    from importlib.util import find_spec
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=app_config.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=app_config.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        # HTTP/2 multiplexing needs the optional h2 package
+        http2=find_spec('h2') is not None,
+        timeout=app_config.OPENAI_TIMEOUT
+    )
+    # Retries are handled by QuizGenerator._with_retries
+    return openai.OpenAI(
+        api_key=app_config.OPENAI_API_KEY,
+        http_client=http_client,
+        max_retries=0
+    )
+
+@lru_cache(maxsize=1)
+def _transient_openai_errors() -> Tuple[type, ...]:
+    """Return the OpenAI exception classes worth retrying"""
+    import openai
+    # Legacy SDKs expose the exceptions on openai.error, newer ones on openai
+    modules = [openai, getattr(openai, 'error', None)]
+    names = ('RateLimitError', 'APIConnectionError', 'APITimeoutError',
+             'InternalServerError', 'Timeout', 'ServiceUnavailableError', 'TryAgain')
+    return tuple({
+        getattr(module, name) for module in modules if module is not None
+        for name in names if isinstance(getattr(module, name, None), type)
+    })
+
+@lru_cache(maxsize=32)
+def _questions_text(num_questions: str) -> str:
+    """Return the prompt fragment describing how many questions to generate"""
+    return "one question" if num_questions == '1' else f"{num_questions} questions, each"
+
 class QuizGenerator:
     """Handles quiz and course content generation using OpenAI API"""
     
-    def __init__(self):
-        self.model = config.DEFAULT_MODEL
-        self.max_tokens = config.MAX_TOKENS
-        self.temperature = config.TEMPERATURE
+    # Constant prompt text; only the placeholders vary between requests
+    _PROMPT_TEMPLATE = """Generate a quiz with {questions_text} having {num_replies} different possible answers 
+        (numbered with alphabet letters), with only one correct answer (indicate only the letter 
+        without replicating the answer content), while the others are incorrect but plausible. 
+        Also indicate which is the correct answer. Before the quiz, print a summary of the topic 
+        in about 500 words in {language}.
+
+        All results, including topic, summary, questions and answers must be formatted in JSON. 
+        The topic to use for questions is: {topic}
+
+        All output should be in language: {language}
+
+        The JSON formatting must follow this example:
+        {{
+            "topic": "example",
+            "sintesi": "Example summary.",
+            "questionario": [
+                {{
+                    "domanda": "Example question?",
+                    "risposte": {{
+                        "A": "Answer A.",
+                        "B": "Answer B."
+                    }},
+                    "risposta_corretta": "A"
+                }}
+            ]
+        }}"""
+    
+    # Shown for random topics and whenever image generation fails
+    _DEFAULT_IMAGE = "images/about_img.jpg"
+    
+    def __init__(self, app_config: Optional[Config] = None, client: Any = None):
+        self.config = app_config or get_config()
+        # openai>=1.0 client sharing one connection pool; None uses the
+        # module-level legacy API
+        self._client = client
+        self.model = self.config.DEFAULT_MODEL
+        self.max_tokens = self.config.MAX_TOKENS
+        self.temperature = self.config.TEMPERATURE
+        
+        # (check, message) pairs applied in order to the parsed question
+        # count, reply count and language; messages are formatted up front
+        max_questions = self.config.MAX_QUESTIONS
+        max_answers = self.config.MAX_ANSWERS
+        supported_languages = frozenset(self.config.SUPPORTED_LANGUAGES)
+        self._checks = (
+            (lambda q: 1 <= q <= max_questions,
+             f"Number of questions must be between 1 and {max_questions}"),
+            (lambda r: 2 <= r <= max_answers,
+             f"Number of replies must be between 2 and {max_answers}"),
+            (supported_languages.__contains__, "Unsupported language: {}"),
+        )
+        self._image_options = {
+            'n': self.config.IMAGE_COUNT,
+            'size': self.config.IMAGE_SIZE,
+        }
+        
+        # Shared pool bounding concurrent OpenAI calls; lets the image and
+        # text requests of one quiz run side by side.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.OPENAI_MAX_WORKERS,
+            thread_name_prefix='openai'
+        )
     
     def generate_content(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Generate course content and quiz based on parameters"""
@@ -56,65 +266,147 @@ class QuizGenerator:
             # Validate parameters
             self._validate_parameters(params)
             
-            # Generate image URL
-            image_url = self._generate_image(topic, random_topic == 'true')
+            # Generate image URL while the text is being generated
+            image_future = self._executor.submit(self._generate_image, topic, random_topic == 'true')
             
             # Build prompt for content generation
             prompt = self._build_prompt(topic, random_topic, num_questions, num_replies, language)
             
-            logger.info(f"Generating content for topic: {topic}, language: {language}")
+            logger.info("Generating content for topic: %s, language: %s", topic, language)
             
             # For development/testing, return mock data
-            if config.DEBUG and os.environ.get('USE_MOCK_DATA', 'false').lower() == 'true':
-                return self._get_mock_response(image_url)
+            if self._use_mock_data():
+                return self._get_mock_response(image_future.result())
             
             # Generate content using OpenAI
-            response = openai.Completion.create(
-                engine=self.model,
-                prompt=prompt,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
+            response = self._with_retries(self._create_completion, prompt)
             
             # Parse and return response
             content = response.choices[0].text.strip()
-            return self._parse_response(content, image_url)
+            return self._parse_response(content, image_future.result())
             
         except Exception as e:
-            logger.error(f"Error generating content: {str(e)}")
+            logger.error("Error generating content: %s", e)
             raise
     
-    def _validate_parameters(self, params: Dict[str, Any]) -> None:
-        """Validate input parameters"""
-        num_questions = int(params.get('num_of_questions', 0))
-        num_replies = int(params.get('num_of_replies', 0))
-        
-        if num_questions < 1 or num_questions > config.MAX_QUESTIONS:
-            raise ValueError(f"Number of questions must be between 1 and {config.MAX_QUESTIONS}")
+    def generate_batch(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate content for several requests using batched completion calls"""
+        try:
+            prompts = []
+            image_futures = []
+            for params in params_list:
+                topic = params.get('topic', '')
+                random_topic = params.get('random_topic', 'false')
+                
+                self._validate_parameters(params)
+                image_futures.append(
+                    self._executor.submit(self._generate_image, topic, random_topic == 'true')
+                )
+                prompts.append(self._build_prompt(
+                    topic,
+                    random_topic,
+                    params.get('num_of_questions', '1'),
+                    params.get('num_of_replies', '2'),
+                    params.get('language', 'english')
+                ))
+            
+            logger.info("Generating batched content for %d requests", len(prompts))
+            
+            if self._use_mock_data():
+                return [self._get_mock_response(future.result()) for future in image_futures]
+            
+            # The completion endpoint accepts a list of prompts; the shared
+            # instructions are paid once per call instead of once per request.
+            batch_size = self.config.MAX_BATCH
+            chunks = [prompts[start:start + batch_size]
+                      for start in range(0, len(prompts), batch_size)]
+            response_futures = [
+                self._executor.submit(self._with_retries, self._create_completion, chunk)
+                for chunk in chunks
+            ]
+            
+            contents: List[str] = []
+            for chunk, future in zip(chunks, response_futures):
+                # Choices are not guaranteed to be ordered, map them back by index
+                texts = [''] * len(chunk)
+                for choice in future.result().choices:
+                    texts[choice.index] = choice.text.strip()
+                contents.extend(texts)
+            
+            return [self._parse_response(content, future.result())
+                    for content, future in zip(contents, image_futures)]
+            
+        except Exception as e:
+            logger.error("Error generating batched content: %s", e)
+            raise
+    
+    def _create_completion(self, prompt: Union[str, List[str]]) -> Any:
+        """Send one completion request for a prompt or a list of prompts"""
+        if self._client is not None:
+            return self._client.completions.create(
+                model=self.model,
+                prompt=prompt,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            )
         
-        if num_replies < 2 or num_replies > config.MAX_ANSWERS:
-            raise ValueError(f"Number of replies must be between 2 and {config.MAX_ANSWERS}")
+        import openai
+        return openai.Completion.create(
+            engine=self.model,
+            prompt=prompt,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature
+        )
+    
+    def _with_retries(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call an OpenAI function, retrying transient failures with exponential backoff"""
+        transient_errors = _transient_openai_errors()
+        max_attempts = self.config.OPENAI_MAX_RETRIES
+        delay = self.config.OPENAI_RETRY_BACKOFF
         
-        language = params.get('language', '')
-        if language not in config.SUPPORTED_LANGUAGES:
-            raise ValueError(f"Unsupported language: {language}")
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return func(*args)
+            except transient_errors as e:
+                if attempt == max_attempts:
+                    raise
+                logger.warning("Transient OpenAI error (attempt %d/%d), retrying in %ss: %s",
+                               attempt, max_attempts, delay, e)
+                time.sleep(delay)
+                delay *= 2
+    
+    def _use_mock_data(self) -> bool:
+        """Check whether mock responses should be returned instead of calling OpenAI"""
+        return self.config.DEBUG and os.environ.get('USE_MOCK_DATA', 'false').lower() == 'true'
+    
+    def _validate_parameters(self, params: Dict[str, Any]) -> None:
+        """Validate input parameters"""
+        values = (
+            int(params.get('num_of_questions', 0)),
+            int(params.get('num_of_replies', 0)),
+            params.get('language', ''),
+        )
+        for (check, message), value in zip(self._checks, values):
+            if not check(value):
+                raise ValueError(message.format(value))
     
     def _generate_image(self, topic: str, is_random: bool) -> str:
         """Generate or return image URL"""
+        if is_random or not topic:
+            return self._DEFAULT_IMAGE
+        
+        prompt = f"An educational illustration representing: {topic}"
         try:
-            if not is_random and topic:
-                prompt = f"An educational illustration representing: {topic}"
-                response = openai.Image.create(
-                    prompt=prompt,
-                    n=config.IMAGE_COUNT,
-                    size=config.IMAGE_SIZE,
-                )
-                return response["data"][0]["url"]
-            else:
-                return "images/about_img.jpg"  # Default image
+            if self._client is not None:
+                response = self._client.images.generate(prompt=prompt, **self._image_options)
+                return response.data[0].url
+            
+            import openai
+            response = openai.Image.create(prompt=prompt, **self._image_options)
+            return response["data"][0]["url"]
         except Exception as e:
-            logger.warning(f"Failed to generate image: {str(e)}")
-            return "images/about_img.jpg"  # Fallback to default
+            logger.warning("Failed to generate image: %s", e)
+            return self._DEFAULT_IMAGE
     
     def _build_prompt(self, topic: str, random_topic: str, num_questions: str, 
                      num_replies: str, language: str) -> str:
@@ -122,54 +414,39 @@ class QuizGenerator:
         if random_topic == 'true':
             topic = "a random educational topic chosen by ChatGPT"
         
-        questions_text = "one question" if num_questions == '1' else f"{num_questions} questions, each"
-        
-        prompt = f"""Generate a quiz with {questions_text} having {num_replies} different possible answers 
-        (numbered with alphabet letters), with only one correct answer (indicate only the letter 
-        without replicating the answer content), while the others are incorrect but plausible. 
-        Also indicate which is the correct answer. Before the quiz, print a summary of the topic 
-        in about 500 words in {language}.
-
-        All results, including topic, summary, questions and answers must be formatted in JSON. 
-        The topic to use for questions is: {topic}
-
-        All output should be in language: {language}
-
-        The JSON formatting must follow this example:
-        {{
-            "topic": "example",
-            "sintesi": "Example summary.",
-            "questionario": [
-                {{
-                    "domanda": "Example question?",
-                    "risposte": {{
-                        "A": "Answer A.",
-                        "B": "Answer B."
-                    }},
-                    "risposta_corretta": "A"
-                }}
-            ]
-        }}"""
-        
-        return prompt
+        return self._PROMPT_TEMPLATE.format(
+            questions_text=_questions_text(num_questions),
+            num_replies=num_replies,
+            language=language,
+            topic=topic
+        )
     
     def _parse_response(self, content: str, image_url: str) -> Dict[str, Any]:
         """Parse OpenAI response and add image URL"""
+        decoder = _quiz_decoder()
         try:
-            # Try to parse as JSON
-            import json
-            response_data = json.loads(content)
+            # Decode straight into the quiz schema when msgspec is available,
+            # otherwise parse as plain JSON and check it against the same
+            # schema (orjson's decode error subclasses json's)
+            if decoder is not None:
+                response_data = msgspec.to_builtins(decoder.decode(content))
+            else:
+                response_data = _quiz_content(_json_loads(content))
+        except _SCHEMA_ERRORS as e:
+            logger.error("OpenAI response does not match the quiz schema: %s", e)
+        except _DECODE_ERRORS:
+            logger.error("Failed to parse OpenAI response as JSON")
+        else:
             response_data["imageUrl"] = image_url
             return response_data
-        except json.JSONDecodeError:
-            # If parsing fails, return a structured error response
-            logger.error("Failed to parse OpenAI response as JSON")
-            return {
-                "topic": "Error",
-                "sintesi": "Failed to generate content. Please try again.",
-                "questionario": [],
-                "imageUrl": image_url
-            }
+        
+        # If parsing fails, return a structured error response
+        return {
+            "topic": _PARSE_ERROR_TOPIC,
+            "sintesi": "Failed to generate content. Please try again.",
+            "questionario": [],
+            "imageUrl": image_url
+        }
     
     def _get_mock_response(self, image_url: str) -> Dict[str, Any]:
         """Return mock response for testing"""
@@ -191,35 +468,40 @@ class QuizGenerator:
             "imageUrl": image_url
         }
 
-# Initialize quiz generator
-quiz_generator = QuizGenerator()
+api = Blueprint('api', __name__)
+
+# Bodies of the static endpoints, encoded once with their ETags
+_ROOT_BODY = _json_dumps({
+    "message": "AI-Powered E-Learning Generator API",
+    "version": Config.API_VERSION,
+    "status": "active"
+})
+_ROOT_ETAG = generate_etag(_ROOT_BODY)
+_HEALTH_BODY = _json_dumps({
+    "status": "healthy",
+    "service": "ai-learning-generator",
+    "version": Config.API_VERSION
+})
+_HEALTH_ETAG = generate_etag(_HEALTH_BODY)
 
-@app.route('/')
-def root() -> str:
+@api.route('/')
+def root() -> Response:
     """Root endpoint"""
     logger.info("Root endpoint accessed")
-    return jsonify({
-        "message": "AI-Powered E-Learning Generator API",
-        "version": config.API_VERSION,
-        "status": "active"
-    })
+    return _static_json_response(_ROOT_BODY, _ROOT_ETAG)
 
-@app.route("/health")
+@api.route("/health")
 def health_check() -> Response:
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "ai-learning-generator",
-        "version": config.API_VERSION
-    })
+    return _static_json_response(_HEALTH_BODY, _HEALTH_ETAG)
 
-@app.route(f"{config.API_BASE_PATH}/middleware_chatgpt", methods=["GET"])
+@api.route(f"{Config.API_BASE_PATH}/middleware_chatgpt", methods=["GET"])
 def request_get() -> Response:
     """Handle GET requests (not allowed)"""
     logger.warning("GET request attempted on POST-only endpoint")
-    return jsonify({"error": "GET method not allowed"}), 405
+    return _json_response({"error": "GET method not allowed"}, 405)
 
-@app.route(f"{config.API_BASE_PATH}/middleware_chatgpt", methods=["POST"])
+@api.route(f"{Config.API_BASE_PATH}/middleware_chatgpt", methods=["POST"])
 def request_post() -> Response:
     """Handle POST requests for content generation"""
     try:
@@ -227,46 +509,177 @@ def request_post() -> Response:
         
         # Validate request
         if not request.is_json:
-            return jsonify({"error": "Request must be JSON"}), 400
+            return _json_response({"error": "Request must be JSON"}, 400)
         
         request_data = request.get_json()
         if not request_data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
+        
+        # Serve identical requests from the response cache
+        quiz_cache = current_app.extensions['quiz_cache']
+        cache_key = _cache_key(request_data)
+        if cache_key is not None:
+            with _cache_lock:
+                result = quiz_cache.get(cache_key)
+            if result is not None:
+                logger.info("Returning cached content")
+                response = _json_response(result)
+                response.headers['X-Cache'] = 'HIT'
+                return response
         
         # Generate content
-        result = quiz_generator.generate_content(request_data)
+        result = current_app.extensions['quiz_generator'].generate_content(request_data)
+        # A failed parse is worth retrying, so never replay it from the cache
+        if cache_key is not None and not _is_parse_error(result):
+            with _cache_lock:
+                quiz_cache[cache_key] = result
         
         logger.info("Content generated successfully")
-        return jsonify(result)
+        response = _json_response(result)
+        response.headers['X-Cache'] = 'MISS'
+        return response
+        
+    except ValueError as e:
+        logger.error("Validation error: %s", e)
+        return _json_response({"error": str(e)}, 400)
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        return _json_response({"error": "Internal server error"}, 500)
+
+@api.route(f"{Config.API_BASE_PATH}/middleware_chatgpt/batch", methods=["POST"])
+def request_batch() -> Response:
+    """Handle POST requests generating content for a list of parameter sets"""
+    try:
+        logger.info("Batch POST request received for content generation")
+        
+        # Validate request
+        if not request.is_json:
+            return _json_response({"error": "Request must be JSON"}, 400)
+        
+        request_data = request.get_json()
+        if not request_data or not isinstance(request_data, list):
+            return _json_response({"error": "Request body must be a non-empty list"}, 400)
+        
+        max_requests = current_app.config['MAX_BATCH_REQUESTS']
+        if len(request_data) > max_requests:
+            return _json_response({"error": f"A batch may contain at most {max_requests} requests"}, 400)
+        
+        if not all(isinstance(params, dict) for params in request_data):
+            return _json_response({"error": "Each batch entry must be an object"}, 400)
+        
+        # Generate content
+        results = current_app.extensions['quiz_generator'].generate_batch(request_data)
+        
+        logger.info("Batched content generated successfully")
+        return _json_response(results)
         
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
-        return jsonify({"error": str(e)}), 400
+        logger.error("Validation error: %s", e)
+        return _json_response({"error": str(e)}, 400)
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Unexpected error: %s", e)
+        return _json_response({"error": "Internal server error"}, 500)
+
+@api.after_app_request
+def add_cors_headers(response: Response) -> Response:
+    """Add CORS headers for allowed origins"""
+    origin = request.headers.get('Origin')
+    if origin is None:
+        # Like flask-cors, always advertise a single configured origin
+        origins = current_app.config['CORS_ORIGINS']
+        if len(origins) == 1:
+            response.headers['Access-Control-Allow-Origin'] = origins[0]
+        return response
+    
+    response.vary.add('Origin')
+    if not current_app.config['CORS_ORIGIN_RE'].fullmatch(origin):
+        return response
+    
+    response.headers['Access-Control-Allow-Origin'] = origin
+    if request.method == 'OPTIONS' and 'Access-Control-Request-Method' in request.headers:
+        # Preflight request
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+        requested_headers = request.headers.get('Access-Control-Request-Headers')
+        if requested_headers:
+            response.headers['Access-Control-Allow-Headers'] = requested_headers
+        response.headers['Access-Control-Max-Age'] = '86400'
+    return response
 
-@app.errorhandler(404)
+@api.app_errorhandler(404)
 def not_found(error) -> Response:
     """Handle 404 errors"""
-    return jsonify({"error": "Endpoint not found"}), 404
+    return _json_response({"error": "Endpoint not found"}, 404)
 
-@app.errorhandler(500)
+@api.app_errorhandler(500)
 def internal_error(error) -> Response:
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {str(error)}")
-    return jsonify({"error": "Internal server error"}), 500
+    logger.error("Internal server error: %s", error)
+    return _json_response({"error": "Internal server error"}, 500)
 
-if __name__ == "__main__":
-    logger.info(f"Starting AI-Learning Generator on {config.HOST}:{config.PORT}")
-    logger.info(f"Environment: {os.environ.get('FLASK_ENV', 'development')}")
+def create_app(config_name: Optional[str] = None) -> Flask:
+    """Create and configure the Flask application"""
+    # Heavy dependencies are imported here so that importing this module
+    # (tests, tooling, the package __init__) stays cheap.
+    import openai
+    from dotenv import load_dotenv
+    from cachetools import TTLCache
+    
+    # Load environment variables
+    load_dotenv()
+    app_config = get_config(config_name)
+    
+    # Initialize Flask app
+    app = Flask(__name__)
+    app.config.from_object(app_config)
+    # Compact, unsorted output for any jsonify() calls outside _json_response
+    app.json.sort_keys = False
+    app.json.compact = True
     
-    if not config.OPENAI_API_KEY:
+    # Configure OpenAI
+    openai.api_key = app_config.OPENAI_API_KEY
+    
+    # Initialize quiz generator
+    app.extensions['quiz_generator'] = QuizGenerator(
+        app_config, client=_create_openai_client(app_config)
+    )
+    app.extensions['quiz_cache'] = TTLCache(
+        maxsize=app_config.CACHE_MAX_ENTRIES,
+        ttl=app_config.CACHE_TIMEOUT
+    )
+    
+    app.register_blueprint(api)
+    return app
+
+def __getattr__(name: str) -> Any:
+    """Build the default application on first access to ``app``"""
+    if name == 'app':
+        application = create_app()
+        globals()['app'] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def main() -> None:
+    """Run the development server"""
+    # The log format uses no thread/process fields, so skip collecting them
+    # for every record; only when running standalone, as these are global
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    app = create_app()
+    
+    logger.info("Starting AI-Learning Generator on %s:%s", app.config['HOST'], app.config['PORT'])
+    logger.info("Environment: %s", os.environ.get('FLASK_ENV', 'development'))
+    
+    if not app.config['OPENAI_API_KEY']:
         logger.error("OPENAI_API_KEY environment variable not set!")
         sys.exit(1)
     
     app.run(
-        debug=config.DEBUG,
-        host=config.HOST,
-        port=config.PORT
+        debug=app.config['DEBUG'],
+        host=app.config['HOST'],
+        port=app.config['PORT']
     )
+
+if __name__ == "__main__":
+    main()
@@ -6,24 +6,48 @@ Move sensitive settings to environment variables for production.
 """
 
 import os
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
 class Config:
     """Base configuration class"""
     
-    # Flask Configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    DEBUG = os.environ.get('FLASK_ENV') == 'development'
+    # Values read from the environment live in slots on the instance;
+    # everything else is a class-level constant
+    __slots__ = ('SECRET_KEY', 'DEBUG', 'OPENAI_API_KEY', 'HOST', 'PORT', 'CORS_ORIGINS',
+                 'CORS_ORIGIN_RE')
     
-    # OpenAI Configuration
-    OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+    # Environment-specific DEBUG override; None means follow FLASK_ENV
+    FORCE_DEBUG: Optional[bool] = None
     
-    # Server Configuration
-    HOST = os.environ.get('FLASK_HOST', '0.0.0.0')
-    PORT = int(os.environ.get('FLASK_PORT', 8080))
-    
-    # CORS Configuration
-    CORS_ORIGINS = os.environ.get('CORS_ORIGIN', 'http://127.0.0.1:5500').split(',')
+    def __init__(self):
+        # Environment variables are resolved once per instance so hot paths
+        # only pay for plain attribute access
+        
+        # Flask Configuration
+        self.SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+        if self.FORCE_DEBUG is None:
+            self.DEBUG = os.environ.get('FLASK_ENV') == 'development'
+        else:
+            self.DEBUG = self.FORCE_DEBUG
+        
+        # OpenAI Configuration
+        self.OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+        
+        # Server Configuration
+        self.HOST = os.environ.get('FLASK_HOST', '0.0.0.0')
+        try:
+            self.PORT = int(os.environ.get('FLASK_PORT', 8080))
+        except ValueError:
+            self.PORT = 8080
+        
+        # CORS Configuration
+        self.CORS_ORIGINS = os.environ.get('CORS_ORIGIN', 'http://127.0.0.1:5500').split(',')
+        # Single pattern matched against the Origin header of each request
+        self.CORS_ORIGIN_RE = re.compile('|'.join(
+            '.*' if origin == '*' else re.escape(origin) for origin in self.CORS_ORIGINS
+        ))
     
     # API Configuration
     API_VERSION = 'v1.0'
@@ -33,6 +57,17 @@ class Config:
     DEFAULT_MODEL = 'text-davinci-003'
     MAX_TOKENS = 1500
     TEMPERATURE = 0.7
+    MAX_BATCH = 8  # prompts sent in a single completion request
+    OPENAI_MAX_WORKERS = 10  # concurrent OpenAI calls per worker process
+    OPENAI_MAX_RETRIES = 3
+    OPENAI_RETRY_BACKOFF = 1.0  # seconds, doubled after each failed attempt
+    OPENAI_MAX_CONNECTIONS = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = 20
+    OPENAI_TIMEOUT = 30.0  # seconds
+    
+    # Response Cache Configuration
+    CACHE_TIMEOUT = 300  # seconds a generated quiz is reused for identical requests
+    CACHE_MAX_ENTRIES = 1024
     
     # Image Generation Configuration
     IMAGE_SIZE = '512x512'
@@ -42,6 +77,7 @@ class Config:
     MAX_QUESTIONS = 50
     MAX_ANSWERS = 10
     MAX_CONTENT_LENGTH = 10000
+    MAX_BATCH_REQUESTS = 32
     
     # Supported Languages
     SUPPORTED_LANGUAGES = {
@@ -53,16 +89,19 @@ class Config:
 
 class DevelopmentConfig(Config):
     """Development configuration"""
-    DEBUG = True
+    __slots__ = ()
+    FORCE_DEBUG = True
     
 class ProductionConfig(Config):
     """Production configuration"""
-    DEBUG = False
+    __slots__ = ()
+    FORCE_DEBUG = False
     
 class TestingConfig(Config):
     """Testing configuration"""
+    __slots__ = ()
     TESTING = True
-    DEBUG = True
+    FORCE_DEBUG = True
 
 # Configuration mapping
 config_map: Dict[str, Any] = {
@@ -75,4 +114,9 @@ config_map: Dict[str, Any] = {
 def get_config(env: str = None) -> Config:
     """Get configuration based on environment"""
     env = env or os.environ.get('FLASK_ENV', 'default')
-    return config_map.get(env, DevelopmentConfig)
+    return _load_config(env)
+
+@lru_cache(maxsize=4)
+def _load_config(env: str) -> Config:
+    """Instantiate the configuration for env once and reuse it"""
+    return config_map.get(env, DevelopmentConfig)()
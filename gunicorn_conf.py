@@ -0,0 +1,37 @@
+"""
+AI-Powered E-Learning Generator - Gunicorn Configuration
+
+Production server settings. Requests spend nearly all of their time
+waiting on OpenAI, so gevent workers let each process keep many of
+them in flight at once.
+
+Usage:
+    gunicorn -c gunicorn_conf.py 'app:create_app()'
+"""
+
+import os
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+
+if worker_class == 'gevent':
+    # Patch before the application (and openai/httpx) is preloaded so their
+    # sockets cooperate with gevent in every forked worker
+    from gevent import monkey
+    monkey.patch_all()
+
+# Server socket
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('FLASK_PORT', '8080')}"
+
+# Worker processes
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 500))
+timeout = 120  # completions and image generation can take a while
+keepalive = 5
+
+# Import the application once in the master and fork warm workers
+preload_app = True
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
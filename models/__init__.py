@@ -5,14 +5,36 @@ This package contains data model classes that define the structure
 and validation for various entities in the application.
 """
 
-from .quiz_models import Quiz, Question, Answer, QuizResult
-from .content_models import Course, Section, LearningObjective
-from .user_models import User, UserProfile, LearningProgress
-from .api_models import APIRequest, APIResponse, ErrorResponse
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .quiz_models import Quiz, Question, Answer, QuizResult
+    from .content_models import Course, Section, LearningObjective
+    from .user_models import User, UserProfile, LearningProgress
+    from .api_models import APIRequest, APIResponse, ErrorResponse
+
+# Models resolved on first access (PEP 562), so importing one model
+# module does not load the other three.
+_LAZY_IMPORTS = {
+    'Quiz': '.quiz_models',
+    'Question': '.quiz_models',
+    'Answer': '.quiz_models',
+    'QuizResult': '.quiz_models',
+    'Course': '.content_models',
+    'Section': '.content_models',
+    'LearningObjective': '.content_models',
+    'User': '.user_models',
+    'UserProfile': '.user_models',
+    'LearningProgress': '.user_models',
+    'APIRequest': '.api_models',
+    'APIResponse': '.api_models',
+    'ErrorResponse': '.api_models',
+}
 
 __all__ = [
     'Quiz',
-    'Question', 
+    'Question',
     'Answer',
     'QuizResult',
     'Course',
@@ -22,8 +44,22 @@ __all__ = [
     'UserProfile',
     'LearningProgress',
     'APIRequest',
-    'APIResponse', 
+    'APIResponse',
     'ErrorResponse'
 ]
 
 __version__ = '1.0.0'
+
+def __getattr__(name):
+    """Import models lazily on first attribute access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
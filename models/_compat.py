@@ -0,0 +1,116 @@
+"""
+Shared helpers for the data model modules
+
+This module smooths over differences between the Python versions the
+package supports and picks the fastest installed JSON encoder.
+"""
+
+import sys
+import json
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict
+
+try:
+    import msgspec
+except ImportError:  # optional fast JSON encoder
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+def slotted_dataclass(cls=None, **kwargs):
+    """dataclass decorator that also generates __slots__ on Python 3.10+
+
+    Slotted instances have no per-instance __dict__, which makes them
+    smaller and their attribute access faster. Older interpreters get a
+    regular dataclass.
+    """
+    if sys.version_info >= (3, 10):
+        kwargs.setdefault('slots', True)
+
+    def wrap(cls):
+        return dataclass(cls, **kwargs)
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+def coerce_enum(value: Any, members: Dict[str, Enum], message: str) -> Any:
+    """Convert an enum value string to its member; other values pass through
+
+    members maps each value to its member, so the conversion is a single
+    dict lookup rather than an Enum constructor call and its exception
+    handling. message is formatted with the value when it is unknown.
+    """
+    if isinstance(value, str):
+        member = members.get(value)
+        if member is None:
+            raise ValueError(message.format(value))
+        return member
+    return value
+
+_cached_isoformat = lru_cache(maxsize=1024)(datetime.isoformat)
+
+def isoformat(value: datetime) -> str:
+    """Format a datetime as ISO 8601, memoizing naive values
+
+    Models are serialized far more often than their timestamps change,
+    and a cache hit is several times cheaper than formatting. Aware
+    values are not cached: equal instants in different time zones hash
+    alike but format differently.
+    """
+    if value.tzinfo is None:
+        return _cached_isoformat(value)
+    return value.isoformat()
+
+def _parse_datetime_utc_z(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting Z for UTC
+
+    msgspec writes the UTC offset as Z, which fromisoformat only accepts
+    from Python 3.11.
+    """
+    if value[-1:] in ('Z', 'z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+# Parses the ISO 8601 timestamps any of the encoders write into datetimes
+if sys.version_info >= (3, 11):
+    parse_datetime = datetime.fromisoformat
+else:
+    parse_datetime = _parse_datetime_utc_z
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the stdlib json encoder does not handle"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes with the fastest available encoder
+
+    msgspec and orjson are C encoders that handle dataclasses, enums and
+    datetimes natively; the stdlib json module is the fallback. Objects
+    with a __json__ method are encoded from what it returns, so models can
+    be passed as-is instead of calling to_dict first. Nested dataclasses
+    are encoded field by field.
+
+    Aware UTC datetimes are written with a Z offset by msgspec and with
+    +00:00 by the other encoders; parse_datetime reads both.
+    """
+    hook = getattr(obj, '__json__', None)
+    if hook is not None:
+        obj = hook()
+    if msgspec is not None:
+        return msgspec.json.encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default, separators=(',', ':')).encode('utf-8')
@@ -5,11 +5,14 @@ This module defines data models for API requests, responses,
 and error handling structures.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+import time
+from dataclasses import field
+from typing import List, NamedTuple, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
 
+from ._compat import json_dumps, parse_datetime, slotted_dataclass
+
 class HTTPStatus(Enum):
     """HTTP status codes"""
     OK = 200
@@ -39,7 +42,24 @@ class ErrorType(Enum):
     EXTERNAL_API_ERROR = "external_api_error"
     TIMEOUT_ERROR = "timeout_error"
 
-@dataclass
+# Value -> member tables, so coercion is a single dict lookup
+_HTTP_STATUS_BY_CODE = {member.value: member for member in HTTPStatus}
+_ERROR_TYPE_BY_VALUE = {member.value: member for member in ErrorType}
+
+_METHOD_NAMES = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+_VALID_METHODS = frozenset(_METHOD_NAMES)
+_VALID_METHODS_STR = ", ".join(_METHOD_NAMES)
+
+_CONTENT_TYPE = 'Content-Type'
+_APPLICATION_JSON = 'application/json'
+
+def _format_request_id(n: datetime) -> str:
+    """Build a request id of the form req_YYYYmmdd_HHMMSS_ffffff"""
+    # Formatting the fields directly is much cheaper than strftime
+    return (f"req_{n.year:04d}{n.month:02d}{n.day:02d}_"
+            f"{n.hour:02d}{n.minute:02d}{n.second:02d}_{n.microsecond:06d}")
+
+@slotted_dataclass
 class APIRequest:
     """Represents an API request"""
     endpoint: str
@@ -48,7 +68,7 @@ class APIRequest:
     parameters: Dict[str, Any] = field(default_factory=dict)
     body: Optional[Dict[str, Any]] = None
     user_id: Optional[str] = None
-    request_id: str = field(default_factory=lambda: f"req_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+    request_id: Optional[str] = None  # derived from timestamp when omitted
     timestamp: datetime = field(default_factory=datetime.now)
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
@@ -58,11 +78,15 @@ class APIRequest:
         if not self.endpoint or not isinstance(self.endpoint, str):
             raise ValueError("Endpoint must be a non-empty string")
         
-        valid_methods = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
-        if self.method.upper() not in valid_methods:
-            raise ValueError(f"Method must be one of: {', '.join(valid_methods)}")
+        method = self.method.upper()
+        if method not in _VALID_METHODS:
+            raise ValueError(f"Method must be one of: {_VALID_METHODS_STR}")
+        
+        self.method = method
         
-        self.method = self.method.upper()
+        if self.request_id is None:
+            # Reuse the timestamp rather than reading the clock again
+            self.request_id = _format_request_id(self.timestamp)
     
     def add_header(self, key: str, value: str) -> None:
         """Add header to request"""
@@ -74,12 +98,13 @@ class APIRequest:
     
     def get_content_type(self) -> str:
         """Get content type from headers"""
-        return self.headers.get('Content-Type', 'application/json')
+        return self.headers.get(_CONTENT_TYPE, _APPLICATION_JSON)
     
     def is_json_request(self) -> bool:
         """Check if request contains JSON data"""
-        content_type = self.get_content_type()
-        return 'application/json' in content_type
+        content_type = self.headers.get(_CONTENT_TYPE, _APPLICATION_JSON)
+        # The default needs no substring scan
+        return content_type is _APPLICATION_JSON or _APPLICATION_JSON in content_type
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert request to dictionary"""
@@ -96,12 +121,18 @@ class APIRequest:
             'user_agent': self.user_agent
         }
     
+    __json__ = to_dict  # hook used by json_dumps
+    
+    def to_json(self) -> bytes:
+        """Encode request as JSON bytes"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'APIRequest':
         """Create APIRequest from dictionary"""
         timestamp = data.get('timestamp')
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = parse_datetime(timestamp)
         
         return cls(
             endpoint=data['endpoint'],
@@ -110,13 +141,13 @@ class APIRequest:
             parameters=data.get('parameters', {}),
             body=data.get('body'),
             user_id=data.get('user_id'),
-            request_id=data.get('request_id', f"req_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"),
+            request_id=data.get('request_id'),
             timestamp=timestamp or datetime.now(),
             ip_address=data.get('ip_address'),
             user_agent=data.get('user_agent')
         )
 
-@dataclass
+@slotted_dataclass
 class ValidationError:
     """Represents a validation error"""
     field: str
@@ -133,6 +164,8 @@ class ValidationError:
             'value': self.value
         }
     
+    __json__ = to_dict  # hook used by json_dumps
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ValidationError':
         """Create ValidationError from dictionary"""
@@ -143,14 +176,20 @@ class ValidationError:
             value=data.get('value')
         )
 
-@dataclass
+def _validation_error_dict(error: Union[ValidationError, Dict[str, Any]]) -> Dict[str, Any]:
+    """Serialize a stored validation error (see add_validation_error_fast)"""
+    if type(error) is dict:
+        return dict(error)
+    return error.to_dict()
+
+@slotted_dataclass
 class ErrorResponse:
     """Represents an API error response"""
     error_type: ErrorType
     message: str
     status_code: HTTPStatus = HTTPStatus.BAD_REQUEST
     details: Optional[str] = None
-    validation_errors: List[ValidationError] = field(default_factory=list)
+    validation_errors: List[Union[ValidationError, Dict[str, Any]]] = field(default_factory=list)
     error_code: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
     request_id: Optional[str] = None
@@ -160,23 +199,31 @@ class ErrorResponse:
         """Validate error response after initialization"""
         if not isinstance(self.error_type, ErrorType):
             if isinstance(self.error_type, str):
-                try:
-                    self.error_type = ErrorType(self.error_type)
-                except ValueError:
+                error_type = _ERROR_TYPE_BY_VALUE.get(self.error_type)
+                if error_type is None:
                     raise ValueError(f"Invalid error type: {self.error_type}")
+                self.error_type = error_type
         
         if not isinstance(self.status_code, HTTPStatus):
             if isinstance(self.status_code, int):
-                try:
-                    self.status_code = HTTPStatus(self.status_code)
-                except ValueError:
+                status_code = _HTTP_STATUS_BY_CODE.get(self.status_code)
+                if status_code is None:
                     raise ValueError(f"Invalid status code: {self.status_code}")
+                self.status_code = status_code
     
     def add_validation_error(self, field: str, message: str, code: Optional[str] = None) -> None:
         """Add a validation error"""
         error = ValidationError(field=field, message=message, code=code)
         self.validation_errors.append(error)
     
+    def add_validation_error_fast(self, field: str, message: str, code: Optional[str] = None) -> None:
+        """Add a validation error already shaped as its dictionary form
+        
+        Skips the ValidationError instance, for callers that report many
+        errors and only serialize them.
+        """
+        self.validation_errors.append({'field': field, 'message': message, 'code': code, 'value': None})
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert error response to dictionary"""
         return {
@@ -186,7 +233,7 @@ class ErrorResponse:
                 'message': self.message,
                 'code': self.error_code,
                 'details': self.details,
-                'validation_errors': [err.to_dict() for err in self.validation_errors],
+                'validation_errors': list(map(_validation_error_dict, self.validation_errors)),
                 'timestamp': self.timestamp.isoformat(),
                 'request_id': self.request_id,
                 'help_url': self.help_url
@@ -194,22 +241,29 @@ class ErrorResponse:
             'status_code': self.status_code.value
         }
     
+    __json__ = to_dict  # hook used by json_dumps
+    
+    def to_json(self) -> bytes:
+        """Encode error response as JSON bytes"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ErrorResponse':
         """Create ErrorResponse from dictionary"""
         error_data = data.get('error', {})
         
-        validation_errors = [ValidationError.from_dict(err_data) 
-                           for err_data in error_data.get('validation_errors', [])]
+        # Positional arguments in field order: field, message, code, value
+        validation_errors = [ValidationError(d['field'], d['message'], d.get('code'), d.get('value'))
+                             for d in error_data.get('validation_errors', ())]
         
         timestamp = error_data.get('timestamp')
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = parse_datetime(timestamp)
         
         return cls(
-            error_type=ErrorType(error_data['type']),
+            error_type=error_data['type'],
             message=error_data['message'],
-            status_code=HTTPStatus(data.get('status_code', 400)),
+            status_code=data.get('status_code', 400),
             details=error_data.get('details'),
             validation_errors=validation_errors,
             error_code=error_data.get('code'),
@@ -218,32 +272,41 @@ class ErrorResponse:
             help_url=error_data.get('help_url')
         )
 
-@dataclass
-class PaginationInfo:
-    """Pagination information for API responses"""
+class PaginationInfo(NamedTuple):
+    """Pagination information for API responses
+
+    Immutable; use build() to derive the page counts and flags.
+    """
     page: int = 1
     per_page: int = 20
     total_items: int = 0
-    total_pages: int = 0
+    total_pages: int = 1
     has_next: bool = False
     has_prev: bool = False
     next_url: Optional[str] = None
     prev_url: Optional[str] = None
     
-    def __post_init__(self):
-        """Calculate pagination values after initialization"""
-        if self.per_page <= 0:
+    @classmethod
+    def build(cls, page: int = 1, per_page: int = 20, total_items: int = 0,
+              next_url: Optional[str] = None, prev_url: Optional[str] = None) -> 'PaginationInfo':
+        """Create pagination info, calculating the derived values"""
+        if per_page <= 0:
             raise ValueError("Items per page must be positive")
         
-        if self.page <= 0:
+        if page <= 0:
             raise ValueError("Page number must be positive")
         
-        # Calculate total pages
-        self.total_pages = max(1, (self.total_items + self.per_page - 1) // self.per_page)
-        
-        # Calculate has_next and has_prev
-        self.has_next = self.page < self.total_pages
-        self.has_prev = self.page > 1
+        total_pages = max(1, (total_items + per_page - 1) // per_page)
+        return cls(
+            page=page,
+            per_page=per_page,
+            total_items=total_items,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1,
+            next_url=next_url,
+            prev_url=prev_url
+        )
     
     def get_offset(self) -> int:
         """Get the offset for database queries"""
@@ -251,18 +314,9 @@ class PaginationInfo:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert pagination info to dictionary"""
-        return {
-            'page': self.page,
-            'per_page': self.per_page,
-            'total_items': self.total_items,
-            'total_pages': self.total_pages,
-            'has_next': self.has_next,
-            'has_prev': self.has_prev,
-            'next_url': self.next_url,
-            'prev_url': self.prev_url
-        }
+        return self._asdict()
 
-@dataclass
+@slotted_dataclass
 class APIResponse:
     """Represents an API response"""
     success: bool = True
@@ -279,10 +333,10 @@ class APIResponse:
         """Validate response data after initialization"""
         if not isinstance(self.status_code, HTTPStatus):
             if isinstance(self.status_code, int):
-                try:
-                    self.status_code = HTTPStatus(self.status_code)
-                except ValueError:
+                status_code = _HTTP_STATUS_BY_CODE.get(self.status_code)
+                if status_code is None:
                     raise ValueError(f"Invalid status code: {self.status_code}")
+                self.status_code = status_code
     
     def add_metadata(self, key: str, value: Any) -> None:
         """Add metadata to response"""
@@ -290,7 +344,7 @@ class APIResponse:
     
     def set_pagination(self, page: int, per_page: int, total_items: int) -> None:
         """Set pagination information"""
-        self.pagination = PaginationInfo(
+        self.pagination = PaginationInfo.build(
             page=page,
             per_page=per_page,
             total_items=total_items
@@ -298,9 +352,13 @@ class APIResponse:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert response to dictionary"""
+        data = self.data
+        if isinstance(data, ErrorResponse):
+            data = data.to_dict()
+        
         response_dict = {
             'success': self.success,
-            'data': self.data,
+            'data': data,
             'message': self.message,
             'timestamp': self.timestamp.isoformat(),
             'request_id': self.request_id,
@@ -315,22 +373,35 @@ class APIResponse:
         
         return response_dict
     
+    __json__ = to_dict  # hook used by json_dumps
+    
+    def to_json(self) -> bytes:
+        """Encode response as JSON bytes"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'APIResponse':
         """Create APIResponse from dictionary"""
         timestamp = data.get('timestamp')
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = parse_datetime(timestamp)
         
         pagination = None
         if 'pagination' in data:
-            pagination = PaginationInfo(**data['pagination'])
+            pagination_data = data['pagination']
+            pagination = PaginationInfo.build(
+                page=pagination_data.get('page', 1),
+                per_page=pagination_data.get('per_page', 20),
+                total_items=pagination_data.get('total_items', 0),
+                next_url=pagination_data.get('next_url'),
+                prev_url=pagination_data.get('prev_url')
+            )
         
         return cls(
             success=data.get('success', True),
             data=data.get('data'),
             message=data.get('message'),
-            status_code=HTTPStatus(data.get('status_code', 200)),
+            status_code=data.get('status_code', 200),
             pagination=pagination,
             metadata=data.get('metadata', {}),
             timestamp=timestamp or datetime.now(),
@@ -338,33 +409,80 @@ class APIResponse:
             response_time=data.get('response_time_ms')
         )
     
+    @classmethod
+    def _unchecked(cls, **kwargs: Any) -> 'APIResponse':
+        """Create a response from trusted values, skipping __init__ and
+        __post_init__; every field must be passed."""
+        obj = object.__new__(cls)
+        for key, value in kwargs.items():
+            object.__setattr__(obj, key, value)
+        return obj
+    
     @classmethod
     def success_response(cls, data: Any = None, message: str = None, 
                         status_code: HTTPStatus = HTTPStatus.OK) -> 'APIResponse':
         """Create a successful API response"""
-        return cls(
+        if not isinstance(status_code, HTTPStatus):
+            return cls(
+                success=True,
+                data=data,
+                message=message,
+                status_code=status_code
+            )
+        
+        return cls._unchecked(
             success=True,
             data=data,
             message=message,
-            status_code=status_code
+            status_code=status_code,
+            pagination=None,
+            metadata={},
+            timestamp=datetime.now(),
+            request_id=None,
+            response_time=None
         )
     
     @classmethod
     def error_response(cls, error: ErrorResponse) -> 'APIResponse':
-        """Create an error API response"""
-        return cls(
+        """Create an error API response
+        
+        The error is kept as-is and only serialized by to_dict.
+        """
+        # ErrorResponse.__post_init__ has already coerced status_code
+        return cls._unchecked(
             success=False,
-            data=error.to_dict(),
-            status_code=error.status_code
+            data=error,
+            message=None,
+            status_code=error.status_code,
+            pagination=None,
+            metadata={},
+            timestamp=datetime.now(),
+            request_id=None,
+            response_time=None
         )
 
-@dataclass
+@slotted_dataclass
 class RateLimitInfo:
     """Rate limiting information"""
     limit: int  # requests per window
     remaining: int  # remaining requests
     reset_time: datetime  # when the limit resets
     window_size: int = 3600  # window size in seconds (default: 1 hour)
+    reset_monotonic: float = field(init=False, repr=False, compare=False)
+    # The reset_time reset_monotonic was computed from; reassigning
+    # reset_time makes the deadline stale until it is recomputed
+    _deadline_source: Optional[datetime] = field(default=None, init=False, repr=False,
+                                                 compare=False)
+    
+    def __post_init__(self):
+        """Compute the reset deadline"""
+        self._update_deadline()
+    
+    def _update_deadline(self) -> None:
+        """Convert reset_time to a monotonic clock deadline"""
+        remaining = (self.reset_time - datetime.now()).total_seconds()
+        self.reset_monotonic = time.monotonic() + remaining
+        self._deadline_source = self.reset_time
     
     def is_exceeded(self) -> bool:
         """Check if rate limit is exceeded"""
@@ -372,8 +490,9 @@ class RateLimitInfo:
     
     def time_until_reset(self) -> int:
         """Get seconds until rate limit resets"""
-        delta = self.reset_time - datetime.now()
-        return max(0, int(delta.total_seconds()))
+        if self.reset_time is not self._deadline_source:
+            self._update_deadline()
+        return max(0, int(self.reset_monotonic - time.monotonic()))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert rate limit info to dictionary"""
@@ -384,8 +503,10 @@ class RateLimitInfo:
             'window_size': self.window_size,
             'time_until_reset': self.time_until_reset()
         }
+    
+    __json__ = to_dict  # hook used by json_dumps
 
-@dataclass
+@slotted_dataclass
 class APIMetrics:
     """API usage metrics"""
     endpoint: str
@@ -394,12 +515,32 @@ class APIMetrics:
     successful_requests: int = 0
     failed_requests: int = 0
     average_response_time: float = 0.0
-    min_response_time: float = float('inf')
+    min_response_time: float = 0.0
     max_response_time: float = 0.0
     last_request_time: Optional[datetime] = None
+    # Running total the average is derived from, so repeated updates do not
+    # accumulate rounding drift; seeded from average_response_time
+    sum_response_time: float = field(default=0.0, init=False, repr=False, compare=False)
+    # The average last derived from the sum, to notice assignments to
+    # average_response_time and reseed the sum from them
+    _derived_average: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Responses timed by this instance; total_requests may be seeded by the caller
+    _timed_requests: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Derive the response time sum from the initial average"""
+        self._seed_sum()
+    
+    def _seed_sum(self) -> None:
+        """Set the response time sum from average_response_time"""
+        self.sum_response_time = self.average_response_time * self.total_requests
+        self._derived_average = self.average_response_time
     
     def record_request(self, success: bool, response_time: float) -> None:
         """Record a new API request"""
+        if self.average_response_time != self._derived_average:
+            self._seed_sum()
+        
         self.total_requests += 1
         self.last_request_time = datetime.now()
         
@@ -409,14 +550,22 @@ class APIMetrics:
             self.failed_requests += 1
         
         # Update response time statistics
-        self.min_response_time = min(self.min_response_time, response_time)
-        self.max_response_time = max(self.max_response_time, response_time)
-        
-        # Calculate new average (running average)
-        self.average_response_time = (
-            (self.average_response_time * (self.total_requests - 1) + response_time) 
-            / self.total_requests
+        self.sum_response_time += response_time
+        self.average_response_time = self._derived_average = (
+            self.sum_response_time / self.total_requests
         )
+        if self._timed_requests == 0 and self.min_response_time == 0.0:
+            # 0.0 means no minimum yet; a minimum passed to the constructor is kept
+            self.min_response_time = response_time
+        elif response_time < self.min_response_time:
+            self.min_response_time = response_time
+        if response_time > self.max_response_time:
+            self.max_response_time = response_time
+        self._timed_requests += 1
+    
+    def get_average(self) -> float:
+        """Get the average response time"""
+        return self.average_response_time
     
     def get_success_rate(self) -> float:
         """Get success rate percentage"""
@@ -434,7 +583,9 @@ class APIMetrics:
             'failed_requests': self.failed_requests,
             'success_rate': self.get_success_rate(),
             'average_response_time': self.average_response_time,
-            'min_response_time': self.min_response_time if self.min_response_time != float('inf') else 0,
+            'min_response_time': self.min_response_time,
             'max_response_time': self.max_response_time,
             'last_request_time': self.last_request_time.isoformat() if self.last_request_time else None
         }
+    
+    __json__ = to_dict  # hook used by json_dumps
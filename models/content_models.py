@@ -5,11 +5,16 @@ This module defines data models for educational content, courses,
 sections, and learning objectives.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import field
+from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
 
+from ._compat import coerce_enum, json_dumps, msgspec, parse_datetime, slotted_dataclass
+
 class ContentType(Enum):
     """Enumeration for content types"""
     COURSE = "course"
@@ -33,7 +38,40 @@ class DifficultyLevel(Enum):
     ADVANCED = "advanced"
     EXPERT = "expert"
 
-@dataclass
+# Value -> member tables, so coercion is a single dict lookup
+_CONTENT_TYPE_BY_VALUE = {member.value: member for member in ContentType}
+_CONTENT_FORMAT_BY_VALUE = {member.value: member for member in ContentFormat}
+_DIFFICULTY_BY_VALUE = {member.value: member for member in DifficultyLevel}
+
+# Bloom's taxonomy levels, in order
+_BLOOM_LEVELS = ("remember", "understand", "apply", "analyze", "evaluate", "create")
+_VALID_BLOOM_LEVELS = frozenset(_BLOOM_LEVELS)
+
+# Word counts keyed by the (hash, length) of a text rather than the text
+# itself, so the cache does not keep section bodies alive after their
+# sections are gone. str hashes are randomly keyed SipHash, so distinct
+# texts of the same length do not collide in practice.
+_WORD_COUNT_CACHE_SIZE = 1024
+_word_counts: 'OrderedDict[Tuple[int, int], int]' = OrderedDict()
+_word_counts_lock = threading.Lock()
+
+def _count_words(text: str) -> int:
+    """Count the whitespace-separated words in text, memoizing recent counts"""
+    key = (hash(text), len(text))
+    with _word_counts_lock:
+        count = _word_counts.get(key)
+        if count is not None:
+            _word_counts.move_to_end(key)
+            return count
+    
+    count = len(text.split())
+    with _word_counts_lock:
+        _word_counts[key] = count
+        if len(_word_counts) > _WORD_COUNT_CACHE_SIZE:
+            _word_counts.popitem(last=False)
+    return count
+
+@slotted_dataclass
 class LearningObjective:
     """Represents a learning objective"""
     text: str
@@ -46,9 +84,8 @@ class LearningObjective:
         if not self.text or not isinstance(self.text, str):
             raise ValueError("Learning objective text must be a non-empty string")
         
-        valid_levels = ["remember", "understand", "apply", "analyze", "evaluate", "create"]
-        if self.level not in valid_levels:
-            raise ValueError(f"Learning level must be one of: {', '.join(valid_levels)}")
+        if self.level not in _VALID_BLOOM_LEVELS:
+            raise ValueError(f"Learning level must be one of: {', '.join(_BLOOM_LEVELS)}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert learning objective to dictionary"""
@@ -68,8 +105,20 @@ class LearningObjective:
             measurable=data.get('measurable', True),
             order=data.get('order', 0)
         )
+    
+    @classmethod
+    def from_dict_batch(cls, data: List[Dict[str, Any]]) -> List['LearningObjective']:
+        """Create several LearningObjectives from a list of dictionaries"""
+        if msgspec is not None:
+            # One call validates and builds the whole list in C; a batch it
+            # rejects is rebuilt with from_dict's more lenient handling
+            try:
+                return msgspec.convert(data, List[cls])
+            except msgspec.ValidationError:
+                pass
+        return [cls.from_dict(obj_data) for obj_data in data]
 
-@dataclass
+@slotted_dataclass
 class ContentExample:
     """Represents an example within content"""
     title: str
@@ -99,7 +148,7 @@ class ContentExample:
             language=data.get('language')
         )
 
-@dataclass
+@slotted_dataclass
 class Section:
     """Represents a section of educational content"""
     title: str
@@ -121,18 +170,22 @@ class Section:
         if not self.content or not isinstance(self.content, str):
             raise ValueError("Section content must be a non-empty string")
         
-        if not isinstance(self.format, ContentFormat):
-            if isinstance(self.format, str):
-                try:
-                    self.format = ContentFormat(self.format)
-                except ValueError:
-                    raise ValueError(f"Invalid content format: {self.format}")
+        self.format = coerce_enum(self.format, _CONTENT_FORMAT_BY_VALUE,
+                                  "Invalid content format: {}")
     
     def add_key_point(self, point: str) -> None:
         """Add a key point to the section"""
         if point and point not in self.key_points:
             self.key_points.append(point)
     
+    def add_key_points(self, points: List[str]) -> None:
+        """Add several key points, skipping empty and duplicate ones"""
+        seen = set(self.key_points)
+        for point in points:
+            if point and point not in seen:
+                seen.add(point)
+                self.key_points.append(point)
+    
     def add_example(self, example: Union[ContentExample, Dict[str, Any]]) -> None:
         """Add an example to the section"""
         if isinstance(example, dict):
@@ -142,7 +195,9 @@ class Section:
     
     def get_word_count(self) -> int:
         """Get estimated word count for the section"""
-        return len(self.content.split())
+        # Memoized by hash and length; str caches its own hash, so repeat
+        # lookups do not rescan the text
+        return _count_words(self.content)
     
     def get_reading_time(self) -> int:
         """Get estimated reading time in minutes"""
@@ -158,13 +213,17 @@ class Section:
             'order': self.order,
             'section_type': self.section_type,
             'key_points': self.key_points,
-            'examples': [example.to_dict() for example in self.examples],
+            'examples': list(map(ContentExample.to_dict, self.examples)),
             'estimated_time': self.estimated_time,
             'prerequisites': self.prerequisites,
             'format': self.format.value,
             'metadata': self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """Encode section as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Section':
         """Create Section from dictionary"""
@@ -179,11 +238,11 @@ class Section:
             examples=examples,
             estimated_time=data.get('estimated_time'),
             prerequisites=data.get('prerequisites', []),
-            format=ContentFormat(data.get('format', 'markdown')),
+            format=data.get('format', 'markdown'),
             metadata=data.get('metadata', {})
         )
 
-@dataclass
+@slotted_dataclass
 class Course:
     """Represents a complete educational course"""
     title: str
@@ -201,7 +260,7 @@ class Course:
     version: str = "1.0"
     tags: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None  # defaults to created_at
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -212,19 +271,14 @@ class Course:
         if not self.description or not isinstance(self.description, str):
             raise ValueError("Course description must be a non-empty string")
         
-        if not isinstance(self.content_type, ContentType):
-            if isinstance(self.content_type, str):
-                try:
-                    self.content_type = ContentType(self.content_type)
-                except ValueError:
-                    raise ValueError(f"Invalid content type: {self.content_type}")
+        self.content_type = coerce_enum(self.content_type, _CONTENT_TYPE_BY_VALUE,
+                                        "Invalid content type: {}")
+        self.difficulty = coerce_enum(self.difficulty, _DIFFICULTY_BY_VALUE,
+                                      "Invalid difficulty level: {}")
         
-        if not isinstance(self.difficulty, DifficultyLevel):
-            if isinstance(self.difficulty, str):
-                try:
-                    self.difficulty = DifficultyLevel(self.difficulty)
-                except ValueError:
-                    raise ValueError(f"Invalid difficulty level: {self.difficulty}")
+        if self.updated_at is None:
+            # A new course has not been modified since it was created
+            self.updated_at = self.created_at
     
     def add_learning_objective(self, objective: Union[LearningObjective, str, Dict[str, Any]]) -> None:
         """Add a learning objective to the course"""
@@ -253,9 +307,9 @@ class Course:
         if 0 <= index < len(self.sections):
             self.sections.pop(index)
             
-            # Reorder remaining sections
-            for i, section in enumerate(self.sections):
-                section.order = i + 1
+            # Only the sections after the removed one change position
+            for i in range(index, len(self.sections)):
+                self.sections[i].order = i + 1
             
             self.updated_at = datetime.now()
             return True
@@ -263,11 +317,11 @@ class Course:
     
     def get_total_word_count(self) -> int:
         """Get total word count for all sections"""
-        return sum(section.get_word_count() for section in self.sections)
+        return sum(map(Section.get_word_count, self.sections))
     
     def get_estimated_reading_time(self) -> int:
         """Get estimated reading time in minutes"""
-        return sum(section.get_reading_time() for section in self.sections)
+        return sum(map(Section.get_reading_time, self.sections))
     
     def get_section_count(self) -> int:
         """Get the number of sections"""
@@ -300,8 +354,8 @@ class Course:
             'difficulty': self.difficulty.value,
             'language': self.language,
             'topic': self.topic,
-            'learning_objectives': [obj.to_dict() for obj in self.learning_objectives],
-            'sections': [section.to_dict() for section in self.sections],
+            'learning_objectives': list(map(LearningObjective.to_dict, self.learning_objectives)),
+            'sections': list(map(Section.to_dict, self.sections)),
             'prerequisites': self.prerequisites,
             'target_audience': self.target_audience,
             'estimated_duration': self.estimated_duration,
@@ -313,28 +367,78 @@ class Course:
             'metadata': self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """Encode course as JSON bytes
+        
+        Produces the same document as to_dict, up to how UTC offsets are
+        written (see json_dumps); msgspec and orjson encode the dataclasses
+        directly without the intermediate dictionaries, so prefer this
+        over json.dumps(course.to_dict()).
+        """
+        return json_dumps(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'Course':
+        """Create Course from JSON produced by to_json"""
+        if msgspec is not None:
+            # Decodes straight into the dataclasses, validating field types
+            try:
+                return msgspec.json.decode(data, type=cls)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        return cls.from_dict(json.loads(data))
+    
+    def to_msgpack(self) -> bytes:
+        """Encode course as MessagePack bytes for internal storage
+        
+        More compact and faster to encode and decode than JSON; use
+        to_json for documents sent to clients. Requires msgspec.
+        """
+        if msgspec is None:
+            raise ImportError("msgspec is required for MessagePack encoding")
+        return msgspec.msgpack.encode(self)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'Course':
+        """Create Course from MessagePack produced by to_msgpack"""
+        if msgspec is None:
+            raise ImportError("msgspec is required for MessagePack decoding")
+        try:
+            return msgspec.msgpack.decode(data, type=cls)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Course':
         """Create Course from dictionary"""
-        objectives = [LearningObjective.from_dict(obj_data) 
-                     for obj_data in data.get('learning_objectives', [])]
+        if msgspec is not None:
+            # Builds and type-checks the whole course tree in C. msgspec is
+            # stricter than the code below (it rejects '10' for an int, for
+            # example), so anything it rejects is built field by field instead
+            # and accepted or rejected exactly as without msgspec.
+            try:
+                return msgspec.convert(data, cls)
+            except msgspec.ValidationError:
+                pass
+        
+        objectives = LearningObjective.from_dict_batch(data.get('learning_objectives', []))
         
         sections = [Section.from_dict(sec_data) 
                    for sec_data in data.get('sections', [])]
         
         created_at = data.get('created_at')
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = parse_datetime(created_at)
         
         updated_at = data.get('updated_at')
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
+            updated_at = parse_datetime(updated_at)
         
         return cls(
             title=data['title'],
             description=data['description'],
-            content_type=ContentType(data.get('content_type', 'course')),
-            difficulty=DifficultyLevel(data.get('difficulty', 'intermediate')),
+            content_type=data.get('content_type', 'course'),
+            difficulty=data.get('difficulty', 'intermediate'),
             language=data.get('language', 'english'),
             topic=data.get('topic', ''),
             learning_objectives=objectives,
@@ -346,11 +450,11 @@ class Course:
             version=data.get('version', '1.0'),
             tags=data.get('tags', []),
             created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now(),
+            updated_at=updated_at,
             metadata=data.get('metadata', {})
         )
 
-@dataclass
+@slotted_dataclass
 class ContentTemplate:
     """Template for generating structured content"""
     name: str
@@ -397,13 +501,18 @@ class ContentTemplate:
             'suggested_tags': self.suggested_tags
         }
     
+    def to_json(self) -> bytes:
+        """Encode template as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContentTemplate':
         """Create ContentTemplate from dictionary"""
         return cls(
             name=data['name'],
             description=data['description'],
-            content_type=ContentType(data['content_type']),
+            content_type=coerce_enum(data['content_type'], _CONTENT_TYPE_BY_VALUE,
+                                     "Invalid content type: {}"),
             template_sections=data.get('template_sections', []),
             default_objectives=data.get('default_objectives', []),
             suggested_tags=data.get('suggested_tags', [])
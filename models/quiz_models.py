@@ -5,10 +5,15 @@ This module defines data models for quiz questions, answers,
 quiz structures, and quiz results.
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+
+from ._compat import (coerce_enum, isoformat, json_dumps, parse_datetime,
+                      slotted_dataclass)
 
 class DifficultyLevel(Enum):
     """Enumeration for difficulty levels"""
@@ -25,7 +30,16 @@ class QuestionType(Enum):
     MATCHING = "matching"
     ORDERING = "ordering"
 
-@dataclass
+# Value -> member tables, so coercion is a single dict lookup
+_QUESTION_TYPE_BY_VALUE = {member.value: member for member in QuestionType}
+_DIFFICULTY_BY_VALUE = {member.value: member for member in DifficultyLevel}
+
+# Average score thresholds and the difficulty rating (1-5) for each band;
+# a score above a threshold moves to the next, easier band
+_DIFFICULTY_THRESHOLDS = (40.0, 60.0, 80.0)
+_DIFFICULTY_RATINGS = (5.0, 4.0, 3.0, 2.0)
+
+@slotted_dataclass
 class Answer:
     """Represents a possible answer option"""
     text: str
@@ -59,8 +73,21 @@ class Answer:
             explanation=data.get('explanation'),
             order=data.get('order', 0)
         )
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict[str, Any]) -> 'Answer':
+        """Create Answer from a trusted dictionary, such as to_dict output
+        
+        Skips __init__ and __post_init__ validation.
+        """
+        obj = object.__new__(cls)
+        obj.text = data['text']
+        obj.is_correct = data.get('is_correct', False)
+        obj.explanation = data.get('explanation')
+        obj.order = data.get('order', 0)
+        return obj
 
-@dataclass
+@slotted_dataclass
 class Question:
     """Represents a quiz question"""
     text: str
@@ -78,19 +105,10 @@ class Question:
         if not self.text or not isinstance(self.text, str):
             raise ValueError("Question text must be a non-empty string")
         
-        if not isinstance(self.question_type, QuestionType):
-            if isinstance(self.question_type, str):
-                try:
-                    self.question_type = QuestionType(self.question_type)
-                except ValueError:
-                    raise ValueError(f"Invalid question type: {self.question_type}")
-        
-        if not isinstance(self.difficulty, DifficultyLevel):
-            if isinstance(self.difficulty, str):
-                try:
-                    self.difficulty = DifficultyLevel(self.difficulty)
-                except ValueError:
-                    raise ValueError(f"Invalid difficulty level: {self.difficulty}")
+        self.question_type = coerce_enum(self.question_type, _QUESTION_TYPE_BY_VALUE,
+                                         "Invalid question type: {}")
+        self.difficulty = coerce_enum(self.difficulty, _DIFFICULTY_BY_VALUE,
+                                      "Invalid difficulty level: {}")
         
         if self.points < 0:
             raise ValueError("Points must be non-negative")
@@ -114,6 +132,14 @@ class Question:
         """Get indices of correct answers"""
         return [i for i, answer in enumerate(self.answers) if answer.is_correct]
     
+    def get_correct_answer_set(self) -> frozenset:
+        """Get indices of correct answers as a set, for grading"""
+        return frozenset(i for i, answer in enumerate(self.answers) if answer.is_correct)
+    
+    def _count_correct(self) -> int:
+        """Count correct answers without building a list"""
+        return sum(map(attrgetter('is_correct'), self.answers))
+    
     def is_valid(self) -> bool:
         """Check if question is valid"""
         if not self.answers:
@@ -121,17 +147,15 @@ class Question:
         
         if self.question_type == QuestionType.MULTIPLE_CHOICE:
             # Should have at least 2 options and exactly 1 correct answer
-            correct_count = len(self.get_correct_answers())
-            return len(self.answers) >= 2 and correct_count == 1
+            return len(self.answers) >= 2 and self._count_correct() == 1
         
         elif self.question_type == QuestionType.TRUE_FALSE:
             # Should have exactly 2 options and 1 correct answer
-            correct_count = len(self.get_correct_answers())
-            return len(self.answers) == 2 and correct_count == 1
+            return len(self.answers) == 2 and self._count_correct() == 1
         
         elif self.question_type == QuestionType.FILL_IN_BLANK:
             # Should have at least 1 correct answer
-            return len(self.get_correct_answers()) >= 1
+            return any(map(attrgetter('is_correct'), self.answers))
         
         return True
     
@@ -140,7 +164,7 @@ class Question:
         return {
             'text': self.text,
             'question_type': self.question_type.value,
-            'answers': [answer.to_dict() for answer in self.answers],
+            'answers': list(map(Answer.to_dict, self.answers)),
             'explanation': self.explanation,
             'difficulty': self.difficulty.value,
             'topic': self.topic,
@@ -152,21 +176,42 @@ class Question:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Question':
         """Create Question from dictionary"""
-        answers = [Answer.from_dict(answer_data) for answer_data in data.get('answers', [])]
+        get = data.get
+        answers = list(map(Answer.from_dict, get('answers', ())))
         
         return cls(
             text=data['text'],
-            question_type=QuestionType(data.get('question_type', 'multiple_choice')),
+            question_type=coerce_enum(get('question_type', 'multiple_choice'),
+                                      _QUESTION_TYPE_BY_VALUE, "Invalid question type: {}"),
             answers=answers,
-            explanation=data.get('explanation'),
-            difficulty=DifficultyLevel(data.get('difficulty', 'intermediate')),
-            topic=data.get('topic'),
-            points=data.get('points', 1),
-            time_limit=data.get('time_limit'),
-            metadata=data.get('metadata', {})
+            explanation=get('explanation'),
+            difficulty=coerce_enum(get('difficulty', 'intermediate'),
+                                   _DIFFICULTY_BY_VALUE, "Invalid difficulty level: {}"),
+            topic=get('topic'),
+            points=get('points', 1),
+            time_limit=get('time_limit'),
+            metadata=get('metadata', {})
         )
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict[str, Any]) -> 'Question':
+        """Create Question from a trusted dictionary, such as to_dict output
+        
+        Skips __init__ and __post_init__ validation.
+        """
+        obj = object.__new__(cls)
+        obj.text = data['text']
+        obj.question_type = _QUESTION_TYPE_BY_VALUE[data.get('question_type', 'multiple_choice')]
+        obj.answers = list(map(Answer.from_dict_fast, data.get('answers', ())))
+        obj.explanation = data.get('explanation')
+        obj.difficulty = _DIFFICULTY_BY_VALUE[data.get('difficulty', 'intermediate')]
+        obj.topic = data.get('topic')
+        obj.points = data.get('points', 1)
+        obj.time_limit = data.get('time_limit')
+        obj.metadata = data.get('metadata', {})
+        return obj
 
-@dataclass
+@slotted_dataclass
 class Quiz:
     """Represents a complete quiz"""
     title: str
@@ -182,7 +227,7 @@ class Quiz:
     shuffle_answers: bool = False
     show_results_immediately: bool = True
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None  # defaults to created_at
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -190,12 +235,8 @@ class Quiz:
         if not self.title or not isinstance(self.title, str):
             raise ValueError("Quiz title must be a non-empty string")
         
-        if not isinstance(self.difficulty, DifficultyLevel):
-            if isinstance(self.difficulty, str):
-                try:
-                    self.difficulty = DifficultyLevel(self.difficulty)
-                except ValueError:
-                    raise ValueError(f"Invalid difficulty level: {self.difficulty}")
+        self.difficulty = coerce_enum(self.difficulty, _DIFFICULTY_BY_VALUE,
+                                      "Invalid difficulty level: {}")
         
         if self.passing_score < 0 or self.passing_score > 100:
             raise ValueError("Passing score must be between 0 and 100")
@@ -205,6 +246,10 @@ class Quiz:
         
         if self.max_attempts is not None and self.max_attempts <= 0:
             raise ValueError("Max attempts must be positive")
+        
+        if self.updated_at is None:
+            # A new quiz has not been modified since it was created
+            self.updated_at = self.created_at
     
     def add_question(self, question: Union[Question, Dict[str, Any]]) -> None:
         """Add a question to the quiz"""
@@ -224,7 +269,7 @@ class Quiz:
     
     def get_total_points(self) -> int:
         """Calculate total points for the quiz"""
-        return sum(question.points for question in self.questions)
+        return sum(map(attrgetter('points'), self.questions))
     
     def get_question_count(self) -> int:
         """Get the number of questions"""
@@ -258,7 +303,7 @@ class Quiz:
         return {
             'title': self.title,
             'description': self.description,
-            'questions': [question.to_dict() for question in self.questions],
+            'questions': list(map(Question.to_dict, self.questions)),
             'difficulty': self.difficulty.value,
             'language': self.language,
             'topic': self.topic,
@@ -268,43 +313,87 @@ class Quiz:
             'shuffle_questions': self.shuffle_questions,
             'shuffle_answers': self.shuffle_answers,
             'show_results_immediately': self.show_results_immediately,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': isoformat(self.created_at),
+            'updated_at': isoformat(self.updated_at),
             'metadata': self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """Encode quiz as JSON bytes
+        
+        Produces the same document as to_dict, up to how UTC offsets are
+        written (see json_dumps); msgspec and orjson read the dataclass
+        fields directly without the intermediate dictionaries.
+        """
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Quiz':
         """Create Quiz from dictionary"""
-        questions = [Question.from_dict(q_data) for q_data in data.get('questions', [])]
+        get = data.get
+        questions = list(map(Question.from_dict, get('questions', ())))
         
-        created_at = data.get('created_at')
+        created_at = get('created_at')
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = parse_datetime(created_at)
         
-        updated_at = data.get('updated_at')
+        updated_at = get('updated_at')
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
+            updated_at = parse_datetime(updated_at)
         
         return cls(
             title=data['title'],
-            description=data.get('description'),
+            description=get('description'),
             questions=questions,
-            difficulty=DifficultyLevel(data.get('difficulty', 'intermediate')),
-            language=data.get('language', 'english'),
-            topic=data.get('topic'),
-            time_limit=data.get('time_limit'),
-            passing_score=data.get('passing_score', 70),
-            max_attempts=data.get('max_attempts'),
-            shuffle_questions=data.get('shuffle_questions', False),
-            shuffle_answers=data.get('shuffle_answers', False),
-            show_results_immediately=data.get('show_results_immediately', True),
+            difficulty=coerce_enum(get('difficulty', 'intermediate'),
+                                   _DIFFICULTY_BY_VALUE, "Invalid difficulty level: {}"),
+            language=get('language', 'english'),
+            topic=get('topic'),
+            time_limit=get('time_limit'),
+            passing_score=get('passing_score', 70),
+            max_attempts=get('max_attempts'),
+            shuffle_questions=get('shuffle_questions', False),
+            shuffle_answers=get('shuffle_answers', False),
+            show_results_immediately=get('show_results_immediately', True),
             created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now(),
-            metadata=data.get('metadata', {})
+            updated_at=updated_at,
+            metadata=get('metadata', {})
         )
+    
+    @classmethod
+    def from_dict_fast(cls, data: Dict[str, Any]) -> 'Quiz':
+        """Create Quiz from a trusted dictionary, such as to_dict output
+        
+        Skips __init__ and __post_init__ validation for the quiz and its
+        questions and answers. Use from_dict for untrusted input.
+        """
+        created_at = data.get('created_at')
+        if isinstance(created_at, str):
+            created_at = parse_datetime(created_at)
+        
+        updated_at = data.get('updated_at')
+        if isinstance(updated_at, str):
+            updated_at = parse_datetime(updated_at)
+        
+        obj = object.__new__(cls)
+        obj.title = data['title']
+        obj.description = data.get('description')
+        obj.questions = list(map(Question.from_dict_fast, data.get('questions', ())))
+        obj.difficulty = _DIFFICULTY_BY_VALUE[data.get('difficulty', 'intermediate')]
+        obj.language = data.get('language', 'english')
+        obj.topic = data.get('topic')
+        obj.time_limit = data.get('time_limit')
+        obj.passing_score = data.get('passing_score', 70)
+        obj.max_attempts = data.get('max_attempts')
+        obj.shuffle_questions = data.get('shuffle_questions', False)
+        obj.shuffle_answers = data.get('shuffle_answers', False)
+        obj.show_results_immediately = data.get('show_results_immediately', True)
+        obj.created_at = created_at or datetime.now()
+        obj.updated_at = updated_at or obj.created_at
+        obj.metadata = data.get('metadata', {})
+        return obj
 
-@dataclass
+@slotted_dataclass
 class QuizAttempt:
     """Represents a user's attempt at a quiz"""
     user_id: str
@@ -326,23 +415,25 @@ class QuizAttempt:
         self.end_time = datetime.now()
         self.time_taken = int((self.end_time - self.start_time).total_seconds())
         
-        total_points = 0
+        total_points = quiz.get_total_points()
         earned_points = 0
         
-        for i, question in enumerate(quiz.questions):
-            total_points += question.points
+        # Only answered questions can earn points
+        questions = quiz.questions
+        question_count = len(questions)
+        for index, user_answer in self.answers.items():
+            if not isinstance(index, int) or not 0 <= index < question_count:
+                continue
+            
+            question = questions[index]
             
-            if i in self.answers:
-                user_answer = self.answers[i]
-                correct_indices = question.get_correct_answer_indices()
-                
-                # Check if answer is correct
-                if isinstance(user_answer, int):
-                    if user_answer in correct_indices:
-                        earned_points += question.points
-                elif isinstance(user_answer, list):
-                    if set(user_answer) == set(correct_indices):
-                        earned_points += question.points
+            # Check if answer is correct
+            if isinstance(user_answer, int):
+                if user_answer in question.get_correct_answer_set():
+                    earned_points += question.points
+            elif isinstance(user_answer, list):
+                if set(user_answer) == question.get_correct_answer_set():
+                    earned_points += question.points
         
         self.score = (earned_points / total_points * 100) if total_points > 0 else 0
         self.passed = self.score >= quiz.passing_score
@@ -361,7 +452,7 @@ class QuizAttempt:
             'metadata': self.metadata
         }
 
-@dataclass
+@slotted_dataclass
 class QuizResult:
     """Aggregated results for a quiz"""
     quiz_id: str
@@ -392,15 +483,9 @@ class QuizResult:
             self.average_time = sum(times) / len(times) if times else 0
             self.pass_rate = (sum(passes) / len(passes) * 100) if passes else 0
             
-            # Calculate difficulty rating based on average score and time
-            if self.average_score > 80:
-                self.difficulty_rating = 2.0
-            elif self.average_score > 60:
-                self.difficulty_rating = 3.0
-            elif self.average_score > 40:
-                self.difficulty_rating = 4.0
-            else:
-                self.difficulty_rating = 5.0
+            # Calculate difficulty rating based on average score
+            band = bisect_left(_DIFFICULTY_THRESHOLDS, self.average_score)
+            self.difficulty_rating = _DIFFICULTY_RATINGS[band]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert results to dictionary"""
@@ -0,0 +1,64 @@
+"""
+msgspec schemas for the data models
+
+This module defines msgspec Structs that decode JSON straight into typed
+objects: the quiz content returned by the generation model and lazily
+decoded course outlines. Unlike the other model modules it requires
+msgspec, so it is imported only where msgspec is known to be installed.
+"""
+
+from typing import Dict, List, Union
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        "models.schemas requires msgspec; install it or the 'prod' extras"
+    ) from e
+
+from .content_models import ContentType, DifficultyLevel, Section
+
+class GeneratedQuestion(msgspec.Struct):
+    """A question as returned by the content generation model"""
+    domanda: str
+    risposte: Dict[str, str]
+    risposta_corretta: str
+
+class QuizResponse(msgspec.Struct):
+    """Schema of the quiz content returned by the content generation model"""
+    topic: str
+    sintesi: str
+    questionario: List[GeneratedQuestion]
+
+class CourseOutline(msgspec.Struct):
+    """Course fields decoded on demand from Course.to_json output
+    
+    Only the scalar fields are decoded up front; each section stays
+    undecoded JSON until get_section is called for it.
+    """
+    title: str
+    description: str
+    content_type: ContentType = ContentType.COURSE
+    difficulty: DifficultyLevel = DifficultyLevel.INTERMEDIATE
+    language: str = "english"
+    topic: str = ""
+    sections: List[msgspec.Raw] = []
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'CourseOutline':
+        """Decode the outline of a JSON encoded course"""
+        try:
+            return msgspec.json.decode(data, type=cls)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    
+    def get_section_count(self) -> int:
+        """Get the number of sections"""
+        return len(self.sections)
+    
+    def get_section(self, index: int) -> Section:
+        """Decode a single section"""
+        try:
+            return msgspec.json.decode(self.sections[index], type=Section)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from e
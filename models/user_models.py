@@ -5,11 +5,14 @@ This module defines data models for users, user profiles,
 and learning progress tracking.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import field, fields
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
 
+from ._compat import (coerce_enum, isoformat, json_dumps, msgspec, parse_datetime,
+                      slotted_dataclass)
+
 class UserRole(Enum):
     """Enumeration for user roles"""
     STUDENT = "student"
@@ -25,7 +28,35 @@ class SkillLevel(Enum):
     ADVANCED = "advanced"
     EXPERT = "expert"
 
-@dataclass
+_USER_ROLE_BY_VALUE = {member.value: member for member in UserRole}
+_SKILL_LEVEL_BY_VALUE = {member.value: member for member in SkillLevel}
+# Skill levels in ascending order of proficiency, as declared
+_SKILL_LEVEL_RANK = {member: rank for rank, member in enumerate(SkillLevel)}
+
+# Simple role-based permissions; each role inherits those of the roles below it
+_STUDENT_PERMISSIONS = frozenset(["take_quizzes", "view_content", "track_progress"])
+_INSTRUCTOR_PERMISSIONS = _STUDENT_PERMISSIONS | {"create_content", "manage_quizzes", "view_student_progress"}
+_ADMIN_PERMISSIONS = _INSTRUCTOR_PERMISSIONS | {"manage_users", "manage_content", "view_analytics"}
+
+_PERMISSIONS_BY_ROLE = {
+    UserRole.ADMIN: _ADMIN_PERMISSIONS,
+    UserRole.INSTRUCTOR: _INSTRUCTOR_PERMISSIONS,
+    UserRole.STUDENT: _STUDENT_PERMISSIONS,
+}
+
+_PRIORITY_NAMES = ("low", "medium", "high")
+_VALID_PRIORITIES = frozenset(_PRIORITY_NAMES)
+_VALID_PRIORITIES_STR = ", ".join(_PRIORITY_NAMES)
+
+_STATUS_NAMES = ("not_started", "in_progress", "completed")
+_VALID_STATUSES = frozenset(_STATUS_NAMES)
+_VALID_STATUSES_STR = ", ".join(_STATUS_NAMES)
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601, passing None through"""
+    return isoformat(value) if value is not None else None
+
+@slotted_dataclass
 class UserPreferences:
     """User preferences for learning experience"""
     language: str = "english"
@@ -48,20 +79,21 @@ class UserPreferences:
             'font_size': self.font_size
         }
     
+    def to_json(self) -> bytes:
+        """Encode preferences as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserPreferences':
         """Create UserPreferences from dictionary"""
-        return cls(
-            language=data.get('language', 'english'),
-            difficulty_preference=data.get('difficulty_preference', 'intermediate'),
-            content_format=data.get('content_format', 'mixed'),
-            learning_pace=data.get('learning_pace', 'normal'),
-            notification_enabled=data.get('notification_enabled', True),
-            theme=data.get('theme', 'light'),
-            font_size=data.get('font_size', 'medium')
-        )
+        # Every field has a default, so missing keys are left to the dataclass
+        if _PREFERENCE_FIELDS.issuperset(data):
+            return cls(**data)
+        return cls(**{key: value for key, value in data.items() if key in _PREFERENCE_FIELDS})
+
+_PREFERENCE_FIELDS = frozenset(f.name for f in fields(UserPreferences))
 
-@dataclass
+@slotted_dataclass
 class LearningGoal:
     """Represents a user's learning goal"""
     title: str
@@ -81,9 +113,8 @@ class LearningGoal:
         if self.progress < 0 or self.progress > 100:
             raise ValueError("Progress must be between 0 and 100")
         
-        valid_priorities = ["low", "medium", "high"]
-        if self.priority not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
+        if self.priority not in _VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {_VALID_PRIORITIES_STR}")
     
     def update_progress(self, progress: float) -> None:
         """Update goal progress"""
@@ -96,24 +127,28 @@ class LearningGoal:
         return {
             'title': self.title,
             'description': self.description,
-            'target_completion_date': self.target_completion_date.isoformat() if self.target_completion_date else None,
+            'target_completion_date': _iso(self.target_completion_date),
             'priority': self.priority,
             'category': self.category,
             'progress': self.progress,
             'is_completed': self.is_completed,
-            'created_at': self.created_at.isoformat()
+            'created_at': isoformat(self.created_at)
         }
     
+    def to_json(self) -> bytes:
+        """Encode goal as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LearningGoal':
         """Create LearningGoal from dictionary"""
         target_date = data.get('target_completion_date')
         if isinstance(target_date, str):
-            target_date = datetime.fromisoformat(target_date)
+            target_date = parse_datetime(target_date)
         
         created_at = data.get('created_at')
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = parse_datetime(created_at)
         
         return cls(
             title=data['title'],
@@ -126,7 +161,7 @@ class LearningGoal:
             created_at=created_at or datetime.now()
         )
 
-@dataclass
+@slotted_dataclass
 class UserProfile:
     """Extended user profile information"""
     bio: Optional[str] = None
@@ -141,10 +176,8 @@ class UserProfile:
     
     def add_skill(self, skill_name: str, level: Union[SkillLevel, str]) -> None:
         """Add or update a skill"""
-        if isinstance(level, str):
-            level = SkillLevel(level)
-        
-        self.skills[skill_name] = level
+        self.skills[skill_name] = coerce_enum(level, _SKILL_LEVEL_BY_VALUE,
+                                              "Invalid skill level: {}")
     
     def add_learning_goal(self, goal: Union[LearningGoal, Dict[str, Any]]) -> None:
         """Add a learning goal"""
@@ -153,6 +186,12 @@ class UserProfile:
         
         self.learning_goals.append(goal)
     
+    def get_skills_at_or_above(self, level: Union[SkillLevel, str]) -> List[str]:
+        """Get the names of skills held at the given level or higher"""
+        rank = _SKILL_LEVEL_RANK
+        minimum = rank[coerce_enum(level, _SKILL_LEVEL_BY_VALUE, "Invalid skill level: {}")]
+        return [skill for skill, skill_level in self.skills.items() if rank[skill_level] >= minimum]
+    
     def get_completed_goals(self) -> List[LearningGoal]:
         """Get completed learning goals"""
         return [goal for goal in self.learning_goals if goal.is_completed]
@@ -175,12 +214,21 @@ class UserProfile:
             'timezone': self.timezone
         }
     
+    def to_json(self) -> bytes:
+        """Encode profile as JSON bytes
+        
+        Produces the same document as to_dict, up to how UTC offsets are
+        written (see json_dumps); msgspec and orjson encode the dataclasses,
+        enums and datetimes directly without the intermediate dictionaries.
+        """
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserProfile':
         """Create UserProfile from dictionary"""
         skills = {}
         for skill, level in data.get('skills', {}).items():
-            skills[skill] = SkillLevel(level)
+            skills[skill] = coerce_enum(level, _SKILL_LEVEL_BY_VALUE, "Invalid skill level: {}")
         
         goals = [LearningGoal.from_dict(goal_data) 
                 for goal_data in data.get('learning_goals', [])]
@@ -199,7 +247,9 @@ class UserProfile:
             timezone=data.get('timezone', 'UTC')
         )
 
-@dataclass
+_PROFILE_FIELDS = frozenset(f.name for f in fields(UserProfile))
+
+@slotted_dataclass
 class User:
     """Represents a user of the learning system"""
     user_id: str
@@ -211,7 +261,7 @@ class User:
     email_verified: bool = False
     last_login: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None  # defaults to created_at
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -225,23 +275,21 @@ class User:
         if not self.email or not isinstance(self.email, str):
             raise ValueError("Email must be a non-empty string")
         
-        if not isinstance(self.role, UserRole):
-            if isinstance(self.role, str):
-                try:
-                    self.role = UserRole(self.role)
-                except ValueError:
-                    raise ValueError(f"Invalid user role: {self.role}")
+        self.role = coerce_enum(self.role, _USER_ROLE_BY_VALUE, "Invalid user role: {}")
+        
+        if self.updated_at is None:
+            # A new user has not been modified since it was created
+            self.updated_at = self.created_at
     
     def update_last_login(self) -> None:
         """Update last login timestamp"""
-        self.last_login = datetime.now()
-        self.updated_at = datetime.now()
+        self.last_login = self.updated_at = datetime.now()
     
     def update_profile(self, profile_data: Dict[str, Any]) -> None:
         """Update user profile"""
-        # Update profile fields
+        # Update profile fields; other keys, including method names, are ignored
         for key, value in profile_data.items():
-            if hasattr(self.profile, key):
+            if key in _PROFILE_FIELDS:
                 setattr(self.profile, key, value)
         
         self.updated_at = datetime.now()
@@ -254,11 +302,13 @@ class User:
     
     def remove_interest(self, interest: str) -> bool:
         """Remove an interest from user profile"""
-        if interest in self.profile.interests:
+        # list.remove already searches; a separate membership test scans twice
+        try:
             self.profile.interests.remove(interest)
-            self.updated_at = datetime.now()
-            return True
-        return False
+        except ValueError:
+            return False
+        self.updated_at = datetime.now()
+        return True
     
     def get_skill_level(self, skill: str) -> Optional[SkillLevel]:
         """Get user's skill level for a specific skill"""
@@ -266,19 +316,7 @@ class User:
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission"""
-        # Simple role-based permissions
-        admin_permissions = ["manage_users", "manage_content", "view_analytics"]
-        instructor_permissions = ["create_content", "manage_quizzes", "view_student_progress"]
-        student_permissions = ["take_quizzes", "view_content", "track_progress"]
-        
-        if self.role == UserRole.ADMIN:
-            return permission in admin_permissions + instructor_permissions + student_permissions
-        elif self.role == UserRole.INSTRUCTOR:
-            return permission in instructor_permissions + student_permissions
-        elif self.role == UserRole.STUDENT:
-            return permission in student_permissions
-        
-        return False
+        return permission in _PERMISSIONS_BY_ROLE.get(self.role, ())
     
     def to_dict(self, include_sensitive: bool = False) -> Dict[str, Any]:
         """Convert user to dictionary"""
@@ -289,9 +327,9 @@ class User:
             'profile': self.profile.to_dict(),
             'is_active': self.is_active,
             'email_verified': self.email_verified,
-            'last_login': self.last_login.isoformat() if self.last_login else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'last_login': _iso(self.last_login),
+            'created_at': isoformat(self.created_at),
+            'updated_at': isoformat(self.updated_at),
             'metadata': self.metadata
         }
         
@@ -300,6 +338,33 @@ class User:
         
         return data
     
+    def to_json(self, include_sensitive: bool = False) -> bytes:
+        """Encode user as JSON bytes
+        
+        Produces the same document as to_dict, up to how UTC offsets are
+        written (see json_dumps). The profile and timestamps are passed
+        through as objects for the encoder to format, rather than converted
+        in Python first; the user itself is not encoded field by field,
+        since that would include the email.
+        """
+        data = {
+            'user_id': self.user_id,
+            'username': self.username,
+            'role': self.role,
+            'profile': self.profile,
+            'is_active': self.is_active,
+            'email_verified': self.email_verified,
+            'last_login': self.last_login,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'metadata': self.metadata
+        }
+        
+        if include_sensitive:
+            data['email'] = self.email
+        
+        return json_dumps(data)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'User':
         """Create User from dictionary"""
@@ -307,31 +372,32 @@ class User:
         
         last_login = data.get('last_login')
         if isinstance(last_login, str):
-            last_login = datetime.fromisoformat(last_login)
+            last_login = parse_datetime(last_login)
         
         created_at = data.get('created_at')
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = parse_datetime(created_at)
         
         updated_at = data.get('updated_at')
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
+            updated_at = parse_datetime(updated_at)
         
         return cls(
             user_id=data['user_id'],
             username=data['username'],
             email=data['email'],
-            role=UserRole(data.get('role', 'student')),
+            role=coerce_enum(data.get('role', 'student'), _USER_ROLE_BY_VALUE,
+                             "Invalid user role: {}"),
             profile=profile,
             is_active=data.get('is_active', True),
             email_verified=data.get('email_verified', False),
             last_login=last_login,
             created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now(),
+            updated_at=updated_at,
             metadata=data.get('metadata', {})
         )
 
-@dataclass
+@slotted_dataclass
 class ActivityLog:
     """Log of user activities"""
     user_id: str
@@ -346,16 +412,20 @@ class ActivityLog:
             'user_id': self.user_id,
             'activity_type': self.activity_type,
             'description': self.description,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': isoformat(self.timestamp),
             'metadata': self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """Encode activity log as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ActivityLog':
         """Create ActivityLog from dictionary"""
         timestamp = data.get('timestamp')
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = parse_datetime(timestamp)
         
         return cls(
             user_id=data['user_id'],
@@ -364,8 +434,22 @@ class ActivityLog:
             timestamp=timestamp or datetime.now(),
             metadata=data.get('metadata', {})
         )
+    
+    @classmethod
+    def from_dict_batch(cls, data: List[Dict[str, Any]]) -> List['ActivityLog']:
+        """Create several ActivityLogs from a list of dictionaries"""
+        if msgspec is not None:
+            # One call validates and builds the whole list in C, parsing
+            # the timestamp strings along the way. msgspec is stricter than
+            # from_dict (it rejects null timestamps, for example), so any
+            # batch it rejects is rebuilt below with from_dict's handling.
+            try:
+                return msgspec.convert(data, List[cls])
+            except msgspec.ValidationError:
+                pass
+        return [cls.from_dict(log_data) for log_data in data]
 
-@dataclass
+@slotted_dataclass
 class LearningProgress:
     """Tracks user's learning progress"""
     user_id: str
@@ -386,9 +470,8 @@ class LearningProgress:
         if self.progress_percentage < 0 or self.progress_percentage > 100:
             raise ValueError("Progress percentage must be between 0 and 100")
         
-        valid_statuses = ["not_started", "in_progress", "completed"]
-        if self.status not in valid_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if self.status not in _VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {_VALID_STATUSES_STR}")
     
     def start_learning(self) -> None:
         """Mark learning as started"""
@@ -409,8 +492,7 @@ class LearningProgress:
         """Mark learning as completed"""
         self.status = "completed"
         self.progress_percentage = 100.0
-        self.completed_at = datetime.now()
-        self.last_accessed = datetime.now()
+        self.completed_at = self.last_accessed = datetime.now()
         
         if score is not None:
             if self.best_score is None or score > self.best_score:
@@ -446,22 +528,26 @@ class LearningProgress:
             'time_spent': self.time_spent,
             'attempts': self.attempts,
             'best_score': self.best_score,
-            'last_accessed': self.last_accessed.isoformat() if self.last_accessed else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'last_accessed': _iso(self.last_accessed),
+            'completed_at': _iso(self.completed_at),
             'notes': self.notes,
             'metadata': self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """Encode progress as JSON bytes, in the same shape as to_dict"""
+        return json_dumps(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LearningProgress':
         """Create LearningProgress from dictionary"""
         last_accessed = data.get('last_accessed')
         if isinstance(last_accessed, str):
-            last_accessed = datetime.fromisoformat(last_accessed)
+            last_accessed = parse_datetime(last_accessed)
         
         completed_at = data.get('completed_at')
         if isinstance(completed_at, str):
-            completed_at = datetime.fromisoformat(completed_at)
+            completed_at = parse_datetime(completed_at)
         
         return cls(
             user_id=data['user_id'],
@@ -477,3 +563,17 @@ class LearningProgress:
             notes=data.get('notes'),
             metadata=data.get('metadata', {})
         )
+    
+    @classmethod
+    def from_dict_batch(cls, data: List[Dict[str, Any]]) -> List['LearningProgress']:
+        """Create several LearningProgress records from a list of dictionaries"""
+        if msgspec is not None:
+            # One call validates and builds the whole list in C, parsing
+            # the timestamp strings along the way. msgspec is stricter than
+            # from_dict (it rejects null timestamps, for example), so any
+            # batch it rejects is rebuilt below with from_dict's handling.
+            try:
+                return msgspec.convert(data, List[cls])
+            except msgspec.ValidationError:
+                pass
+        return [cls.from_dict(progress_data) for progress_data in data]
@@ -14,7 +14,6 @@ import sys
 import json
 import logging
 from typing import Dict, Any, Optional, List
-from flask_cors import CORS
 import openai
 import os
 from flask import Flask, request, Response, jsonify
@@ -44,7 +43,18 @@ if not openai.api_key:
 
 # Flask app configuration
 app = Flask(__name__)
-CORS(app, resources={r"/*": {"origins": "http://127.0.0.1:5500"}})
+CORS_ORIGIN = "http://127.0.0.1:5500"
+
+@app.after_request
+def add_cors_headers(response: Response) -> Response:
+    """Allow cross-origin requests from the frontend"""
+    response.headers['Access-Control-Allow-Origin'] = CORS_ORIGIN
+    if request.method == 'OPTIONS':
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+        requested_headers = request.headers.get('Access-Control-Request-Headers')
+        if requested_headers:
+            response.headers['Access-Control-Allow-Headers'] = requested_headers
+    return response
 
 # Rate limiting and caching
 REQUEST_CACHE = {}
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Parallel Batch Generator
+
+Generates course content and quizzes for many topics at once by keeping
+several OpenAI requests in flight while staying under the account's
+request and token rate limits. Results are written to stdout as JSON
+lines, in completion order, so they can be streamed into other tools.
+
+Usage:
+    python batch_generate.py topics.txt --language italian --questions 5
+    python batch_generate.py requests.jsonl --max-concurrency 20 > results.jsonl
+
+Each input line is either a plain topic or a JSON object with the same
+fields accepted by the middleware_chatgpt endpoint.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import QuizGenerator, _transient_openai_errors
+from config import get_config
+
+try:
+    import orjson
+except ImportError:  # optional speedup for the output stream
+    orjson = None
+
+class TokenBucket:
+    """Continuously refilling budget of requests or tokens per minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.available = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until amount can be taken from the bucket, then take it"""
+        amount = min(amount, self.capacity)
+        self._refill()
+        while self.available < amount:
+            await asyncio.sleep((amount - self.available) / self.rate)
+            self._refill()
+        self.available -= amount
+
+class ParallelBatchGenerator:
+    """Runs completion requests concurrently within rate limits"""
+
+    def __init__(self, client: Any, max_concurrency: int, requests_per_minute: float,
+                 tokens_per_minute: float):
+        self.client = client
+        self.config = get_config()
+        self.quiz_generator = QuizGenerator(self.config)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+    def _estimate_tokens(self, prompt: str) -> int:
+        """Rough upper bound of the tokens a request consumes"""
+        return len(prompt) // 4 + self.quiz_generator.max_tokens
+
+    async def _complete(self, prompt: str) -> str:
+        """Send one completion, retrying transient errors with backoff"""
+        transient_errors = _transient_openai_errors()
+        max_attempts = self.config.OPENAI_MAX_RETRIES
+        delay = self.config.OPENAI_RETRY_BACKOFF
+
+        for attempt in range(1, max_attempts + 1):
+            await self.request_bucket.acquire()
+            await self.token_bucket.acquire(self._estimate_tokens(prompt))
+            try:
+                async with self.semaphore:
+                    response = await self.client.completions.create(
+                        model=self.quiz_generator.model,
+                        prompt=prompt,
+                        max_tokens=self.quiz_generator.max_tokens,
+                        temperature=self.quiz_generator.temperature
+                    )
+                return response.choices[0].text.strip()
+            except transient_errors:
+                if attempt == max_attempts:
+                    raise
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _generate_one(self, index: int, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate content for one parameter set and emit it as a JSON line"""
+        try:
+            self.quiz_generator._validate_parameters(params)
+            prompt = self.quiz_generator._build_prompt(
+                params.get('topic', ''),
+                params.get('random_topic', 'false'),
+                params.get('num_of_questions', '1'),
+                params.get('num_of_replies', '2'),
+                params.get('language', 'english')
+            )
+            content = await self._complete(prompt)
+            record = {
+                'index': index,
+                'params': params,
+                'result': self.quiz_generator._parse_response(content, QuizGenerator._DEFAULT_IMAGE)
+            }
+        except Exception as e:
+            record = {'index': index, 'params': params, 'error': str(e)}
+
+        write_line(record)
+        return record
+
+    async def run(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate content for every parameter set"""
+        tasks = [self._generate_one(i, params) for i, params in enumerate(params_list)]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+def write_line(record: Dict[str, Any]) -> None:
+    """Write a record to stdout as one JSON line"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(record) + b"\n")
+    else:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+def load_requests(path: str, defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Load parameter sets from a file of topics or JSON objects"""
+    params_list = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                params_list.append({**defaults, **json.loads(line)})
+            else:
+                params_list.append({**defaults, 'topic': line})
+    return params_list
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    config = get_config()
+    parser = argparse.ArgumentParser(
+        description="Generate content for many topics in parallel"
+    )
+    parser.add_argument('input', help='File with one topic or JSON request per line')
+    parser.add_argument('--questions', '-q', default='5', help='Questions per quiz')
+    parser.add_argument('--replies', '-r', default='4', help='Answers per question')
+    parser.add_argument('--language', '-l', default='english', help='Content language')
+    parser.add_argument('--max-concurrency', type=int, default=config.OPENAI_MAX_WORKERS,
+                        help='Maximum requests in flight')
+    parser.add_argument('--requests-per-minute', type=float, default=60,
+                        help='Request rate limit')
+    parser.add_argument('--tokens-per-minute', type=float, default=90000,
+                        help='Token rate limit')
+    return parser.parse_args(argv)
+
+def main():
+    """Entry point for the CLI script"""
+    args = parse_arguments()
+    config = get_config()
+    if not config.OPENAI_API_KEY:
+        print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
+        sys.exit(1)
+
+    import openai
+
+    params_list = load_requests(args.input, {
+        'num_of_questions': args.questions,
+        'num_of_replies': args.replies,
+        'language': args.language,
+    })
+
+    async def run() -> List[Dict[str, Any]]:
+        # Retries are handled by ParallelBatchGenerator._complete
+        async with openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY, max_retries=0) as client:
+            generator = ParallelBatchGenerator(
+                client,
+                max_concurrency=args.max_concurrency,
+                requests_per_minute=args.requests_per_minute,
+                tokens_per_minute=args.tokens_per_minute
+            )
+            return await generator.run(params_list)
+
+    start = time.monotonic()
+    records = asyncio.run(run())
+    failed = sum(1 for record in records if not isinstance(record, dict) or 'error' in record)
+    print(f"Processed {len(records)} requests in {time.monotonic() - start:.1f}s "
+          f"({failed} failed)", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+OpenAI Batch API Submitter
+
+Generates content for many topics through the OpenAI Batch API instead of
+synchronous completion calls. Batches complete within 24 hours at a lower
+per-token price and do not count against the interactive rate limits,
+which suits curriculum preloads that nobody is waiting on.
+
+Usage:
+    python submit_batch.py topics.txt --language italian > results.jsonl
+    python submit_batch.py topics.txt --no-wait
+    python submit_batch.py topics.txt --resume batch_abc123 > results.jsonl
+
+Results are written to stdout as JSON lines in the same format as
+batch_generate.py. Resuming requires the same input file and options,
+since results are matched back to their requests by position.
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import QuizGenerator
+from config import get_config
+from scripts.batch_generate import load_requests, write_line
+
+BATCH_ENDPOINT = '/v1/completions'
+FINAL_STATUSES = frozenset(['completed', 'failed', 'expired', 'cancelled'])
+
+def build_batch_file(params_list: List[Dict[str, Any]],
+                     generator: QuizGenerator) -> Tuple[bytes, Dict[int, str]]:
+    """Build the JSONL request file, one completion request per valid parameter set
+
+    Returns the file and the validation error of each parameter set left out
+    of it, keyed by index, so one bad line does not hold back the rest.
+    """
+    lines = []
+    invalid = {}
+    for index, params in enumerate(params_list):
+        try:
+            generator._validate_parameters(params)
+            prompt = generator._build_prompt(
+                params.get('topic', ''),
+                params.get('random_topic', 'false'),
+                params.get('num_of_questions', '1'),
+                params.get('num_of_replies', '2'),
+                params.get('language', 'english')
+            )
+        except ValueError as e:
+            invalid[index] = str(e)
+            continue
+        lines.append(json.dumps({
+            'custom_id': str(index),
+            'method': 'POST',
+            'url': BATCH_ENDPOINT,
+            'body': {
+                'model': generator.model,
+                'prompt': prompt,
+                'max_tokens': generator.max_tokens,
+                'temperature': generator.temperature,
+            }
+        }))
+    return ("\n".join(lines) + "\n").encode('utf-8'), invalid
+
+def write_invalid(params_list: List[Dict[str, Any]], invalid: Dict[int, str]) -> None:
+    """Emit an error record for each parameter set left out of the batch"""
+    for index in sorted(invalid):
+        write_line({'index': index, 'params': params_list[index], 'error': invalid[index]})
+
+def submit_batch(client: Any, batch_file: bytes) -> Any:
+    """Upload the request file and start a batch job"""
+    input_file = client.files.create(file=('requests.jsonl', batch_file), purpose='batch')
+    return client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window='24h'
+    )
+
+def wait_for_batch(client: Any, batch_id: str, poll_interval: float,
+                   max_poll_interval: float) -> Any:
+    """Poll a batch with exponential backoff until it reaches a final status"""
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in FINAL_STATUSES:
+            return batch
+        print(f"Batch {batch_id} is {batch.status}, checking again in {poll_interval:.0f}s",
+              file=sys.stderr)
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_poll_interval)
+
+def collect_results(client: Any, batch: Any, params_list: List[Dict[str, Any]],
+                    generator: QuizGenerator, invalid: Optional[Dict[int, str]] = None) -> int:
+    """Download batch output and emit one record per request; return failures
+
+    Parameter sets in invalid were never submitted and are emitted with
+    their validation error.
+    """
+    invalid = invalid or {}
+    write_invalid(params_list, invalid)
+
+    pending = set(range(len(params_list))) - set(invalid)
+    failed = len(invalid)
+    output = client.files.content(batch.output_file_id).text if batch.output_file_id else ''
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        index = int(item['custom_id'])
+        response = item.get('response') or {}
+        record = {'index': index, 'params': params_list[index]}
+        if item.get('error') or response.get('status_code') != 200:
+            record['error'] = str(item.get('error') or response.get('body'))
+            failed += 1
+        else:
+            content = response['body']['choices'][0]['text'].strip()
+            record['result'] = generator._parse_response(content, QuizGenerator._DEFAULT_IMAGE)
+        pending.discard(index)
+        write_line(record)
+
+    # Requests missing from the output failed (see the batch's error file)
+    for index in sorted(pending):
+        write_line({'index': index, 'params': params_list[index],
+                    'error': f"No result in batch (status: {batch.status})"})
+    return failed + len(pending)
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Generate content for many topics with the OpenAI Batch API"
+    )
+    parser.add_argument('input', help='File with one topic or JSON request per line')
+    parser.add_argument('--questions', '-q', default='5', help='Questions per quiz')
+    parser.add_argument('--replies', '-r', default='4', help='Answers per question')
+    parser.add_argument('--language', '-l', default='english', help='Content language')
+    parser.add_argument('--resume', metavar='BATCH_ID', help='Collect an already submitted batch')
+    parser.add_argument('--no-wait', action='store_true', help='Submit and exit without waiting')
+    parser.add_argument('--poll-interval', type=float, default=30,
+                        help='Initial seconds between status checks')
+    parser.add_argument('--max-poll-interval', type=float, default=600,
+                        help='Maximum seconds between status checks')
+    return parser.parse_args(argv)
+
+def main():
+    """Entry point for the CLI script"""
+    args = parse_arguments()
+    config = get_config()
+    if not config.OPENAI_API_KEY:
+        print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
+        sys.exit(1)
+
+    import openai
+
+    client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+    if not hasattr(client, 'batches'):
+        print("Error: the Batch API requires openai>=1.17", file=sys.stderr)
+        sys.exit(1)
+
+    generator = QuizGenerator(config)
+    params_list = load_requests(args.input, {
+        'num_of_questions': args.questions,
+        'num_of_replies': args.replies,
+        'language': args.language,
+    })
+
+    # Rebuilt when resuming too, to report the entries that were left out
+    batch_file, invalid = build_batch_file(params_list, generator)
+    if invalid:
+        print(f"Skipping {len(invalid)} invalid requests", file=sys.stderr)
+
+    if args.resume:
+        batch_id = args.resume
+    elif len(invalid) == len(params_list):
+        write_invalid(params_list, invalid)
+        print("Error: no valid requests to submit", file=sys.stderr)
+        sys.exit(1)
+    else:
+        batch = submit_batch(client, batch_file)
+        batch_id = batch.id
+        print(f"Submitted batch {batch_id} with {len(params_list) - len(invalid)} requests",
+              file=sys.stderr)
+        if args.no_wait:
+            print(f"Resume with: --resume {batch_id}", file=sys.stderr)
+            return
+
+    batch = wait_for_batch(client, batch_id, args.poll_interval, args.max_poll_interval)
+    failed = collect_results(client, batch, params_list, generator, invalid)
+    print(f"Batch {batch_id} {batch.status}: {len(params_list) - failed} succeeded, "
+          f"{failed} failed", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
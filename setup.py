@@ -76,6 +76,9 @@ dev_requirements = [
 # Production dependencies
 prod_requirements = [
     'gunicorn>=21.0.0',
+    'gevent>=23.9.0',
+    'orjson>=3.9.0',
+    'msgspec>=0.18.0',
     'redis>=5.0.0',
     'psycopg2-binary>=2.9.0',
     'sentry-sdk>=1.30.0',
@@ -124,6 +127,8 @@ setup(
         'console_scripts': [
             'ai-quiz-generator=scripts.generate_quiz:main',
             'ai-data-manager=scripts.data_manager:main',
+            'ai-batch-generate=scripts.batch_generate:main',
+            'ai-submit-batch=scripts.submit_batch:main',
             'ai-learning-server=app:main',
         ],
     },
@@ -0,0 +1,26 @@
+"""
+Shared helpers for the test modules
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import _compat
+
+def each_encoder():
+    """Yield the name of each installed JSON encoder while json_dumps uses it
+
+    msgspec and then orjson are patched out in turn, fastest first, so the
+    loop body runs once per encoder, ending with the stdlib json module.
+    """
+    if _compat.msgspec is not None:
+        yield 'msgspec'
+    if _compat.orjson is not None:
+        with patch('models._compat.msgspec', None):
+            yield 'orjson'
+    with patch('models._compat.msgspec', None), patch('models._compat.orjson', None):
+        yield 'json'
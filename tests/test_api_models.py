@@ -0,0 +1,518 @@
+"""
+Unit tests for the API data models (models/api_models.py)
+
+This module tests request and response construction, pagination,
+error collection, rate limit and metrics bookkeeping, and JSON encoding.
+"""
+
+import json
+import unittest
+import os
+import sys
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import _compat
+from models._compat import json_dumps
+from models.api_models import (APIMetrics, APIRequest, APIResponse, ErrorResponse,
+                               ErrorType, HTTPStatus, PaginationInfo, RateLimitInfo,
+                               ValidationError)
+from tests.helpers import each_encoder
+
+class TestAPIMetrics(unittest.TestCase):
+    """Test cases for APIMetrics response time statistics"""
+    
+    def test_new_metrics_are_empty(self):
+        """Test the statistics before any request is recorded"""
+        metrics = APIMetrics('/api/v1.0/middleware_chatgpt', 'POST')
+        self.assertEqual(metrics.average_response_time, 0.0)
+        self.assertEqual(metrics.get_average(), 0.0)
+        self.assertEqual(metrics.min_response_time, 0.0)
+        self.assertEqual(metrics.max_response_time, 0.0)
+    
+    def test_record_request_tracks_sum_min_max_and_average(self):
+        """Test that recorded response times update every statistic"""
+        metrics = APIMetrics('/api/v1.0/middleware_chatgpt', 'POST')
+        for success, response_time in ((True, 0.5), (False, 1.5), (True, 0.25)):
+            metrics.record_request(success, response_time)
+        
+        self.assertEqual(metrics.total_requests, 3)
+        self.assertEqual(metrics.successful_requests, 2)
+        self.assertEqual(metrics.failed_requests, 1)
+        self.assertAlmostEqual(metrics.sum_response_time, 2.25)
+        self.assertEqual(metrics.min_response_time, 0.25)
+        self.assertEqual(metrics.max_response_time, 1.5)
+        self.assertAlmostEqual(metrics.average_response_time, 0.75)
+        self.assertAlmostEqual(metrics.to_dict()['average_response_time'], 0.75)
+    
+    def test_first_request_sets_min_and_max(self):
+        """Test that the first response time is both the minimum and maximum"""
+        metrics = APIMetrics('/health', 'GET')
+        metrics.record_request(True, 2.0)
+        self.assertEqual(metrics.min_response_time, 2.0)
+        self.assertEqual(metrics.max_response_time, 2.0)
+    
+    def test_average_response_time_keyword_seeds_the_sum(self):
+        """Test that the average can still be passed to the constructor"""
+        metrics = APIMetrics('/health', 'GET', total_requests=4, average_response_time=1.5)
+        self.assertEqual(metrics.sum_response_time, 6.0)
+        self.assertEqual(metrics.average_response_time, 1.5)
+        
+        metrics.record_request(True, 4.0)
+        self.assertEqual(metrics.average_response_time, 2.0)
+    
+    def test_average_response_time_is_positional_as_before(self):
+        """Test that the positional argument order is unchanged"""
+        metrics = APIMetrics('/health', 'GET', 2, 2, 0, 3.0)
+        self.assertEqual(metrics.average_response_time, 3.0)
+    
+    def test_assigned_average_is_used_by_the_next_request(self):
+        """Test that the average stays assignable"""
+        metrics = APIMetrics('/health', 'GET', total_requests=2)
+        metrics.average_response_time = 0.5
+        self.assertEqual(metrics.average_response_time, 0.5)
+        
+        metrics.record_request(True, 2.0)
+        self.assertEqual(metrics.sum_response_time, 3.0)
+        self.assertEqual(metrics.average_response_time, 1.0)
+    
+    def test_average_is_a_stored_field(self):
+        """Test that asdict and repr report the average, not the internal sum"""
+        metrics = APIMetrics('/health', 'GET')
+        metrics.record_request(True, 0.5)
+        metrics.record_request(True, 1.5)
+        
+        data = asdict(metrics)
+        self.assertEqual(data['average_response_time'], 1.0)
+        self.assertIn('average_response_time=1.0', repr(metrics))
+        self.assertNotIn('sum_response_time', repr(metrics))
+        self.assertEqual(metrics, APIMetrics('/health', 'GET', 2, 2, 0, 1.0, 0.5, 1.5,
+                                             metrics.last_request_time))
+
+class TestSlots(unittest.TestCase):
+    """Test cases for the slotted API model dataclasses"""
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_instances_have_no_dict(self):
+        """Test that the models generate __slots__ instead of a __dict__"""
+        for obj in (APIRequest('/health'),
+                    ValidationError('topic', 'required'),
+                    ErrorResponse(ErrorType.VALIDATION_ERROR, 'bad request'),
+                    APIResponse(),
+                    APIMetrics('/health', 'GET')):
+            with self.subTest(model=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    obj.unknown_attribute = 1
+
+class TestJSONEncoding(unittest.TestCase):
+    """Test cases for to_json with each available encoder"""
+    
+    def test_to_json_matches_to_dict(self):
+        """Test that every encoder produces the to_dict payload"""
+        request = APIRequest('/api/v1.0/middleware_chatgpt', 'post',
+                             body={'argomento': 'Python'})
+        error = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input')
+        error.add_validation_error('argomento', 'required', 'missing')
+        response = APIResponse(data={'questions': []}, message='ok')
+        
+        for encoder in each_encoder():
+            for obj in (request, error, response):
+                with self.subTest(encoder=encoder, model=type(obj).__name__):
+                    encoded = obj.to_json()
+                    self.assertIsInstance(encoded, bytes)
+                    self.assertEqual(json.loads(encoded), obj.to_dict())
+    
+    def test_aware_utc_timestamps_round_trip_with_each_encoder(self):
+        """Test that from_dict reads the UTC offset every encoder writes"""
+        timestamp = datetime(2024, 3, 7, 9, 5, 2, tzinfo=timezone.utc)
+        request = APIRequest('/health', timestamp=timestamp)
+        error = ErrorResponse(ErrorType.TIMEOUT_ERROR, 'Timed out', timestamp=timestamp)
+        response = APIResponse(data=[1, 2], timestamp=timestamp)
+        for encoder in each_encoder():
+            for obj in (request, error, response):
+                with self.subTest(encoder=encoder, model=type(obj).__name__):
+                    restored = type(obj).from_dict(json.loads(obj.to_json()))
+                    self.assertEqual(restored.timestamp, timestamp)
+    
+    def test_json_dumps_is_compact(self):
+        """Test that the stdlib fallback matches the compact C encoders"""
+        with patch('models._compat.msgspec', None), patch('models._compat.orjson', None):
+            self.assertEqual(_compat.json_dumps({'a': [1, 2]}), b'{"a":[1,2]}')
+
+class TestAPIRequest(unittest.TestCase):
+    """Test cases for APIRequest construction"""
+    
+    def test_request_id_format(self):
+        """Test that generated ids match the former strftime format"""
+        timestamp = datetime(2024, 3, 7, 9, 5, 2, 4567)
+        request = APIRequest('/health', timestamp=timestamp)
+        self.assertEqual(request.request_id, timestamp.strftime("req_%Y%m%d_%H%M%S_%f"))
+        self.assertEqual(request.request_id, 'req_20240307_090502_004567')
+    
+    def test_explicit_request_id_is_kept(self):
+        """Test that a given request id is not replaced"""
+        request = APIRequest('/health', request_id='req_custom')
+        self.assertEqual(request.request_id, 'req_custom')
+
+class TestErrorResponse(unittest.TestCase):
+    """Test cases for ErrorResponse construction and serialization"""
+    
+    def test_coerces_error_type_and_status_code(self):
+        """Test that raw values are converted to their enum members"""
+        error = ErrorResponse('rate_limit_error', 'Slow down', status_code=429)
+        self.assertIs(error.error_type, ErrorType.RATE_LIMIT_ERROR)
+        self.assertIs(error.status_code, HTTPStatus.TOO_MANY_REQUESTS)
+    
+    def test_invalid_error_type_raises(self):
+        """Test that an unknown error type string is rejected"""
+        with self.assertRaisesRegex(ValueError, "Invalid error type: bogus"):
+            ErrorResponse('bogus', 'Oops')
+    
+    def test_invalid_status_code_raises(self):
+        """Test that an unknown status code is rejected"""
+        with self.assertRaisesRegex(ValueError, "Invalid status code: 418"):
+            ErrorResponse(ErrorType.INTERNAL_ERROR, 'Oops', status_code=418)
+        with self.assertRaisesRegex(ValueError, "Invalid status code: 418"):
+            APIResponse(status_code=418)
+
+class TestPaginationInfo(unittest.TestCase):
+    """Test cases for the PaginationInfo named tuple"""
+    
+    def test_defaults(self):
+        """Test that an empty result still reports a single page"""
+        pagination = PaginationInfo()
+        self.assertEqual(pagination.total_pages, 1)
+        self.assertFalse(pagination.has_next)
+        self.assertFalse(pagination.has_prev)
+        self.assertEqual(PaginationInfo.build(), pagination)
+    
+    def test_build_derives_page_counts(self):
+        """Test the page count and navigation flags"""
+        pagination = PaginationInfo.build(page=2, per_page=10, total_items=25)
+        self.assertEqual(pagination.total_pages, 3)
+        self.assertTrue(pagination.has_next)
+        self.assertTrue(pagination.has_prev)
+        self.assertEqual(pagination.get_offset(), 10)
+        
+        last_page = PaginationInfo.build(page=3, per_page=10, total_items=30)
+        self.assertEqual(last_page.total_pages, 3)
+        self.assertFalse(last_page.has_next)
+    
+    def test_build_rejects_non_positive_values(self):
+        """Test the page and per_page validation"""
+        with self.assertRaisesRegex(ValueError, "Items per page must be positive"):
+            PaginationInfo.build(per_page=0)
+        with self.assertRaisesRegex(ValueError, "Page number must be positive"):
+            PaginationInfo.build(page=0)
+    
+    def test_is_immutable(self):
+        """Test that fields cannot be reassigned"""
+        pagination = PaginationInfo.build(total_items=5)
+        with self.assertRaises(AttributeError):
+            pagination.page = 2
+    
+    def test_to_dict(self):
+        """Test the dictionary form, directly and inside an APIResponse"""
+        response = APIResponse(data=[])
+        response.set_pagination(page=1, per_page=20, total_items=45)
+        expected = {
+            'page': 1, 'per_page': 20, 'total_items': 45, 'total_pages': 3,
+            'has_next': True, 'has_prev': False, 'next_url': None, 'prev_url': None
+        }
+        self.assertEqual(response.pagination.to_dict(), expected)
+        self.assertEqual(response.to_dict()['pagination'], expected)
+        self.assertEqual(APIResponse.from_dict(response.to_dict()).pagination, response.pagination)
+
+class TestValidationErrors(unittest.TestCase):
+    """Test cases for collecting validation errors on an ErrorResponse"""
+    
+    def test_fast_and_regular_errors_serialize_alike(self):
+        """Test that add_validation_error_fast matches add_validation_error"""
+        regular = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input')
+        fast = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input',
+                             timestamp=regular.timestamp)
+        regular.add_validation_error('argomento', 'required', 'missing')
+        fast.add_validation_error_fast('argomento', 'required', 'missing')
+        
+        self.assertEqual(fast.to_dict(), regular.to_dict())
+        self.assertEqual(fast.to_dict()['error']['validation_errors'],
+                         [{'field': 'argomento', 'message': 'required',
+                           'code': 'missing', 'value': None}])
+    
+    def test_serialized_fast_errors_are_copies(self):
+        """Test that to_dict does not hand out the stored dictionaries"""
+        error = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input')
+        error.add_validation_error_fast('livello', 'unknown level')
+        error.to_dict()['error']['validation_errors'][0]['message'] = 'changed'
+        self.assertEqual(error.validation_errors[0]['message'], 'unknown level')
+    
+    def test_fast_errors_round_trip(self):
+        """Test that from_dict rebuilds fast errors as ValidationError instances"""
+        error = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input')
+        error.add_validation_error_fast('argomento', 'required')
+        restored = ErrorResponse.from_dict(error.to_dict())
+        self.assertEqual(restored.validation_errors, [ValidationError('argomento', 'required')])
+        self.assertEqual(restored.to_dict(), error.to_dict())
+
+class TestRateLimitInfo(unittest.TestCase):
+    """Test cases for RateLimitInfo reset bookkeeping"""
+    
+    def test_time_until_reset(self):
+        """Test the countdown right after construction"""
+        info = RateLimitInfo(limit=100, remaining=5,
+                             reset_time=datetime.now() + timedelta(seconds=90))
+        self.assertIn(info.time_until_reset(), (89, 90))
+        self.assertFalse(info.is_exceeded())
+        self.assertEqual(info.to_dict()['time_until_reset'], info.time_until_reset())
+    
+    def test_countdown_follows_the_monotonic_clock(self):
+        """Test that the deadline is fixed against time.monotonic"""
+        with patch('models.api_models.time.monotonic', return_value=1000.0):
+            info = RateLimitInfo(limit=100, remaining=0,
+                                 reset_time=datetime.now() + timedelta(seconds=60))
+        self.assertAlmostEqual(info.reset_monotonic, 1060.0, delta=1.0)
+        
+        with patch('models.api_models.time.monotonic', return_value=1030.0):
+            self.assertIn(info.time_until_reset(), (29, 30))
+        with patch('models.api_models.time.monotonic', return_value=2000.0):
+            self.assertEqual(info.time_until_reset(), 0)
+        self.assertTrue(info.is_exceeded())
+    
+    def test_past_reset_time(self):
+        """Test that an elapsed window reports zero seconds"""
+        info = RateLimitInfo(limit=10, remaining=10,
+                             reset_time=datetime.now() - timedelta(minutes=5))
+        self.assertEqual(info.time_until_reset(), 0)
+    
+    def test_reassigned_reset_time_moves_the_deadline(self):
+        """Test that the countdown follows a new reset_time"""
+        info = RateLimitInfo(limit=100, remaining=0,
+                             reset_time=datetime.now() + timedelta(seconds=100))
+        self.assertIn(info.time_until_reset(), (99, 100))
+        
+        info.reset_time += timedelta(hours=1)
+        self.assertIn(info.time_until_reset(), (3699, 3700))
+        data = info.to_dict()
+        self.assertEqual(data['reset_time'], info.reset_time.isoformat())
+        self.assertIn(data['time_until_reset'], (3699, 3700))
+        
+        info.reset_time = datetime.now() - timedelta(seconds=1)
+        self.assertEqual(info.time_until_reset(), 0)
+
+class TestRequestMethod(unittest.TestCase):
+    """Test cases for APIRequest method validation"""
+    
+    def test_method_is_normalized(self):
+        """Test that lowercase methods are accepted and upper-cased"""
+        for method in ('get', 'Post', 'OPTIONS'):
+            with self.subTest(method=method):
+                self.assertEqual(APIRequest('/health', method).method, method.upper())
+    
+    def test_invalid_method_raises(self):
+        """Test that the error lists the valid methods"""
+        with self.assertRaisesRegex(ValueError, "Method must be one of: GET, POST, PUT, PATCH, "
+                                                "DELETE, HEAD, OPTIONS"):
+            APIRequest('/health', 'TRACE')
+    
+    def test_empty_endpoint_raises(self):
+        """Test that an endpoint is required"""
+        with self.assertRaisesRegex(ValueError, "Endpoint must be a non-empty string"):
+            APIRequest('')
+
+class TestErrorAPIResponse(unittest.TestCase):
+    """Test cases for APIResponse.error_response"""
+    
+    def test_error_is_serialized_on_demand(self):
+        """Test that the ErrorResponse is stored and serialized by to_dict"""
+        error = ErrorResponse(ErrorType.NOT_FOUND_ERROR, 'No such course',
+                              status_code=HTTPStatus.NOT_FOUND)
+        response = APIResponse.error_response(error)
+        self.assertIs(response.data, error)
+        self.assertFalse(response.success)
+        self.assertIs(response.status_code, HTTPStatus.NOT_FOUND)
+        
+        # Changes made after the response was built are reflected
+        error.add_validation_error('course_id', 'unknown')
+        self.assertEqual(response.to_dict()['data'], error.to_dict())
+        self.assertEqual(json.loads(response.to_json())['data'], error.to_dict())
+
+class TestSuccessResponse(unittest.TestCase):
+    """Test cases for APIResponse.success_response and _unchecked"""
+    
+    def test_matches_a_validated_response(self):
+        """Test that the unchecked build sets every field like __init__ does"""
+        response = APIResponse.success_response({'id': 1}, 'Created', HTTPStatus.CREATED)
+        expected = APIResponse(success=True, data={'id': 1}, message='Created',
+                               status_code=HTTPStatus.CREATED, timestamp=response.timestamp)
+        self.assertEqual(response, expected)
+        self.assertEqual(response.to_dict(), expected.to_dict())
+    
+    def test_metadata_is_not_shared(self):
+        """Test that each response gets its own metadata dictionary"""
+        first = APIResponse.success_response()
+        second = APIResponse.success_response()
+        first.add_metadata('source', 'cache')
+        self.assertEqual(second.metadata, {})
+    
+    def test_raw_status_code_is_validated(self):
+        """Test that non-enum status codes still go through __post_init__"""
+        self.assertIs(APIResponse.success_response(status_code=201).status_code,
+                      HTTPStatus.CREATED)
+        with self.assertRaisesRegex(ValueError, "Invalid status code: 299"):
+            APIResponse.success_response(status_code=299)
+
+class TestContentType(unittest.TestCase):
+    """Test cases for APIRequest content type detection"""
+    
+    def test_default_is_json(self):
+        """Test that a request without Content-Type is treated as JSON"""
+        request = APIRequest('/health')
+        self.assertEqual(request.get_content_type(), 'application/json')
+        self.assertTrue(request.is_json_request())
+    
+    def test_explicit_content_types(self):
+        """Test JSON detection on explicit headers"""
+        cases = (('application/json', True),
+                 ('application/json; charset=utf-8', True),
+                 ('text/plain', False),
+                 ('multipart/form-data', False))
+        for content_type, expected in cases:
+            with self.subTest(content_type=content_type):
+                request = APIRequest('/health', headers={'Content-Type': content_type})
+                self.assertIs(request.is_json_request(), expected)
+
+class TestResponseTimeBounds(unittest.TestCase):
+    """Test cases for APIMetrics min/max tracking without a sentinel"""
+    
+    def test_empty_metrics_encode_as_plain_json(self):
+        """Test that an unused endpoint reports zero instead of infinity"""
+        metrics = APIMetrics('/health', 'GET')
+        self.assertEqual(json.loads(json_dumps(metrics))['min_response_time'], 0.0)
+    
+    def test_bounds_for_any_order(self):
+        """Test min/max for increasing, decreasing and mixed sequences"""
+        for times in ((1.0, 2.0, 3.0), (3.0, 2.0, 1.0), (2.0, 0.5, 4.0, 1.0)):
+            with self.subTest(times=times):
+                metrics = APIMetrics('/health', 'GET')
+                for response_time in times:
+                    metrics.record_request(True, response_time)
+                self.assertEqual(metrics.min_response_time, min(times))
+                self.assertEqual(metrics.max_response_time, max(times))
+    
+    def test_first_sample_with_seeded_request_count(self):
+        """Test that seeding total_requests does not hide the first sample"""
+        metrics = APIMetrics('e', 'GET', total_requests=5, average_response_time=50.0)
+        metrics.record_request(True, 5)
+        self.assertEqual(metrics.min_response_time, 5)
+        self.assertEqual(metrics.max_response_time, 5)
+        self.assertEqual(metrics.total_requests, 6)
+        self.assertEqual(metrics.average_response_time, 255 / 6)
+    
+    def test_seeded_bounds_are_kept(self):
+        """Test that bounds passed to the constructor are extended, not replaced"""
+        metrics = APIMetrics('e', 'GET', total_requests=5, min_response_time=1.0,
+                             max_response_time=9.0)
+        metrics.record_request(True, 5.0)
+        self.assertEqual(metrics.min_response_time, 1.0)
+        self.assertEqual(metrics.max_response_time, 9.0)
+        metrics.record_request(True, 0.5)
+        metrics.record_request(True, 12.0)
+        self.assertEqual(metrics.min_response_time, 0.5)
+        self.assertEqual(metrics.max_response_time, 12.0)
+
+class TestMixedValidationErrors(unittest.TestCase):
+    """Test cases for serializing a mix of stored validation errors"""
+    
+    def test_order_and_shape_are_preserved(self):
+        """Test that instances and dictionaries serialize in insertion order"""
+        error = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input')
+        error.add_validation_error('argomento', 'required')
+        error.add_validation_error_fast('livello', 'unknown level', 'choice')
+        error.validation_errors.append(ValidationError('lingua', 'unsupported', value='xx'))
+        
+        self.assertEqual(error.to_dict()['error']['validation_errors'], [
+            {'field': 'argomento', 'message': 'required', 'code': None, 'value': None},
+            {'field': 'livello', 'message': 'unknown level', 'code': 'choice', 'value': None},
+            {'field': 'lingua', 'message': 'unsupported', 'code': None, 'value': 'xx'},
+        ])
+    
+    def test_no_errors(self):
+        """Test that an error without validation errors serializes an empty list"""
+        error = ErrorResponse(ErrorType.INTERNAL_ERROR, 'Oops')
+        self.assertEqual(error.to_dict()['error']['validation_errors'], [])
+
+class TestJSONHook(unittest.TestCase):
+    """Test cases for the __json__ hook used by json_dumps"""
+    
+    def test_models_encode_through_to_dict(self):
+        """Test that passing a model encodes the same as passing its to_dict()"""
+        metrics = APIMetrics('/health', 'GET')
+        metrics.record_request(True, 0.2)
+        models = (APIRequest('/health'),
+                  ValidationError('argomento', 'required'),
+                  ErrorResponse(ErrorType.TIMEOUT_ERROR, 'Timed out'),
+                  APIResponse(data=[1, 2]),
+                  metrics)
+        
+        for encoder in each_encoder():
+            for obj in models:
+                with self.subTest(encoder=encoder, model=type(obj).__name__):
+                    self.assertEqual(json.loads(json_dumps(obj)), obj.to_dict())
+
+class TestRequestIdFromTimestamp(unittest.TestCase):
+    """Test cases for deriving APIRequest.request_id from the timestamp"""
+    
+    def test_default_id_matches_default_timestamp(self):
+        """Test that the id and timestamp describe the same instant"""
+        request = APIRequest('/health')
+        self.assertEqual(request.request_id,
+                         request.timestamp.strftime("req_%Y%m%d_%H%M%S_%f"))
+    
+    def test_from_dict_keeps_id_and_timestamp(self):
+        """Test that a round trip preserves both values"""
+        request = APIRequest('/health', timestamp=datetime(2024, 1, 2, 3, 4, 5, 6))
+        restored = APIRequest.from_dict(request.to_dict())
+        self.assertEqual(restored.request_id, 'req_20240102_030405_000006')
+        self.assertEqual(restored.timestamp, request.timestamp)
+        
+        data = request.to_dict()
+        del data['request_id']
+        self.assertEqual(APIRequest.from_dict(data).request_id, request.request_id)
+
+class TestErrorResponseFromDict(unittest.TestCase):
+    """Test cases for ErrorResponse.from_dict"""
+    
+    def test_round_trip(self):
+        """Test that every field survives to_dict/from_dict"""
+        error = ErrorResponse(ErrorType.VALIDATION_ERROR, 'Invalid input',
+                              status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                              details='see fields', error_code='E42',
+                              request_id='req_1', help_url='https://example.com/help')
+        error.add_validation_error('argomento', 'required', 'missing')
+        error.validation_errors.append(ValidationError('livello', 'unknown', 'choice', 'x'))
+        
+        restored = ErrorResponse.from_dict(error.to_dict())
+        self.assertEqual(restored, error)
+    
+    def test_optional_validation_error_keys(self):
+        """Test that code and value default to None"""
+        data = {'error': {'type': 'validation_error', 'message': 'Invalid input',
+                          'validation_errors': [{'field': 'argomento', 'message': 'required'}]}}
+        restored = ErrorResponse.from_dict(data)
+        self.assertEqual(restored.validation_errors, [ValidationError('argomento', 'required')])
+        self.assertIs(restored.status_code, HTTPStatus.BAD_REQUEST)
+    
+    def test_missing_validation_error_field_raises(self):
+        """Test that field and message are still required"""
+        data = {'error': {'type': 'validation_error', 'message': 'Invalid input',
+                          'validation_errors': [{'message': 'required'}]}}
+        with self.assertRaises(KeyError):
+            ErrorResponse.from_dict(data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Flask application including route testing, error handling, and API validation.
 
 import unittest
 import json
+import logging
 import os
 import sys
 from unittest.mock import patch, MagicMock
@@ -15,8 +16,8 @@ import tempfile
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import app, QuizGenerator
-from config import Config
+from app import app, create_app, QuizGenerator, _quiz_decoder
+from config import Config, _load_config
 
 class TestFlaskApp(unittest.TestCase):
     """Test cases for Flask application"""
@@ -48,7 +49,28 @@ class TestFlaskApp(unittest.TestCase):
         response = self.client.get('/')
         # Should return either 200 (if route exists) or 404 (if not implemented)
         self.assertIn(response.status_code, [200, 404])
-    
+
+    def test_health_check_not_modified(self):
+        """Test that a matching If-None-Match gets an empty 304"""
+        response = self.client.get('/health')
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        response = self.client.get('/health', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+    def test_health_check_not_modified_weak_etag(self):
+        """Test that If-None-Match uses the weak comparison RFC 9110 requires"""
+        etag = self.client.get('/health').headers['ETag']
+
+        for header in (f'W/{etag}', f'"other", {etag}', '*'):
+            response = self.client.get('/health', headers={'If-None-Match': header})
+            self.assertEqual(response.status_code, 304, header)
+
+        response = self.client.get('/health', headers={'If-None-Match': 'W/"other"'})
+        self.assertEqual(response.status_code, 200)
+
     @patch('openai.Completion.create')
     def test_generate_endpoint_success(self, mock_openai):
         """Test successful content generation"""
@@ -96,6 +118,119 @@ class TestFlaskApp(unittest.TestCase):
         
         self.assertIsNotNone(response)
 
+    def test_batch_endpoint_requires_list(self):
+        """Test that the batch endpoint rejects non-list payloads"""
+        response = self.client.post(
+            '/api/v1.0/middleware_chatgpt/batch',
+            data=json.dumps({'topic': 'Python'}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+    
+    @patch.dict(os.environ, {'USE_MOCK_DATA': 'true'})
+    def test_batch_endpoint_returns_result_per_request(self):
+        """Test that the batch endpoint answers every entry in order"""
+        params = {
+            'random_topic': 'true',
+            'num_of_questions': '2',
+            'num_of_replies': '4',
+            'language': 'english'
+        }
+        response = self.client.post(
+            '/api/v1.0/middleware_chatgpt/batch',
+            data=json.dumps([params, params]),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 2)
+
+class TestAppFactory(unittest.TestCase):
+    """Test cases for the create_app factory"""
+    
+    def test_create_app_returns_new_instance(self):
+        """Test that each call builds an independent application"""
+        first = create_app('testing')
+        second = create_app('testing')
+        self.assertIsNot(first, second)
+        self.assertTrue(first.config['TESTING'])
+    
+    def test_import_keeps_global_logging_settings(self):
+        """Test that importing the app leaves process-wide logging flags alone"""
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+        self.assertTrue(logging.logMultiprocessing)
+    
+    def test_create_app_registers_quiz_generator(self):
+        """Test that the factory wires up the quiz generator and routes"""
+        test_app = create_app('testing')
+        self.assertIsInstance(test_app.extensions['quiz_generator'], QuizGenerator)
+        
+        rules = {rule.rule for rule in test_app.url_map.iter_rules()}
+        self.assertIn('/health', rules)
+        self.assertIn('/api/v1.0/middleware_chatgpt', rules)
+
+    def test_cors_allows_only_configured_origins(self):
+        """Test that CORS headers are only sent for allowed origins"""
+        # Configurations are cached per environment; rebuild from the patched env
+        _load_config.cache_clear()
+        self.addCleanup(_load_config.cache_clear)
+        with patch.dict(os.environ, {'CORS_ORIGIN': 'http://localhost:3000,https://example.com'}):
+            test_app = create_app('production')
+        client = test_app.test_client()
+
+        response = client.options('/api/v1.0/middleware_chatgpt', headers={
+            'Origin': 'https://example.com',
+            'Access-Control-Request-Method': 'POST'
+        })
+        self.assertEqual(response.headers['Access-Control-Allow-Origin'], 'https://example.com')
+        self.assertIn('POST', response.headers['Access-Control-Allow-Methods'])
+
+        response = client.get('/health', headers={'Origin': 'https://evil.example.com'})
+        self.assertNotIn('Access-Control-Allow-Origin', response.headers)
+
+    def test_identical_requests_are_served_from_cache(self):
+        """Test that a repeated request does not generate content again"""
+        test_app = create_app('testing')
+        generator = test_app.extensions['quiz_generator']
+        params = {
+            'topic': 'Python',
+            'num_of_questions': '1',
+            'num_of_replies': '2',
+            'language': 'english'
+        }
+
+        with patch.object(generator, 'generate_content', return_value={'topic': 'Python'}) as mock_generate:
+            client = test_app.test_client()
+            first = client.post('/api/v1.0/middleware_chatgpt', json=params)
+            second = client.post('/api/v1.0/middleware_chatgpt', json=dict(params, topic=' python '))
+
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.get_json(), {'topic': 'Python'})
+
+    def test_unparseable_content_is_not_cached(self):
+        """Test that the parse-failure placeholder is regenerated, not replayed"""
+        test_app = create_app('testing')
+        generator = test_app.extensions['quiz_generator']
+        params = {
+            'topic': 'Python',
+            'num_of_questions': '1',
+            'num_of_replies': '2',
+            'language': 'english'
+        }
+        error_result = generator._parse_response('not json', 'images/about_img.jpg')
+        self.assertEqual(error_result['topic'], 'Error')
+
+        with patch.object(generator, 'generate_content', return_value=error_result) as mock_generate:
+            client = test_app.test_client()
+            first = client.post('/api/v1.0/middleware_chatgpt', json=params)
+            second = client.post('/api/v1.0/middleware_chatgpt', json=params)
+
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'MISS')
+
 class TestQuizGenerator(unittest.TestCase):
     """Test cases for QuizGenerator class"""
     
@@ -127,6 +262,138 @@ class TestQuizGenerator(unittest.TestCase):
         
         result = self.quiz_generator.generate_content(params)
         self.assertIsInstance(result, dict)
+
+    def test_parse_response(self):
+        """Test parsing of generated content and the error fallback"""
+        content = json.dumps({
+            'topic': 'Python',
+            'sintesi': 'Summary',
+            'questionario': [{
+                'domanda': 'Question?',
+                'risposte': {'A': 'Yes', 'B': 'No'},
+                'risposta_corretta': 'A'
+            }]
+        })
+
+        result = self.quiz_generator._parse_response(content, 'img.jpg')
+        self.assertEqual(result['topic'], 'Python')
+        self.assertEqual(result['questionario'][0]['risposta_corretta'], 'A')
+        self.assertEqual(result['imageUrl'], 'img.jpg')
+
+        result = self.quiz_generator._parse_response('not json', 'img.jpg')
+        self.assertEqual(result['topic'], 'Error')
+        self.assertEqual(result['imageUrl'], 'img.jpg')
+
+    def test_parse_response_schema_mismatch_matches_without_msgspec(self):
+        """Test that both parsing paths apply the quiz schema the same way"""
+        valid = {
+            'topic': 'Python',
+            'sintesi': 'Summary',
+            'extra': 'dropped',
+            'questionario': [{
+                'domanda': 'Question?',
+                'risposte': {'A': 'Yes', 'B': 'No'},
+                'risposta_corretta': 'A',
+                'spiegazione': 'dropped'
+            }]
+        }
+        mismatched = dict(valid, questionario=[{
+            'domanda': 'Question?',
+            'risposte': {'A': 1},
+            'risposta_corretta': 'A'
+        }])
+
+        results = []
+        for decoder in (_quiz_decoder(), None):
+            with patch('app._quiz_decoder', return_value=decoder):
+                parsed = self.quiz_generator._parse_response(json.dumps(valid), 'img.jpg')
+                with self.assertLogs('app', level='ERROR') as logs:
+                    error = self.quiz_generator._parse_response(json.dumps(mismatched), 'img.jpg')
+                    self.quiz_generator._parse_response('{"topic": "Python"}', 'img.jpg')
+            results.append(parsed)
+
+            self.assertNotIn('extra', parsed)
+            self.assertNotIn('spiegazione', parsed['questionario'][0])
+            self.assertEqual(error['topic'], 'Error')
+            self.assertEqual(len(logs.output), 2)
+            for line in logs.output:
+                self.assertIn('does not match the quiz schema', line)
+
+        self.assertEqual(results[0], results[1])
+
+    def test_parse_response_logs_decode_errors_separately(self):
+        """Test that invalid JSON is logged apart from schema mismatches"""
+        for decoder in (_quiz_decoder(), None):
+            with patch('app._quiz_decoder', return_value=decoder):
+                with self.assertLogs('app', level='ERROR') as logs:
+                    result = self.quiz_generator._parse_response('not json', 'img.jpg')
+            self.assertEqual(result['topic'], 'Error')
+            self.assertIn('Failed to parse OpenAI response as JSON', logs.output[0])
+            self.assertNotIn('quiz schema', logs.output[0])
+
+    def test_openai_client_is_used_when_provided(self):
+        """Test that completions and images go through the injected client"""
+        client = MagicMock()
+        client.images.generate.return_value.data = [MagicMock(url='https://example.com/img.png')]
+        generator = QuizGenerator(client=client)
+
+        generator._create_completion('prompt')
+        image_url = generator._generate_image('Python', False)
+
+        client.completions.create.assert_called_once()
+        self.assertEqual(client.completions.create.call_args.kwargs['prompt'], 'prompt')
+        self.assertEqual(image_url, 'https://example.com/img.png')
+
+    def test_generate_batch_splits_prompts(self):
+        """Test that batched prompts are chunked and demultiplexed by index"""
+        def fake_create(prompt):
+            response = MagicMock()
+            # Return choices in reverse order to exercise the index mapping
+            response.choices = [
+                MagicMock(index=i, text=json.dumps({
+                    'topic': text.split('The topic to use for questions is: ')[1].split('\n')[0],
+                    'sintesi': 'Summary',
+                    'questionario': []
+                }))
+                for i, text in reversed(list(enumerate(prompt)))
+            ]
+            return response
+        
+        params_list = [{
+            'topic': f'Topic {i}',
+            'num_of_questions': '1',
+            'num_of_replies': '2',
+            'language': 'english'
+        } for i in range(3)]
+        
+        with patch.object(type(self.quiz_generator.config), 'MAX_BATCH', 2), \
+                patch.object(self.quiz_generator, '_generate_image', return_value='images/about_img.jpg'), \
+                patch.object(self.quiz_generator, '_create_completion', side_effect=fake_create) as mock_create:
+            results = self.quiz_generator.generate_batch(params_list)
+        
+        self.assertEqual(mock_create.call_count, 2)
+        self.assertEqual([r['topic'] for r in results], ['Topic 0', 'Topic 1', 'Topic 2'])
+    
+    @patch('app.time.sleep')
+    @patch('app._transient_openai_errors', return_value=(ConnectionError,))
+    def test_with_retries_backs_off_on_transient_errors(self, mock_errors, mock_sleep):
+        """Test that transient failures are retried with exponential backoff"""
+        func = MagicMock(side_effect=[ConnectionError(), ConnectionError(), 'ok'])
+        
+        self.assertEqual(self.quiz_generator._with_retries(func, 'prompt'), 'ok')
+        self.assertEqual(func.call_count, 3)
+        backoff = self.quiz_generator.config.OPENAI_RETRY_BACKOFF
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [backoff, backoff * 2])
+    
+    @patch('app.time.sleep')
+    @patch('app._transient_openai_errors', return_value=(ConnectionError,))
+    def test_with_retries_gives_up_after_max_attempts(self, mock_errors, mock_sleep):
+        """Test that the last transient failure is re-raised"""
+        func = MagicMock(side_effect=ConnectionError())
+        
+        with self.assertRaises(ConnectionError):
+            self.quiz_generator._with_retries(func)
+        self.assertEqual(func.call_count, self.quiz_generator.config.OPENAI_MAX_RETRIES)
     
     def test_generate_content_with_invalid_params(self):
         """Test content generation with invalid parameters"""
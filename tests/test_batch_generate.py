@@ -0,0 +1,186 @@
+"""
+Unit tests for the parallel batch generator (scripts/batch_generate.py)
+
+This module tests the rate limiting token bucket, loading of request
+files and the retry behaviour of completion requests.
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.batch_generate import TokenBucket, ParallelBatchGenerator, load_requests
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on"""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket"""
+    
+    def setUp(self):
+        """Set up a bucket driven by a fake clock"""
+        self.clock = FakeClock()
+        for target, new in (('scripts.batch_generate.time', self.clock),
+                            ('scripts.batch_generate.asyncio.sleep', self.clock.sleep)):
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.bucket = TokenBucket(60)
+    
+    def test_starts_full(self):
+        """Test that a new bucket hands out its whole budget without waiting"""
+        asyncio.run(self.bucket.acquire(60))
+        
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.bucket.available, 0)
+    
+    def test_waits_for_refill(self):
+        """Test that acquiring from an empty bucket waits for the missing amount"""
+        asyncio.run(self.bucket.acquire(60))
+        asyncio.run(self.bucket.acquire(30))
+        
+        # 60 per minute refills one unit per second
+        self.assertEqual(self.clock.sleeps, [30])
+        self.assertEqual(self.bucket.available, 0)
+    
+    def test_refill_is_capped_at_capacity(self):
+        """Test that idle time does not build up more than one minute of budget"""
+        asyncio.run(self.bucket.acquire(10))
+        self.clock.now += 3600
+        asyncio.run(self.bucket.acquire(1))
+        
+        self.assertEqual(self.bucket.available, 59)
+    
+    def test_amount_above_capacity_is_clamped(self):
+        """Test that a request larger than the bucket does not wait forever"""
+        asyncio.run(self.bucket.acquire(500))
+        
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.bucket.available, 0)
+
+class TestLoadRequests(unittest.TestCase):
+    """Test cases for load_requests"""
+    
+    def _load(self, text, defaults):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write(text)
+        self.addCleanup(os.unlink, f.name)
+        return load_requests(f.name, defaults)
+    
+    def test_topics_and_json_lines(self):
+        """Test that plain topics and JSON objects are both merged with the defaults"""
+        defaults = {'language': 'english', 'num_of_questions': '5'}
+        text = "\n".join([
+            '# curriculum',
+            'Python',
+            '',
+            '   ',
+            json.dumps({'topic': 'Storia', 'language': 'italian'}),
+            '  Rust  '
+        ])
+        
+        params_list = self._load(text, defaults)
+        
+        self.assertEqual(params_list, [
+            {'language': 'english', 'num_of_questions': '5', 'topic': 'Python'},
+            {'language': 'italian', 'num_of_questions': '5', 'topic': 'Storia'},
+            {'language': 'english', 'num_of_questions': '5', 'topic': 'Rust'}
+        ])
+        self.assertEqual(defaults, {'language': 'english', 'num_of_questions': '5'})
+    
+    def test_invalid_json_line(self):
+        """Test that a malformed JSON line is reported"""
+        with self.assertRaises(json.JSONDecodeError):
+            self._load('{"topic": ', {})
+
+class TestCompleteRetries(unittest.TestCase):
+    """Test cases for ParallelBatchGenerator._complete"""
+    
+    def setUp(self):
+        """Patch out real sleeps and treat ConnectionError as transient"""
+        self.sleep = AsyncMock()
+        for target, new in (('scripts.batch_generate.asyncio.sleep', self.sleep),
+                            ('scripts.batch_generate._transient_openai_errors',
+                             lambda: (ConnectionError,))):
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def _complete(self, side_effect):
+        """Run _complete against a fake async client"""
+        self.create = AsyncMock(side_effect=side_effect)
+        client = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        
+        async def run():
+            # Built inside the loop, as main() does
+            generator = ParallelBatchGenerator(client, max_concurrency=2,
+                                               requests_per_minute=1000,
+                                               tokens_per_minute=10 ** 9)
+            self.generator = generator
+            return await generator._complete('prompt')
+        
+        return asyncio.run(run())
+    
+    @staticmethod
+    def _response(text):
+        return SimpleNamespace(choices=[SimpleNamespace(text=text)])
+    
+    def test_success(self):
+        """Test that the completion text is returned stripped"""
+        result = self._complete([self._response('  {"topic": "Python"}\n')])
+        
+        self.assertEqual(result, '{"topic": "Python"}')
+        self.create.assert_awaited_once()
+        kwargs = self.create.call_args.kwargs
+        self.assertEqual(kwargs['prompt'], 'prompt')
+        self.assertEqual(kwargs['model'], self.generator.quiz_generator.model)
+        self.sleep.assert_not_awaited()
+    
+    def test_backs_off_on_transient_errors(self):
+        """Test that transient failures are retried with exponential backoff"""
+        result = self._complete([ConnectionError(), ConnectionError(),
+                                 self._response('ok')])
+        
+        self.assertEqual(result, 'ok')
+        self.assertEqual(self.create.await_count, 3)
+        backoff = self.generator.config.OPENAI_RETRY_BACKOFF
+        self.assertEqual([c.args[0] for c in self.sleep.await_args_list], [backoff, backoff * 2])
+    
+    def test_gives_up_after_max_attempts(self):
+        """Test that the last transient failure is re-raised"""
+        with self.assertRaises(ConnectionError):
+            self._complete(ConnectionError())
+        
+        max_attempts = self.generator.config.OPENAI_MAX_RETRIES
+        self.assertEqual(self.create.await_count, max_attempts)
+        self.assertEqual(self.sleep.await_count, max_attempts - 1)
+    
+    def test_other_errors_are_not_retried(self):
+        """Test that non-transient errors propagate immediately"""
+        with self.assertRaises(ValueError):
+            self._complete(ValueError('bad request'))
+        
+        self.create.assert_awaited_once()
+        self.sleep.assert_not_awaited()
+
+if __name__ == '__main__':
+    unittest.main()
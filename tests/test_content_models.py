@@ -0,0 +1,418 @@
+"""
+Unit tests for the content data models (models/content_models.py)
+
+This module tests course construction from dictionaries and JSON, the
+msgspec-backed fast paths and their fallbacks, and section helpers.
+"""
+
+import json
+import unittest
+import os
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import content_models
+from models._compat import msgspec
+from models.content_models import (
+    ContentExample, ContentFormat, ContentTemplate, ContentType, Course, DifficultyLevel,
+    LearningObjective, Section
+)
+from tests.helpers import each_encoder
+
+def _sample_course() -> Course:
+    """Build a course exercising nested objects, enums and timestamps"""
+    section = Section(
+        title='Variables',
+        content='Variables name values so they can be reused.',
+        order=1,
+        key_points=['Names refer to objects'],
+        examples=[ContentExample('Assignment', 'Bind a name', code='x = 1', language='python')],
+        estimated_time=10
+    )
+    return Course(
+        title='Python Basics',
+        description='An introduction to Python',
+        difficulty=DifficultyLevel.BEGINNER,
+        topic='python',
+        learning_objectives=[LearningObjective('Use variables', level='apply', order=1)],
+        sections=[section],
+        estimated_duration=3,
+        tags=['python'],
+        created_at=datetime(2024, 5, 1, 9, 30),
+        updated_at=datetime(2024, 5, 2, 10, 0, 0, 250000),
+        metadata={'source': 'test'}
+    )
+
+class TestCourseFromDict(unittest.TestCase):
+    """Test cases for Course.from_dict with and without msgspec"""
+    
+    def _from_dict_both_ways(self, data):
+        """Build a course with and without msgspec"""
+        course = Course.from_dict(data)
+        with patch('models.content_models.msgspec', None):
+            fallback = Course.from_dict(data)
+        return course, fallback
+    
+    def test_round_trip_matches_fallback(self):
+        """Test that both paths rebuild the course that to_dict produced"""
+        original = _sample_course()
+        course, fallback = self._from_dict_both_ways(original.to_dict())
+        self.assertEqual(course, original)
+        self.assertEqual(fallback, original)
+    
+    def test_lenient_values_are_accepted_by_both_paths(self):
+        """Test that values msgspec's types reject still load as in the fallback"""
+        data = dict(_sample_course().to_dict(), estimated_duration='10', created_at=None)
+        course, fallback = self._from_dict_both_ways(data)
+        self.assertEqual(course.estimated_duration, '10')
+        self.assertEqual(fallback.estimated_duration, '10')
+        self.assertIsInstance(course.created_at, datetime)
+    
+    def test_invalid_data_raises_the_same_errors(self):
+        """Test that both paths raise the same exception types"""
+        missing_title = {'description': 'No title'}
+        bad_difficulty = dict(_sample_course().to_dict(), difficulty='impossible')
+        for use_msgspec in (True, False):
+            with patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                with self.assertRaises(KeyError):
+                    Course.from_dict(missing_title)
+                with self.assertRaisesRegex(ValueError, 'Invalid difficulty level'):
+                    Course.from_dict(bad_difficulty)
+
+class TestLearningObjectiveBatch(unittest.TestCase):
+    """Test cases for LearningObjective.from_dict_batch"""
+    
+    def test_batch_matches_from_dict_on_both_paths(self):
+        """Test that the batch loads what from_dict loads, with or without msgspec"""
+        records = [
+            {'text': 'Explain closures', 'level': 'understand', 'order': 1},
+            {'text': 'Write a decorator', 'level': 'apply', 'measurable': False},
+            {'text': 'Compare approaches', 'order': '3'},
+        ]
+        expected = [LearningObjective.from_dict(record) for record in records]
+        self.assertEqual(LearningObjective.from_dict_batch(records), expected)
+        with patch('models.content_models.msgspec', None):
+            self.assertEqual(LearningObjective.from_dict_batch(records), expected)
+    
+    def test_batch_raises_from_dict_errors(self):
+        """Test that invalid objectives raise the same errors on both paths"""
+        for use_msgspec in (True, False):
+            with patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                with self.assertRaisesRegex(ValueError, 'Learning level must be one of'):
+                    LearningObjective.from_dict_batch([{'text': 'Guess', 'level': 'guess'}])
+                with self.assertRaises(KeyError):
+                    LearningObjective.from_dict_batch([{'level': 'apply'}])
+
+class TestSectionWordCount(unittest.TestCase):
+    """Test cases for the memoized section word counts"""
+    
+    def test_word_count_splits_on_any_whitespace(self):
+        """Test that newlines and repeated spaces separate words"""
+        section = Section(title='Intro', content='one  two\nthree\tfour ')
+        self.assertEqual(section.get_word_count(), 4)
+        self.assertEqual(section.get_reading_time(), 1)
+    
+    def test_changed_content_is_recounted(self):
+        """Test that a new content string is not served a stale count"""
+        section = Section(title='Intro', content='one two')
+        self.assertEqual(section.get_word_count(), 2)
+        section.content = 'one two three'
+        self.assertEqual(section.get_word_count(), 3)
+    
+    def test_cache_is_bounded_and_holds_no_text(self):
+        """Test that the cache keeps only small keys, up to its size limit"""
+        limit = content_models._WORD_COUNT_CACHE_SIZE
+        for i in range(limit + 50):
+            Section(title='Section', content=f'word {i} ' * 10).get_word_count()
+        
+        cache = content_models._word_counts
+        self.assertLessEqual(len(cache), limit)
+        for key, count in cache.items():
+            self.assertEqual([type(part) for part in key], [int, int])
+            self.assertIsInstance(count, int)
+
+class TestSlots(unittest.TestCase):
+    """Test cases for the slotted content model dataclasses"""
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_instances_have_no_dict(self):
+        """Test that the models generate __slots__ instead of a __dict__"""
+        course = _sample_course()
+        for obj in (course, course.sections[0], course.sections[0].examples[0],
+                    course.learning_objectives[0],
+                    ContentTemplate('Guide', 'A guide', ContentType.GUIDE)):
+            with self.subTest(model=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    obj.unknown_attribute = 1
+
+class TestCourseJSON(unittest.TestCase):
+    """Test cases for Course.to_json and Course.from_json"""
+    
+    def test_to_json_matches_to_dict_with_each_encoder(self):
+        """Test that msgspec, orjson and the stdlib encode the same document"""
+        course = _sample_course()
+        for encoder in each_encoder():
+            with self.subTest(encoder=encoder):
+                self.assertEqual(json.loads(course.to_json()), course.to_dict())
+    
+    def test_aware_utc_timestamps_round_trip_with_each_encoder(self):
+        """Test that from_dict reads the UTC offset every encoder writes"""
+        course = _sample_course()
+        course.created_at = course.updated_at = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+        for encoder in each_encoder():
+            data = json.loads(course.to_json())
+            for use_msgspec in (True, False):
+                with self.subTest(encoder=encoder, msgspec=use_msgspec), \
+                        patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                    self.assertEqual(Course.from_dict(data), course)
+    
+    def test_from_json_round_trip_on_both_paths(self):
+        """Test that from_json rebuilds the course with and without msgspec"""
+        course = _sample_course()
+        encoded = course.to_json()
+        self.assertEqual(Course.from_json(encoded), course)
+        with patch('models.content_models.msgspec', None):
+            self.assertEqual(Course.from_json(encoded), course)
+            self.assertEqual(Course.from_json(encoded.decode('utf-8')), course)
+    
+    def test_malformed_json_raises_value_error(self):
+        """Test that both paths report malformed input as ValueError"""
+        for use_msgspec in (True, False):
+            with patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                with self.assertRaises(ValueError):
+                    Course.from_json(b'{"title": ')
+
+class TestSectionKeyPoints(unittest.TestCase):
+    """Test cases for adding key points to a section"""
+    
+    def test_add_key_points_matches_add_key_point(self):
+        """Test that the bulk insert keeps the one-at-a-time semantics"""
+        points = ['Names', '', 'Values', 'Names', 'Scope', 'Values']
+        bulk = Section(title='Intro', content='Text', key_points=['Scope'])
+        single = Section(title='Intro', content='Text', key_points=['Scope'])
+        bulk.add_key_points(points)
+        for point in points:
+            single.add_key_point(point)
+        
+        self.assertEqual(bulk.key_points, ['Scope', 'Names', 'Values'])
+        self.assertEqual(bulk.key_points, single.key_points)
+    
+    def test_add_key_points_accepts_any_iterable(self):
+        """Test that a generator of points can be added"""
+        section = Section(title='Intro', content='Text')
+        section.add_key_points(point.strip() for point in (' a ', 'b', ' a'))
+        self.assertEqual(section.key_points, ['a', 'b'])
+
+class TestRemoveSection(unittest.TestCase):
+    """Test cases for Course.remove_section"""
+    
+    def _course_with_sections(self, count):
+        """Build a course with numbered sections"""
+        course = Course(title='Python', description='A course')
+        for i in range(count):
+            course.add_section(Section(title=f'Section {i + 1}', content='Text'))
+        return course
+    
+    def test_sections_are_renumbered(self):
+        """Test that orders stay contiguous after removing any section"""
+        for index in range(4):
+            with self.subTest(index=index):
+                course = self._course_with_sections(4)
+                self.assertTrue(course.remove_section(index))
+                self.assertEqual([s.order for s in course.sections], [1, 2, 3])
+                self.assertNotIn(f'Section {index + 1}', [s.title for s in course.sections])
+    
+    def test_out_of_range_index(self):
+        """Test that invalid indexes leave the course unchanged"""
+        course = self._course_with_sections(2)
+        updated_at = course.updated_at
+        self.assertFalse(course.remove_section(2))
+        self.assertFalse(course.remove_section(-1))
+        self.assertEqual(course.get_section_count(), 2)
+        self.assertEqual(course.updated_at, updated_at)
+
+class TestLearningObjectiveLevels(unittest.TestCase):
+    """Test cases for the Bloom's taxonomy level validation"""
+    
+    def test_every_level_is_accepted(self):
+        """Test that each taxonomy level is valid"""
+        for level in ('remember', 'understand', 'apply', 'analyze', 'evaluate', 'create'):
+            with self.subTest(level=level):
+                self.assertEqual(LearningObjective('Objective', level=level).level, level)
+    
+    def test_unknown_level_lists_levels_in_order(self):
+        """Test the error message for an unknown level"""
+        with self.assertRaisesRegex(ValueError, "Learning level must be one of: remember, "
+                                                "understand, apply, analyze, evaluate, create$"):
+            LearningObjective('Objective', level='Apply')
+
+class TestSectionAndTemplateJSON(unittest.TestCase):
+    """Test cases for Section.to_json and ContentTemplate.to_json"""
+    
+    def test_to_json_matches_to_dict_with_each_encoder(self):
+        """Test that every encoder produces the to_dict document"""
+        section = _sample_course().sections[0]
+        section.metadata['reviewed'] = True
+        template = ContentTemplate('Guide', 'A guide', ContentType.GUIDE,
+                                   template_sections=[{'title': 'Intro', 'type': 'introduction'}],
+                                   default_objectives=['Understand the basics'],
+                                   suggested_tags=['guide'])
+        for encoder in each_encoder():
+            for obj in (section, template):
+                with self.subTest(encoder=encoder, model=type(obj).__name__):
+                    self.assertEqual(json.loads(obj.to_json()), obj.to_dict())
+
+class TestCourseTimestamps(unittest.TestCase):
+    """Test cases for the Course creation and update timestamps"""
+    
+    def test_updated_at_defaults_to_created_at(self):
+        """Test that a new course was last updated when it was created"""
+        course = Course(title='Python', description='A course')
+        self.assertIsInstance(course.created_at, datetime)
+        self.assertEqual(course.updated_at, course.created_at)
+        
+        created_at = datetime(2024, 1, 1, 12, 0)
+        course = Course(title='Python', description='A course', created_at=created_at)
+        self.assertEqual(course.updated_at, created_at)
+    
+    def test_explicit_updated_at_is_kept(self):
+        """Test that a given update time is not replaced"""
+        course = _sample_course()
+        self.assertEqual(course.updated_at, datetime(2024, 5, 2, 10, 0, 0, 250000))
+    
+    def test_from_dict_without_updated_at(self):
+        """Test that a stored course without updated_at uses created_at"""
+        data = _sample_course().to_dict()
+        del data['updated_at']
+        for use_msgspec in (True, False):
+            with patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                course = Course.from_dict(data)
+                self.assertEqual(course.updated_at, datetime(2024, 5, 1, 9, 30))
+    
+    def test_modifications_move_updated_at(self):
+        """Test that adding a section updates the timestamp"""
+        course = Course(title='Python', description='A course',
+                        created_at=datetime(2024, 1, 1))
+        course.add_section(Section(title='Intro', content='Text'))
+        self.assertGreater(course.updated_at, course.created_at)
+
+class TestNestedSerialization(unittest.TestCase):
+    """Test cases for serializing nested content models"""
+    
+    def test_nested_models_serialize_in_order(self):
+        """Test that sections, examples and objectives keep their order"""
+        course = _sample_course()
+        course.add_section(Section(title='Functions', content='def f(): pass'))
+        course.sections[0].add_example({'title': 'Reassign', 'description': 'Rebind x'})
+        course.add_learning_objective('Write functions')
+        data = course.to_dict()
+        
+        self.assertEqual([s['title'] for s in data['sections']], ['Variables', 'Functions'])
+        self.assertEqual([e['title'] for e in data['sections'][0]['examples']],
+                         ['Assignment', 'Reassign'])
+        self.assertEqual(data['sections'][1]['examples'], [])
+        self.assertEqual([o['text'] for o in data['learning_objectives']],
+                         ['Use variables', 'Write functions'])
+        self.assertEqual(Course.from_dict(data), course)
+
+class TestEnumCoercion(unittest.TestCase):
+    """Test cases for converting enum values in the content models"""
+    
+    def test_values_and_members_are_accepted(self):
+        """Test that value strings become members and members pass through"""
+        course = Course(title='Python', description='A course',
+                        content_type='tutorial', difficulty=DifficultyLevel.EXPERT)
+        self.assertIs(course.content_type, ContentType.TUTORIAL)
+        self.assertIs(course.difficulty, DifficultyLevel.EXPERT)
+        
+        section = Section(title='Intro', content='Text', format='html')
+        self.assertIs(section.format, ContentFormat.HTML)
+    
+    def test_unknown_values_raise(self):
+        """Test the error message for each unknown value"""
+        with self.assertRaisesRegex(ValueError, "Invalid content type: podcast"):
+            Course(title='Python', description='A course', content_type='podcast')
+        with self.assertRaisesRegex(ValueError, "Invalid difficulty level: easy"):
+            Course(title='Python', description='A course', difficulty='easy')
+        with self.assertRaisesRegex(ValueError, "Invalid content format: pdf"):
+            Section(title='Intro', content='Text', format='pdf')
+        with self.assertRaisesRegex(ValueError, "Invalid content format: HTML"):
+            Section(title='Intro', content='Text', format='HTML')
+
+class TestCourseTotals(unittest.TestCase):
+    """Test cases for the course-wide word count and reading time"""
+    
+    def test_totals_sum_the_sections(self):
+        """Test that totals add up the per-section values"""
+        course = Course(title='Python', description='A course')
+        self.assertEqual(course.get_total_word_count(), 0)
+        self.assertEqual(course.get_estimated_reading_time(), 0)
+        
+        course.add_section(Section(title='Short', content='one two three'))
+        course.add_section(Section(title='Long', content='word ' * 450))
+        self.assertEqual(course.get_total_word_count(), 453)
+        self.assertEqual(course.get_estimated_reading_time(), 1 + 2)
+
+class TestCourseMsgpack(unittest.TestCase):
+    """Test cases for Course MessagePack encoding"""
+    
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_round_trip(self):
+        """Test that from_msgpack rebuilds what to_msgpack stored"""
+        course = _sample_course()
+        encoded = course.to_msgpack()
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(Course.from_msgpack(encoded), course)
+    
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_invalid_data_raises_value_error(self):
+        """Test that undecodable bytes are reported as ValueError"""
+        with self.assertRaises(ValueError):
+            Course.from_msgpack(b'\xc1')
+        with self.assertRaises(ValueError):
+            Course.from_msgpack(msgspec.msgpack.encode({'title': 'No description'}))
+    
+    def test_requires_msgspec(self):
+        """Test that both directions raise ImportError without msgspec"""
+        course = _sample_course()
+        with patch('models.content_models.msgspec', None):
+            with self.assertRaisesRegex(ImportError, "msgspec is required"):
+                course.to_msgpack()
+            with self.assertRaisesRegex(ImportError, "msgspec is required"):
+                Course.from_msgpack(b'')
+
+class TestFromDictEnums(unittest.TestCase):
+    """Test cases for enum values read by the content from_dict methods"""
+    
+    def test_section_format(self):
+        """Test that Section.from_dict converts and validates the format"""
+        data = {'title': 'Intro', 'content': 'Text', 'format': 'plain_text'}
+        self.assertIs(Section.from_dict(data).format, ContentFormat.PLAIN_TEXT)
+        self.assertIs(Section.from_dict({'title': 'Intro', 'content': 'Text'}).format,
+                      ContentFormat.MARKDOWN)
+        with self.assertRaisesRegex(ValueError, "Invalid content format: docx"):
+            Section.from_dict(dict(data, format='docx'))
+    
+    def test_template_content_type(self):
+        """Test that ContentTemplate.from_dict converts and validates the content type"""
+        template = ContentTemplate('Guide', 'A guide', ContentType.GUIDE,
+                                   default_objectives=['Understand the basics'])
+        self.assertEqual(ContentTemplate.from_dict(template.to_dict()), template)
+        with self.assertRaisesRegex(ValueError, "Invalid content type: book"):
+            ContentTemplate.from_dict(dict(template.to_dict(), content_type='book'))
+    
+    def test_course_defaults(self):
+        """Test the default content type and difficulty of a stored course"""
+        for use_msgspec in (True, False):
+            with patch('models.content_models.msgspec', msgspec if use_msgspec else None):
+                course = Course.from_dict({'title': 'Python', 'description': 'A course'})
+                self.assertIs(course.content_type, ContentType.COURSE)
+                self.assertIs(course.difficulty, DifficultyLevel.INTERMEDIATE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -215,6 +215,21 @@ class TestOpenAIMiddleware(unittest.TestCase):
         """Test that OpenAI middleware module exists"""
         self.assertIsNotNone(self.openai_mw, "openai_mw module should exist")
     
+    def test_middleware_sends_cors_headers(self):
+        """Test that the legacy server allows its frontend origin"""
+        if not self.openai_mw:
+            self.skipTest("openai_mw module not available")
+        
+        client = self.openai_mw.app.test_client()
+        response = client.options('/', headers={
+            'Origin': self.openai_mw.CORS_ORIGIN,
+            'Access-Control-Request-Method': 'POST',
+            'Access-Control-Request-Headers': 'Content-Type'
+        })
+        self.assertEqual(response.headers['Access-Control-Allow-Origin'], self.openai_mw.CORS_ORIGIN)
+        self.assertIn('POST', response.headers['Access-Control-Allow-Methods'])
+        self.assertEqual(response.headers['Access-Control-Allow-Headers'], 'Content-Type')
+    
     @patch('openai.Completion.create')
     def test_openai_request_formatting(self, mock_openai):
         """Test that OpenAI requests are properly formatted"""
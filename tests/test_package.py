@@ -0,0 +1,230 @@
+"""
+Unit tests for the package entry points (__init__.py and models/__init__.py)
+
+This module tests the lazily resolved public names of both packages,
+the dependency check and the package-wide constants.
+"""
+
+import unittest
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_PACKAGE_NAME = 'ai_learning_generator'
+
+# Imports the project root under its distribution name, as installed
+_LOAD_PACKAGE = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    {_PACKAGE_NAME!r}, {os.path.join(_PROJECT_ROOT, '__init__.py')!r},
+    submodule_search_locations=[{_PROJECT_ROOT!r}])
+package = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = package
+spec.loader.exec_module(package)
+"""
+
+def _load_package():
+    """Import a fresh copy of the project root package"""
+    namespace = {}
+    exec(_LOAD_PACKAGE, namespace)
+    return namespace['package']
+
+def _unload_package():
+    """Drop the package and its submodules from sys.modules"""
+    for name in list(sys.modules):
+        if name == _PACKAGE_NAME or name.startswith(_PACKAGE_NAME + '.'):
+            del sys.modules[name]
+
+def _run(code):
+    """Run code in a fresh interpreter from the project root"""
+    return subprocess.run([sys.executable, '-c', code], cwd=_PROJECT_ROOT,
+                          capture_output=True, text=True)
+
+class TestPackageLazyExports(unittest.TestCase):
+    """Test cases for the names the package resolves on first access"""
+    
+    def setUp(self):
+        """Import a fresh copy of the package"""
+        self.addCleanup(_unload_package)
+        self.package = _load_package()
+    
+    def test_every_public_name_resolves(self):
+        """Test that each name in __all__ is defined or lazily importable"""
+        for name in self.package.__all__:
+            with self.subTest(name=name):
+                try:
+                    value = getattr(self.package, name)
+                except ModuleNotFoundError as e:
+                    # Optional third-party dependencies of the utilities
+                    if e.name.split('.')[0] in (_PACKAGE_NAME, 'models', 'utils'):
+                        raise
+                    self.skipTest(f"{e.name} is not installed")
+                self.assertIsNotNone(value)
+                # Cached on the module, so later lookups skip __getattr__
+                self.assertIn(name, vars(self.package))
+    
+    def test_lazy_names_match_the_submodules(self):
+        """Test that lazily resolved names are the submodule objects"""
+        self.assertIs(self.package.Quiz,
+                      sys.modules[f'{_PACKAGE_NAME}.models.quiz_models'].Quiz)
+        self.assertIs(self.package.TestingConfig,
+                      sys.modules[f'{_PACKAGE_NAME}.config'].TestingConfig)
+    
+    def test_every_lazy_name_is_public(self):
+        """Test that the lazy import table and __all__ agree"""
+        self.assertLessEqual(set(self.package._LAZY_IMPORTS), set(self.package.__all__))
+    
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError, as hasattr expects"""
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'missing'"):
+            self.package.missing
+        self.assertFalse(hasattr(self.package, 'missing'))
+    
+    def test_dir_lists_lazy_names(self):
+        """Test that dir() includes names that are not imported yet"""
+        names = dir(self.package)
+        self.assertNotIn('create_app', vars(self.package))
+        for name in self.package.__all__:
+            with self.subTest(name=name):
+                self.assertIn(name, names)
+        self.assertEqual(names, sorted(names))
+    
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that metadata access does not import Flask, openai or the submodules"""
+        result = _run(_LOAD_PACKAGE + """
+package.get_package_info()
+package.get_version()
+dir(package)
+loaded = [name for name in ('flask', 'openai', 'pandas', 'ai_learning_generator.app',
+                            'ai_learning_generator.models')
+          if name in sys.modules]
+print(','.join(loaded))
+""")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '')
+
+class TestCheckDependencies(unittest.TestCase):
+    """Test cases for check_dependencies"""
+    
+    def setUp(self):
+        """Import a fresh copy of the package, so the result is not cached yet"""
+        self.addCleanup(_unload_package)
+        self.package = _load_package()
+        patcher = patch('importlib.util.find_spec', return_value=object())
+        self.find_spec = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_probes_module_names_without_importing(self):
+        """Test that each package is looked up by module name through find_spec"""
+        self.assertTrue(self.package.check_dependencies())
+        
+        probed = [c.args[0] for c in self.find_spec.call_args_list]
+        self.assertEqual(probed, list(self.package._REQUIRED_PACKAGES.values()))
+        self.assertIn('dotenv', probed)
+        self.assertIn('yaml', probed)
+    
+    def test_success_is_cached(self):
+        """Test that a passed check is not repeated"""
+        self.assertFalse(self.package._DEPS_OK)
+        self.package.check_dependencies()
+        self.package.check_dependencies()
+        
+        self.assertTrue(self.package._DEPS_OK)
+        self.assertEqual(self.find_spec.call_count, len(self.package._REQUIRED_PACKAGES))
+    
+    def test_missing_packages_raise_import_error(self):
+        """Test that missing packages are named by distribution and not cached"""
+        missing = {'pandas', 'dotenv'}
+        self.find_spec.side_effect = lambda name: None if name in missing else object()
+        
+        with self.assertRaisesRegex(ImportError, "pip install python-dotenv pandas$"):
+            self.package.check_dependencies()
+        self.assertFalse(self.package._DEPS_OK)
+        
+        self.find_spec.side_effect = None
+        self.assertTrue(self.package.check_dependencies())
+
+class TestConstants(unittest.TestCase):
+    """Test cases for the read-only package-wide constants"""
+    
+    def setUp(self):
+        """Import a fresh copy of the package"""
+        self.addCleanup(_unload_package)
+        self.package = _load_package()
+    
+    def test_mappings_are_read_only(self):
+        """Test that the constant mappings reject assignment and deletion"""
+        for name in ('ENVIRONMENTS', 'FEATURES', 'DEFAULT_CONFIG'):
+            mapping = getattr(self.package, name)
+            key = next(iter(mapping))
+            with self.subTest(name=name):
+                with self.assertRaises(TypeError):
+                    mapping[key] = 'changed'
+                with self.assertRaises(TypeError):
+                    del mapping[key]
+                self.assertFalse(hasattr(mapping, 'update'))
+    
+    def test_sequences_are_tuples(self):
+        """Test that the supported languages and models cannot be appended to"""
+        self.assertIsInstance(self.package.SUPPORTED_LANGUAGES, tuple)
+        self.assertIsInstance(self.package.SUPPORTED_MODELS, tuple)
+        self.assertIn('it', self.package.SUPPORTED_LANGUAGES)
+    
+    def test_values_read_like_dicts(self):
+        """Test that lookups and iteration behave as with the former dicts"""
+        self.assertEqual(self.package.DEFAULT_CONFIG['DEFAULT_LANGUAGE'], 'en')
+        self.assertIs(self.package.FEATURES.get('social_login'), False)
+        self.assertEqual(list(self.package.ENVIRONMENTS),
+                         ['development', 'testing', 'production', 'default'])
+        self.assertEqual(dict(self.package.DEFAULT_CONFIG)['API_VERSION'], 'v1')
+    
+    def test_version_info(self):
+        """Test that the version constants agree"""
+        self.assertEqual(self.package.VERSION, self.package.get_version())
+        self.assertEqual('.'.join(map(str, self.package.VERSION_INFO)), self.package.VERSION)
+
+class TestModelsLazyExports(unittest.TestCase):
+    """Test cases for the models resolved on first access"""
+    
+    def test_every_public_name_resolves(self):
+        """Test that each name in __all__ is the class from its model module"""
+        import models
+        
+        self.assertEqual(set(models.__all__), set(models._LAZY_IMPORTS))
+        for name in models.__all__:
+            with self.subTest(name=name):
+                value = getattr(models, name)
+                module = sys.modules[f'models{models._LAZY_IMPORTS[name]}']
+                self.assertIs(value, getattr(module, name))
+                self.assertIn(name, dir(models))
+    
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError"""
+        import models
+        
+        with self.assertRaisesRegex(AttributeError, "module 'models' has no attribute 'Lesson'"):
+            models.Lesson
+        self.assertFalse(hasattr(models, 'Lesson'))
+    
+    def test_import_loads_only_the_requested_module(self):
+        """Test that importing the package loads no model module until one is used"""
+        result = _run("""
+import sys
+import models
+dir(models)
+before = [name for name in sys.modules if name.startswith('models.')]
+models.Quiz
+after = [name for name in sys.modules if name.startswith('models.')]
+print(sorted(before), sorted(after))
+""")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(),
+                         "[] ['models._compat', 'models.quiz_models']")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,417 @@
+"""
+Unit tests for the quiz data models (models/quiz_models.py)
+
+This module tests question and quiz construction, grading of quiz
+attempts, aggregated results, and dictionary and JSON serialization.
+"""
+
+import json
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.quiz_models import (
+    Answer, DifficultyLevel, Question, QuestionType, Quiz, QuizAttempt, QuizResult
+)
+from tests.helpers import each_encoder
+
+def _sample_quiz() -> Quiz:
+    """Build a quiz with one question of each graded kind"""
+    single = Question('What does len() return?', points=2, topic='builtins')
+    single.add_answer('The size of a container', is_correct=True)
+    single.add_answer('The last element')
+    
+    multiple = Question('Which are mutable?', question_type=QuestionType.MULTIPLE_CHOICE,
+                        difficulty=DifficultyLevel.ADVANCED, points=3)
+    multiple.add_answer('list', is_correct=True)
+    multiple.add_answer('tuple')
+    multiple.add_answer('dict', is_correct=True)
+    
+    true_false = Question('Strings are immutable', question_type=QuestionType.TRUE_FALSE)
+    true_false.add_answer('True', is_correct=True, explanation='str has no setters')
+    true_false.add_answer('False')
+    
+    return Quiz(
+        title='Python Basics',
+        description='Check the basics',
+        questions=[single, multiple, true_false],
+        topic='python',
+        passing_score=60,
+        created_at=datetime(2024, 5, 1, 9, 30),
+        updated_at=datetime(2024, 5, 2, 10, 0, 0, 250000),
+        metadata={'source': 'test'}
+    )
+
+class TestSlots(unittest.TestCase):
+    """Test cases for the slotted quiz model dataclasses"""
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_instances_have_no_dict(self):
+        """Test that the models generate __slots__ instead of a __dict__"""
+        quiz = _sample_quiz()
+        attempt = QuizAttempt('user_1', 'quiz_1', {}, datetime.now())
+        for obj in (quiz, quiz.questions[0], quiz.questions[0].answers[0],
+                    attempt, QuizResult('quiz_1')):
+            with self.subTest(model=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    obj.unknown_attribute = 1
+
+class TestQuizJSON(unittest.TestCase):
+    """Test cases for Quiz.to_json"""
+    
+    def test_to_json_matches_to_dict_with_each_encoder(self):
+        """Test that msgspec, orjson and the stdlib encode the same document"""
+        quiz = _sample_quiz()
+        quiz.questions[0].time_limit = 30
+        for encoder in each_encoder():
+            with self.subTest(encoder=encoder):
+                encoded = quiz.to_json()
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), quiz.to_dict())
+
+    def test_aware_utc_timestamps_round_trip_with_each_encoder(self):
+        """Test that from_dict reads the UTC offset every encoder writes"""
+        created_at = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+        quiz = _sample_quiz()
+        quiz.created_at = created_at
+        quiz.updated_at = created_at + timedelta(minutes=5)
+        for encoder in each_encoder():
+            with self.subTest(encoder=encoder):
+                data = json.loads(quiz.to_json())
+                self.assertEqual(Quiz.from_dict(data), quiz)
+                self.assertEqual(Quiz.from_dict_fast(data), quiz)
+
+class TestFromDictFast(unittest.TestCase):
+    """Test cases for the unvalidated from_dict_fast constructors"""
+    
+    def test_matches_from_dict_on_to_dict_output(self):
+        """Test that trusted data builds the same objects as from_dict"""
+        quiz = _sample_quiz()
+        data = quiz.to_dict()
+        self.assertEqual(Quiz.from_dict_fast(data), quiz)
+        self.assertEqual(Quiz.from_dict_fast(data), Quiz.from_dict(data))
+        
+        question_data = quiz.questions[1].to_dict()
+        self.assertEqual(Question.from_dict_fast(question_data), Question.from_dict(question_data))
+        answer_data = quiz.questions[2].answers[0].to_dict()
+        self.assertEqual(Answer.from_dict_fast(answer_data), Answer.from_dict(answer_data))
+    
+    def test_defaults_match_from_dict(self):
+        """Test the defaults for omitted keys"""
+        data = {'title': 'Minimal', 'created_at': '2024-01-01T08:00:00',
+                'questions': [{'text': 'Anything?', 'answers': [{'text': 'Yes'}]}]}
+        fast = Quiz.from_dict_fast(data)
+        self.assertEqual(fast, Quiz.from_dict(data))
+        self.assertEqual(fast.updated_at, fast.created_at)
+        self.assertIs(fast.questions[0].question_type, QuestionType.MULTIPLE_CHOICE)
+    
+    def test_skips_validation(self):
+        """Test that values from_dict rejects are not checked"""
+        data = dict(_sample_quiz().to_dict(), passing_score=150)
+        with self.assertRaises(ValueError):
+            Quiz.from_dict(data)
+        self.assertEqual(Quiz.from_dict_fast(data).passing_score, 150)
+
+class TestFromDictEnums(unittest.TestCase):
+    """Test cases for enum values read by the quiz from_dict methods"""
+    
+    def test_values_are_converted(self):
+        """Test that stored value strings become enum members"""
+        question = Question.from_dict({'text': 'True?', 'question_type': 'true_false',
+                                       'difficulty': 'expert'})
+        self.assertIs(question.question_type, QuestionType.TRUE_FALSE)
+        self.assertIs(question.difficulty, DifficultyLevel.EXPERT)
+        self.assertIs(Quiz.from_dict({'title': 'Quiz', 'difficulty': 'beginner'}).difficulty,
+                      DifficultyLevel.BEGINNER)
+    
+    def test_unknown_values_raise_value_error(self):
+        """Test that unknown values are reported with the models' messages"""
+        with self.assertRaisesRegex(ValueError, "Invalid question type: essay"):
+            Question.from_dict({'text': 'Why?', 'question_type': 'essay'})
+        with self.assertRaisesRegex(ValueError, "Invalid difficulty level: trivial"):
+            Question.from_dict({'text': 'Why?', 'difficulty': 'trivial'})
+        with self.assertRaisesRegex(ValueError, "Invalid difficulty level: trivial"):
+            Quiz.from_dict({'title': 'Quiz', 'difficulty': 'trivial'})
+
+class TestCorrectAnswers(unittest.TestCase):
+    """Test cases for looking up a question's correct answers"""
+    
+    def test_correct_answer_set_matches_indices(self):
+        """Test that the set holds the same indices as the list"""
+        for question in _sample_quiz().questions:
+            with self.subTest(question=question.text):
+                self.assertEqual(question.get_correct_answer_set(),
+                                 frozenset(question.get_correct_answer_indices()))
+        self.assertEqual(_sample_quiz().questions[1].get_correct_answer_set(), {0, 2})
+        self.assertEqual(Question('No answers yet').get_correct_answer_set(), frozenset())
+    
+    def test_multiple_selection_must_match_exactly(self):
+        """Test that a list answer earns points only for the exact set, in any order"""
+        quiz = Quiz(title='Mutability', questions=[_sample_quiz().questions[1]])
+        for answer, expected in (([2, 0], 100), ([0, 2, 2], 100), ([0], 0), ([0, 1, 2], 0)):
+            with self.subTest(answer=answer):
+                attempt = QuizAttempt('user_1', 'quiz_1', {0: answer}, datetime.now())
+                attempt.complete_attempt(quiz)
+                self.assertEqual(attempt.score, expected)
+
+class TestQuizResult(unittest.TestCase):
+    """Test cases for aggregating attempts into a QuizResult"""
+    
+    def _attempt(self, score, passed=None, time_taken=60):
+        """Build a completed attempt with the given score"""
+        return QuizAttempt('user_1', 'quiz_1', {}, datetime(2024, 1, 1, 10, 0),
+                           end_time=datetime(2024, 1, 1, 10, 1), score=score,
+                           passed=passed, time_taken=time_taken)
+    
+    def test_difficulty_rating_bands(self):
+        """Test the rating at and around each score threshold"""
+        cases = ((0.0, 5.0), (40.0, 5.0), (40.5, 4.0), (60.0, 4.0), (60.5, 3.0),
+                 (80.0, 3.0), (80.5, 2.0), (100.0, 2.0))
+        for score, rating in cases:
+            with self.subTest(score=score):
+                result = QuizResult('quiz_1')
+                result.update_from_attempts([self._attempt(score)])
+                self.assertEqual(result.difficulty_rating, rating)
+    
+    def test_aggregates(self):
+        """Test the counts, averages and pass rate"""
+        unfinished = QuizAttempt('user_2', 'quiz_1', {}, datetime(2024, 1, 1))
+        result = QuizResult('quiz_1')
+        result.update_from_attempts([self._attempt(90.0, True, 30),
+                                     self._attempt(50.0, False, 90),
+                                     unfinished])
+        self.assertEqual(result.total_attempts, 3)
+        self.assertEqual(result.total_completions, 2)
+        self.assertEqual(result.average_score, 70.0)
+        self.assertEqual(result.average_time, 60.0)
+        self.assertEqual(result.pass_rate, 50.0)
+        self.assertEqual(result.difficulty_rating, 3.0)
+    
+    def test_no_attempts_leaves_result_unchanged(self):
+        """Test that an empty list is ignored"""
+        result = QuizResult('quiz_1')
+        result.update_from_attempts([])
+        self.assertEqual(result, QuizResult('quiz_1'))
+
+class TestQuizTimestamps(unittest.TestCase):
+    """Test cases for the Quiz creation and update timestamps"""
+    
+    def test_updated_at_defaults_to_created_at(self):
+        """Test that a new quiz was last updated when it was created"""
+        quiz = Quiz(title='Quiz')
+        self.assertEqual(quiz.updated_at, quiz.created_at)
+        
+        stored = Quiz.from_dict({'title': 'Quiz', 'created_at': '2024-01-01T08:00:00'})
+        self.assertEqual(stored.updated_at, datetime(2024, 1, 1, 8, 0))
+    
+    def test_explicit_updated_at_is_kept(self):
+        """Test that a given update time is not replaced"""
+        quiz = _sample_quiz()
+        self.assertEqual(quiz.updated_at, datetime(2024, 5, 2, 10, 0, 0, 250000))
+        self.assertEqual(Quiz.from_dict(quiz.to_dict()).updated_at, quiz.updated_at)
+    
+    def test_modifications_move_updated_at(self):
+        """Test that adding and removing questions updates the timestamp"""
+        quiz = Quiz(title='Quiz', created_at=datetime(2024, 1, 1))
+        quiz.add_question({'text': 'Anything?'})
+        self.assertGreater(quiz.updated_at, quiz.created_at)
+        
+        quiz.updated_at = quiz.created_at
+        self.assertTrue(quiz.remove_question(0))
+        self.assertGreater(quiz.updated_at, quiz.created_at)
+
+class TestQuizPoints(unittest.TestCase):
+    """Test cases for quiz point totals in grading"""
+    
+    def test_score_is_a_share_of_total_points(self):
+        """Test that questions are weighted by their points"""
+        quiz = _sample_quiz()
+        self.assertEqual(quiz.get_total_points(), 6)
+        
+        attempt = QuizAttempt('user_1', 'quiz_1', {0: 0, 2: 0}, datetime.now())
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 3 / 6 * 100)
+        self.assertFalse(attempt.passed)
+        
+        attempt.submit_answer(1, [0, 2])
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 100)
+        self.assertTrue(attempt.passed)
+    
+    def test_quiz_without_points_scores_zero(self):
+        """Test that a quiz worth no points does not divide by zero"""
+        question = Question('Warm-up', points=0, answers=[Answer('Ok', is_correct=True)])
+        quiz = Quiz(title='Warm-up', questions=[question], passing_score=0)
+        attempt = QuizAttempt('user_1', 'quiz_1', {0: 0}, datetime.now())
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 0)
+        self.assertTrue(attempt.passed)
+
+class TestCompleteAttempt(unittest.TestCase):
+    """Test cases for grading only the submitted answers"""
+    
+    def test_unanswered_and_out_of_range_answers_earn_nothing(self):
+        """Test that answers to questions the quiz does not have are ignored"""
+        quiz = _sample_quiz()
+        attempt = QuizAttempt('user_1', 'quiz_1', {0: 0, 3: 0, -1: 0, '2': 0}, datetime.now())
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 2 / 6 * 100)
+    
+    def test_unsupported_answer_types_earn_nothing(self):
+        """Test that text and tuple answers are not graded"""
+        quiz = _sample_quiz()
+        attempt = QuizAttempt('user_1', 'quiz_1', {0: 'The size of a container', 1: (0, 2)},
+                              datetime.now())
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 0)
+    
+    def test_int_subclasses_are_graded_as_ints(self):
+        """Test that bool keys and answers are graded as before"""
+        quiz = _sample_quiz()
+        attempt = QuizAttempt('user_1', 'quiz_1', {False: False, True: [False, 2]}, datetime.now())
+        attempt.complete_attempt(quiz)
+        self.assertEqual(attempt.score, 5 / 6 * 100)
+    
+    def test_timing_is_recorded(self):
+        """Test that completing an attempt records the end and elapsed times"""
+        start_time = datetime(2024, 1, 1, 10, 0)
+        attempt = QuizAttempt('user_1', 'quiz_1', {}, start_time)
+        attempt.complete_attempt(_sample_quiz())
+        self.assertGreater(attempt.end_time, start_time)
+        self.assertEqual(attempt.time_taken,
+                         int((attempt.end_time - start_time).total_seconds()))
+        self.assertEqual(attempt.score, 0)
+        self.assertFalse(attempt.passed)
+
+class TestQuestionValidity(unittest.TestCase):
+    """Test cases for Question.is_valid and Quiz.is_valid"""
+    
+    def _question(self, question_type, *correct_flags):
+        """Build a question with one answer per flag"""
+        question = Question('Pick one', question_type=question_type)
+        for i, is_correct in enumerate(correct_flags):
+            question.add_answer(f'Option {i}', is_correct=is_correct)
+        return question
+    
+    def test_rules_per_question_type(self):
+        """Test the answer count rules of each question type"""
+        cases = (
+            (QuestionType.MULTIPLE_CHOICE, (True, False), True),
+            (QuestionType.MULTIPLE_CHOICE, (True, False, False, False), True),
+            (QuestionType.MULTIPLE_CHOICE, (True,), False),
+            (QuestionType.MULTIPLE_CHOICE, (True, True, False), False),
+            (QuestionType.MULTIPLE_CHOICE, (False, False), False),
+            (QuestionType.TRUE_FALSE, (False, True), True),
+            (QuestionType.TRUE_FALSE, (True, False, False), False),
+            (QuestionType.TRUE_FALSE, (True, True), False),
+            (QuestionType.FILL_IN_BLANK, (False, True, True), True),
+            (QuestionType.FILL_IN_BLANK, (False,), False),
+            (QuestionType.ORDERING, (False,), True),
+            (QuestionType.MATCHING, (), False),
+        )
+        for question_type, flags, expected in cases:
+            with self.subTest(question_type=question_type.value, flags=flags):
+                self.assertIs(self._question(question_type, *flags).is_valid(), expected)
+    
+    def test_quiz_validity(self):
+        """Test that a quiz needs questions and every question must be valid"""
+        self.assertFalse(Quiz(title='Empty').is_valid())
+        quiz = _sample_quiz()
+        self.assertFalse(quiz.is_valid())
+        quiz.remove_question(1)
+        self.assertTrue(quiz.is_valid())
+
+class TestTimestampFormatting(unittest.TestCase):
+    """Test cases for the memoized timestamp formatting in Quiz.to_dict"""
+    
+    def test_naive_timestamps(self):
+        """Test that cached and fresh formatting agree"""
+        quiz = _sample_quiz()
+        for _ in range(2):
+            data = quiz.to_dict()
+            self.assertEqual(data['created_at'], '2024-05-01T09:30:00')
+            self.assertEqual(data['updated_at'], '2024-05-02T10:00:00.250000')
+    
+    def test_equal_aware_timestamps_keep_their_offsets(self):
+        """Test that equal instants in different zones are not served from the cache"""
+        utc = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        rome = utc.astimezone(timezone(timedelta(hours=2)))
+        self.assertEqual(utc, rome)
+        
+        first = Quiz(title='Quiz', created_at=utc).to_dict()
+        second = Quiz(title='Quiz', created_at=rome).to_dict()
+        self.assertEqual(first['created_at'], '2024-05-01T12:00:00+00:00')
+        self.assertEqual(second['created_at'], '2024-05-01T14:00:00+02:00')
+
+class TestQuizFromDict(unittest.TestCase):
+    """Test cases for Question.from_dict and Quiz.from_dict"""
+    
+    def test_round_trip(self):
+        """Test that from_dict rebuilds what to_dict produced"""
+        quiz = _sample_quiz()
+        quiz.max_attempts = 3
+        quiz.shuffle_answers = True
+        self.assertEqual(Quiz.from_dict(quiz.to_dict()), quiz)
+    
+    def test_defaults(self):
+        """Test the values used for omitted keys"""
+        question = Question.from_dict({'text': 'Anything?'})
+        self.assertEqual(question, Question('Anything?'))
+        
+        quiz = Quiz.from_dict({'title': 'Quiz', 'created_at': '2024-01-01T08:00:00'})
+        self.assertEqual(quiz, Quiz('Quiz', created_at=datetime(2024, 1, 1, 8, 0)))
+    
+    def test_missing_required_keys_raise_key_error(self):
+        """Test that text and title are required"""
+        with self.assertRaises(KeyError):
+            Question.from_dict({'points': 1})
+        with self.assertRaises(KeyError):
+            Quiz.from_dict({'questions': []})
+
+class TestNestedSerialization(unittest.TestCase):
+    """Test cases for serializing questions and answers inside a quiz"""
+    
+    def test_nested_models_serialize_in_order(self):
+        """Test that questions and answers keep their order and fields"""
+        data = _sample_quiz().to_dict()
+        self.assertEqual([q['question_type'] for q in data['questions']],
+                         ['multiple_choice', 'multiple_choice', 'true_false'])
+        self.assertEqual([a['text'] for a in data['questions'][1]['answers']],
+                         ['list', 'tuple', 'dict'])
+        self.assertEqual(data['questions'][2]['answers'][0],
+                         {'text': 'True', 'is_correct': True,
+                          'explanation': 'str has no setters', 'order': 0})
+    
+    def test_empty_quiz(self):
+        """Test that a quiz without questions serializes an empty list"""
+        self.assertEqual(Quiz(title='Empty').to_dict()['questions'], [])
+        self.assertEqual(Question('No answers').to_dict()['answers'], [])
+
+class TestEnumCoercion(unittest.TestCase):
+    """Test cases for converting enum values in the quiz constructors"""
+    
+    def test_values_and_members_are_accepted(self):
+        """Test that value strings become members and members pass through"""
+        question = Question('Order these', question_type='ordering',
+                            difficulty=DifficultyLevel.BEGINNER)
+        self.assertIs(question.question_type, QuestionType.ORDERING)
+        self.assertIs(question.difficulty, DifficultyLevel.BEGINNER)
+        self.assertIs(Quiz(title='Quiz', difficulty='advanced').difficulty,
+                      DifficultyLevel.ADVANCED)
+    
+    def test_unknown_values_raise(self):
+        """Test the error message for each unknown value"""
+        with self.assertRaisesRegex(ValueError, "Invalid question type: essay"):
+            Question('Why?', question_type='essay')
+        with self.assertRaisesRegex(ValueError, "Invalid difficulty level: Expert"):
+            Question('Why?', difficulty='Expert')
+        with self.assertRaisesRegex(ValueError, "Invalid difficulty level: hard"):
+            Quiz(title='Quiz', difficulty='hard')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the msgspec schemas (models/schemas.py)
+
+This module tests decoding generated quiz content and course outlines
+into the typed schemas, and the error raised when msgspec is not
+installed.
+"""
+
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+# Add parent directory to path
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, _PROJECT_ROOT)
+
+from models._compat import msgspec
+from models.content_models import Course, DifficultyLevel, Section
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class TestQuizResponse(unittest.TestCase):
+    """Test cases for the generated quiz content schema"""
+    
+    def test_decode_generated_content(self):
+        """Test that well-formed content decodes into typed questions"""
+        from models.schemas import GeneratedQuestion, QuizResponse
+        
+        content = json.dumps({
+            'topic': 'Python',
+            'sintesi': 'Python is a programming language.',
+            'questionario': [{
+                'domanda': 'Who created Python?',
+                'risposte': {'A': 'Guido van Rossum', 'B': 'Dennis Ritchie'},
+                'risposta_corretta': 'A'
+            }]
+        })
+        quiz = msgspec.json.decode(content, type=QuizResponse)
+        
+        self.assertEqual(quiz.topic, 'Python')
+        self.assertIsInstance(quiz.questionario[0], GeneratedQuestion)
+        self.assertEqual(quiz.questionario[0].risposta_corretta, 'A')
+    
+    def test_decode_rejects_content_missing_fields(self):
+        """Test that content without the questionnaire fails validation"""
+        from models.schemas import QuizResponse
+        
+        with self.assertRaises(msgspec.ValidationError):
+            msgspec.json.decode(b'{"topic": "Python", "sintesi": "..."}', type=QuizResponse)
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class TestCourseOutline(unittest.TestCase):
+    """Test cases for the lazily decoded course outline"""
+    
+    def setUp(self):
+        """Set up a course with two sections"""
+        self.sections = [
+            Section(title='Introduction', content='What this course covers.', order=1),
+            Section(title='Variables', content='Names refer to objects.', order=2,
+                    key_points=['Assignment binds a name'])
+        ]
+        self.course = Course(
+            title='Python Basics',
+            description='An introduction to Python',
+            difficulty=DifficultyLevel.BEGINNER,
+            sections=self.sections
+        )
+    
+    def test_outline_decodes_scalar_fields(self):
+        """Test that the outline carries the course's scalar fields"""
+        from models.schemas import CourseOutline
+        
+        outline = CourseOutline.from_json(self.course.to_json())
+        self.assertEqual(outline.title, 'Python Basics')
+        self.assertEqual(outline.difficulty, DifficultyLevel.BEGINNER)
+        self.assertEqual(outline.get_section_count(), 2)
+    
+    def test_get_section_decodes_one_section(self):
+        """Test that a section decodes to the original Section"""
+        from models.schemas import CourseOutline
+        
+        outline = CourseOutline.from_json(self.course.to_json())
+        self.assertEqual(outline.get_section(1), self.sections[1])
+    
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed input raises ValueError"""
+        from models.schemas import CourseOutline
+        
+        with self.assertRaises(ValueError):
+            CourseOutline.from_json(b'{"title": ')
+        with self.assertRaises(ValueError):
+            CourseOutline.from_json(b'{"description": "No title"}')
+
+class TestSchemasWithoutMsgspec(unittest.TestCase):
+    """Test cases for importing the models without msgspec"""
+    
+    def _run_without_msgspec(self, code):
+        """Run code in a fresh interpreter where msgspec cannot be imported"""
+        return subprocess.run(
+            [sys.executable, '-c', "import sys; sys.modules['msgspec'] = None\n" + code],
+            cwd=_PROJECT_ROOT, capture_output=True, text=True
+        )
+    
+    def test_import_raises_clear_error(self):
+        """Test that importing the schemas names the missing dependency"""
+        result = self._run_without_msgspec("import models.schemas")
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("models.schemas requires msgspec", result.stderr)
+    
+    def test_model_modules_import_without_msgspec(self):
+        """Test that the other model modules do not need msgspec"""
+        result = self._run_without_msgspec(
+            "import models.api_models, models.content_models, "
+            "models.quiz_models, models.user_models"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the Batch API submitter (scripts/submit_batch.py)
+
+This module tests building the batch request file and matching the
+batch output back to the submitted parameter sets.
+"""
+
+import unittest
+import json
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import QuizGenerator
+from scripts.submit_batch import BATCH_ENDPOINT, build_batch_file, collect_results
+
+def _params(topic, **overrides):
+    """Build a valid parameter set for topic"""
+    return {'topic': topic, 'num_of_questions': '2', 'num_of_replies': '3',
+            'language': 'english', **overrides}
+
+def _output_line(index, text=None, status_code=200, error=None):
+    """Build one line of batch output"""
+    body = {'choices': [{'text': text}]} if text is not None else {'message': 'failed'}
+    return json.dumps({
+        'custom_id': str(index),
+        'response': {'status_code': status_code, 'body': body},
+        'error': error
+    })
+
+class TestBuildBatchFile(unittest.TestCase):
+    """Test cases for build_batch_file"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = QuizGenerator()
+    
+    def test_one_request_per_parameter_set(self):
+        """Test that every valid parameter set becomes a completion request"""
+        batch_file, invalid = build_batch_file([_params('Python'), _params('Rust')], self.generator)
+        
+        lines = [json.loads(line) for line in batch_file.decode('utf-8').splitlines()]
+        self.assertEqual(invalid, {})
+        self.assertEqual([line['custom_id'] for line in lines], ['0', '1'])
+        self.assertEqual(lines[0]['url'], BATCH_ENDPOINT)
+        self.assertEqual(lines[0]['body']['model'], self.generator.model)
+        self.assertIn('Python', lines[0]['body']['prompt'])
+        self.assertTrue(batch_file.endswith(b'\n'))
+    
+    def test_invalid_entries_are_left_out(self):
+        """Test that invalid parameter sets are reported instead of aborting the batch"""
+        params_list = [
+            _params('Python'),
+            _params('Rust', num_of_questions='0'),
+            _params('Go', language='klingon'),
+            _params('C', num_of_replies='many'),
+            _params('Java')
+        ]
+        
+        batch_file, invalid = build_batch_file(params_list, self.generator)
+        
+        lines = [json.loads(line) for line in batch_file.decode('utf-8').splitlines()]
+        self.assertEqual([line['custom_id'] for line in lines], ['0', '4'])
+        self.assertEqual(sorted(invalid), [1, 2, 3])
+        self.assertIn('questions', invalid[1])
+        self.assertIn('klingon', invalid[2])
+
+class TestCollectResults(unittest.TestCase):
+    """Test cases for collect_results"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = QuizGenerator()
+        self.client = MagicMock()
+        self.records = []
+        patcher = patch('scripts.submit_batch.write_line', side_effect=self.records.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _collect(self, params_list, output, status='completed', invalid=None):
+        """Run collect_results against a batch whose output file holds output"""
+        self.client.files.content.return_value.text = output
+        batch = SimpleNamespace(status=status, output_file_id='file_out' if output else None)
+        return collect_results(self.client, batch, params_list, self.generator, invalid)
+    
+    def test_results_are_parsed(self):
+        """Test that successful responses are parsed into quiz content"""
+        content = json.dumps({
+            'topic': 'Python',
+            'sintesi': 'Summary',
+            'questionario': []
+        })
+        
+        failed = self._collect([_params('Python')], _output_line(0, text=f' {content} '))
+        
+        self.assertEqual(failed, 0)
+        self.assertEqual(len(self.records), 1)
+        self.assertEqual(self.records[0]['index'], 0)
+        self.assertEqual(self.records[0]['result']['topic'], 'Python')
+        self.client.files.content.assert_called_once_with('file_out')
+    
+    def test_failed_responses_are_errors(self):
+        """Test that request errors and non-200 responses become error records"""
+        output = "\n".join([
+            _output_line(0, status_code=500),
+            '',
+            _output_line(1, error={'code': 'batch_expired'})
+        ])
+        
+        failed = self._collect([_params('Python'), _params('Rust')], output)
+        
+        self.assertEqual(failed, 2)
+        self.assertEqual([record['index'] for record in self.records], [0, 1])
+        self.assertIn('failed', self.records[0]['error'])
+        self.assertIn('batch_expired', self.records[1]['error'])
+    
+    def test_missing_output_is_reported(self):
+        """Test that requests without a result in the output are errors"""
+        params_list = [_params('Python'), _params('Rust'), _params('Go')]
+        
+        failed = self._collect(params_list, _output_line(1, status_code=500), status='expired')
+        
+        self.assertEqual(failed, 3)
+        missing = [record for record in self.records if record['index'] != 1]
+        self.assertEqual([record['index'] for record in missing], [0, 2])
+        for record in missing:
+            self.assertEqual(record['error'], 'No result in batch (status: expired)')
+    
+    def test_no_output_file(self):
+        """Test that a batch without an output file reports every request"""
+        failed = self._collect([_params('Python')], '', status='failed')
+        
+        self.assertEqual(failed, 1)
+        self.client.files.content.assert_not_called()
+        self.assertEqual(self.records[0]['error'], 'No result in batch (status: failed)')
+    
+    def test_invalid_entries_are_emitted(self):
+        """Test that entries left out of the batch are reported with their error"""
+        params_list = [_params('Python'), _params('Rust', language='klingon')]
+        _, invalid = build_batch_file(params_list, self.generator)
+        
+        failed = self._collect(params_list, _output_line(0, status_code=500), invalid=invalid)
+        
+        self.assertEqual(failed, 2)
+        self.assertEqual(len(self.records), 2)
+        invalid_record = next(record for record in self.records if record['index'] == 1)
+        self.assertEqual(invalid_record['params'], params_list[1])
+        self.assertIn('klingon', invalid_record['error'])
+
+if __name__ == '__main__':
+    unittest.main()
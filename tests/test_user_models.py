@@ -0,0 +1,434 @@
+"""
+Unit tests for the user data models (models/user_models.py)
+
+This module tests role permissions, skill queries, timestamp defaults,
+bulk loading and JSON encoding of the user models.
+"""
+
+import json
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import _compat
+from models._compat import msgspec
+from models.user_models import (
+    ActivityLog, LearningGoal, LearningProgress, SkillLevel, User, UserPreferences,
+    UserProfile, UserRole
+)
+from tests.helpers import each_encoder
+
+def _sample_user() -> User:
+    """Build a user with a populated profile and fixed timestamps"""
+    profile = UserProfile(
+        bio='Backend developer',
+        interests=['python', 'databases'],
+        skills={'python': SkillLevel.ADVANCED, 'sql': SkillLevel.BEGINNER,
+                'rust': SkillLevel.NOVICE},
+        learning_goals=[LearningGoal('Learn Rust', 'Finish the book',
+                                     target_completion_date=datetime(2024, 12, 31),
+                                     created_at=datetime(2024, 5, 1, 9, 30))],
+        preferences=UserPreferences(theme='dark')
+    )
+    return User('u1', 'dev', 'dev@example.com', role=UserRole.INSTRUCTOR, profile=profile,
+                last_login=datetime(2024, 5, 3, 8, 0, 0, 500),
+                created_at=datetime(2024, 5, 1, 9, 30),
+                metadata={'source': 'test'})
+
+class TestUserPermissions(unittest.TestCase):
+    """Test cases for User.has_permission"""
+    
+    def test_roles_inherit_lower_permissions(self):
+        """Test that each role has its own and the lower roles' permissions"""
+        admin = User('1', 'admin', 'admin@example.com', role=UserRole.ADMIN)
+        instructor = User('2', 'teacher', 'teacher@example.com', role='instructor')
+        student = User('3', 'student', 'student@example.com')
+        
+        self.assertTrue(admin.has_permission('manage_users'))
+        self.assertTrue(admin.has_permission('create_content'))
+        self.assertTrue(admin.has_permission('take_quizzes'))
+        self.assertFalse(instructor.has_permission('manage_users'))
+        self.assertTrue(instructor.has_permission('manage_quizzes'))
+        self.assertTrue(instructor.has_permission('view_content'))
+        self.assertFalse(student.has_permission('create_content'))
+        self.assertTrue(student.has_permission('track_progress'))
+        self.assertFalse(student.has_permission('unknown_permission'))
+    
+    def test_roles_without_permissions(self):
+        """Test that guests and non-role values have no permissions"""
+        guest = User('1', 'guest', 'guest@example.com', role=UserRole.GUEST)
+        self.assertFalse(guest.has_permission('view_content'))
+        
+        user = User('2', 'someone', 'someone@example.com')
+        user.role = None
+        self.assertFalse(user.has_permission('view_content'))
+
+class TestFromDictBatch(unittest.TestCase):
+    """Test cases for the bulk from_dict_batch constructors"""
+    
+    def _load_both_ways(self, cls, records):
+        """Load records with and without msgspec"""
+        loaded = cls.from_dict_batch(records)
+        with patch('models.user_models.msgspec', None):
+            fallback = cls.from_dict_batch(records)
+        return loaded, fallback
+    
+    def test_activity_logs_match_from_dict(self):
+        """Test that both paths load the same activity logs"""
+        records = [
+            ActivityLog('u1', 'login', 'Logged in', datetime(2024, 5, 1, 9, 30)).to_dict(),
+            {'user_id': 'u2', 'activity_type': 'quiz', 'description': 'Took a quiz',
+             'timestamp': datetime(2024, 5, 2, 10, 0), 'metadata': {'score': 90}},
+        ]
+        loaded, fallback = self._load_both_ways(ActivityLog, records)
+        self.assertEqual(loaded, fallback)
+        self.assertEqual(loaded, [ActivityLog.from_dict(record) for record in records])
+        self.assertEqual(loaded[0].timestamp, datetime(2024, 5, 1, 9, 30))
+    
+    def test_null_timestamp_defaults_to_now(self):
+        """Test that a null timestamp loads as in from_dict instead of failing"""
+        records = [{'user_id': 'u1', 'activity_type': 'login', 'description': 'Logged in',
+                    'timestamp': None}]
+        before = datetime.now()
+        for logs in self._load_both_ways(ActivityLog, records):
+            self.assertEqual(len(logs), 1)
+            self.assertGreaterEqual(logs[0].timestamp, before)
+    
+    def test_progress_records_match_from_dict(self):
+        """Test that both paths load the same progress records"""
+        records = [
+            LearningProgress('u1', 'quiz-1', 'quiz', status='completed', progress_percentage=100.0,
+                             last_accessed=datetime(2024, 5, 1, 9, 30),
+                             completed_at=datetime(2024, 5, 1, 9, 45)).to_dict(),
+            {'user_id': 'u1', 'content_id': 'course-1', 'content_type': 'course',
+             'status': 'in_progress', 'progress_percentage': 40, 'time_spent': 120,
+             'last_accessed': None, 'completed_at': None, 'metadata': None},
+        ]
+        loaded, fallback = self._load_both_ways(LearningProgress, records)
+        self.assertEqual(loaded, fallback)
+        self.assertEqual(loaded, [LearningProgress.from_dict(record) for record in records])
+    
+    def test_invalid_records_raise_the_same_errors(self):
+        """Test that both paths reject invalid records with from_dict's errors"""
+        invalid_status = [{'user_id': 'u1', 'content_id': 'c1', 'content_type': 'quiz',
+                           'status': 'paused'}]
+        missing_field = [{'user_id': 'u1', 'content_type': 'quiz'}]
+        for use_msgspec in (True, False):
+            with patch('models.user_models.msgspec', msgspec if use_msgspec else None):
+                with self.assertRaisesRegex(ValueError, 'Status must be one of'):
+                    LearningProgress.from_dict_batch(invalid_status)
+                with self.assertRaises(KeyError):
+                    LearningProgress.from_dict_batch(missing_field)
+
+class TestSlots(unittest.TestCase):
+    """Test cases for the slotted user model dataclasses"""
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_instances_have_no_dict(self):
+        """Test that the models generate __slots__ instead of a __dict__"""
+        user = _sample_user()
+        for obj in (user, user.profile, user.profile.preferences,
+                    user.profile.learning_goals[0],
+                    ActivityLog('u1', 'login', 'Logged in'),
+                    LearningProgress('u1', 'quiz-1', 'quiz')):
+            with self.subTest(model=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    obj.unknown_attribute = 1
+
+class TestTimestampFormatting(unittest.TestCase):
+    """Test cases for formatting user model timestamps"""
+    
+    def test_timestamps_match_isoformat(self):
+        """Test that set timestamps are formatted as ISO 8601"""
+        user = _sample_user()
+        data = user.to_dict()
+        self.assertEqual(data['last_login'], '2024-05-03T08:00:00.000500')
+        self.assertEqual(data['created_at'], '2024-05-01T09:30:00')
+        self.assertEqual(data['profile']['learning_goals'][0]['target_completion_date'],
+                         '2024-12-31T00:00:00')
+    
+    def test_unset_timestamps_are_none(self):
+        """Test that optional timestamps serialize as None"""
+        user = User('u1', 'dev', 'dev@example.com')
+        self.assertIsNone(user.to_dict()['last_login'])
+        data = LearningProgress('u1', 'quiz-1', 'quiz').to_dict()
+        self.assertIsNone(data['last_accessed'])
+        self.assertIsNone(data['completed_at'])
+        self.assertIsNone(LearningGoal('Goal', 'Text').to_dict()['target_completion_date'])
+    
+    def test_aware_timestamps_keep_their_offset(self):
+        """Test that time zone offsets are kept"""
+        timestamp = datetime(2024, 5, 1, 12, 0, tzinfo=timezone(timedelta(hours=-5)))
+        log = ActivityLog('u1', 'login', 'Logged in', timestamp)
+        self.assertEqual(log.to_dict()['timestamp'], '2024-05-01T12:00:00-05:00')
+
+class TestPairedTimestamps(unittest.TestCase):
+    """Test cases for timestamps that are set together"""
+    
+    def test_updated_at_defaults_to_created_at(self):
+        """Test that a new user was last updated when it was created"""
+        user = User('u1', 'dev', 'dev@example.com')
+        self.assertEqual(user.updated_at, user.created_at)
+        self.assertEqual(_sample_user().updated_at, datetime(2024, 5, 1, 9, 30))
+        
+        data = _sample_user().to_dict(include_sensitive=True)
+        del data['updated_at']
+        self.assertEqual(User.from_dict(data).updated_at, datetime(2024, 5, 1, 9, 30))
+    
+    def test_login_sets_both_timestamps_to_the_same_instant(self):
+        """Test that update_last_login reads the clock once"""
+        user = _sample_user()
+        user.update_last_login()
+        self.assertEqual(user.last_login, user.updated_at)
+        self.assertGreater(user.last_login, user.created_at)
+    
+    def test_completion_sets_both_timestamps_to_the_same_instant(self):
+        """Test that complete_learning reads the clock once"""
+        progress = LearningProgress('u1', 'quiz-1', 'quiz')
+        progress.complete_learning(score=80.0)
+        self.assertEqual(progress.completed_at, progress.last_accessed)
+        self.assertEqual(progress.status, 'completed')
+        self.assertEqual(progress.best_score, 80.0)
+
+class TestChoiceValidation(unittest.TestCase):
+    """Test cases for goal priority and progress status validation"""
+    
+    def test_valid_choices(self):
+        """Test that each listed priority and status is accepted"""
+        for priority in ('low', 'medium', 'high'):
+            with self.subTest(priority=priority):
+                self.assertEqual(LearningGoal('Goal', 'Text', priority=priority).priority, priority)
+        for status in ('not_started', 'in_progress', 'completed'):
+            with self.subTest(status=status):
+                self.assertEqual(LearningProgress('u1', 'c1', 'quiz', status=status).status, status)
+    
+    def test_invalid_choices_list_the_options(self):
+        """Test the error messages for unknown values"""
+        with self.assertRaisesRegex(ValueError, "Priority must be one of: low, medium, high$"):
+            LearningGoal('Goal', 'Text', priority='urgent')
+        with self.assertRaisesRegex(ValueError, "Status must be one of: not_started, "
+                                                "in_progress, completed$"):
+            LearningProgress('u1', 'c1', 'quiz', status='paused')
+
+class TestPreferencesFromDict(unittest.TestCase):
+    """Test cases for UserPreferences.from_dict"""
+    
+    def test_round_trip(self):
+        """Test that from_dict rebuilds what to_dict produced"""
+        preferences = UserPreferences(language='italian', theme='dark', font_size='large',
+                                      notification_enabled=False)
+        self.assertEqual(UserPreferences.from_dict(preferences.to_dict()), preferences)
+    
+    def test_missing_keys_use_defaults(self):
+        """Test that partial and empty dictionaries are filled with defaults"""
+        self.assertEqual(UserPreferences.from_dict({}), UserPreferences())
+        self.assertEqual(UserPreferences.from_dict({'theme': 'auto'}),
+                         UserPreferences(theme='auto'))
+    
+    def test_unknown_keys_are_ignored(self):
+        """Test that keys that are not preferences are dropped"""
+        data = {'theme': 'dark', 'beta_features': True, 'to_dict': None}
+        self.assertEqual(UserPreferences.from_dict(data), UserPreferences(theme='dark'))
+
+class TestEnumCoercion(unittest.TestCase):
+    """Test cases for converting user roles and skill levels"""
+    
+    def test_values_and_members_are_accepted(self):
+        """Test that value strings become members and members pass through"""
+        self.assertIs(User('u1', 'dev', 'dev@example.com', role='admin').role, UserRole.ADMIN)
+        self.assertIs(User('u1', 'dev', 'dev@example.com', role=UserRole.GUEST).role,
+                      UserRole.GUEST)
+        
+        profile = UserProfile()
+        profile.add_skill('python', 'expert')
+        profile.add_skill('sql', SkillLevel.NOVICE)
+        self.assertEqual(profile.skills, {'python': SkillLevel.EXPERT, 'sql': SkillLevel.NOVICE})
+        self.assertEqual(UserProfile.from_dict({'skills': {'go': 'intermediate'}}).skills,
+                         {'go': SkillLevel.INTERMEDIATE})
+    
+    def test_unknown_values_raise(self):
+        """Test the error message for each unknown value"""
+        with self.assertRaisesRegex(ValueError, "Invalid user role: owner"):
+            User('u1', 'dev', 'dev@example.com', role='owner')
+        with self.assertRaisesRegex(ValueError, "Invalid user role: owner"):
+            User.from_dict({'user_id': 'u1', 'username': 'dev', 'email': 'dev@example.com',
+                            'role': 'owner'})
+        with self.assertRaisesRegex(ValueError, "Invalid skill level: guru"):
+            UserProfile().add_skill('python', 'guru')
+        with self.assertRaisesRegex(ValueError, "Invalid skill level: Expert"):
+            UserProfile.from_dict({'skills': {'python': 'Expert'}})
+
+class TestJSONEncoding(unittest.TestCase):
+    """Test cases for to_json with each available encoder"""
+    
+    def test_user_to_json_matches_to_dict(self):
+        """Test the user document, with and without the email"""
+        user = _sample_user()
+        for encoder in each_encoder():
+            with self.subTest(encoder=encoder):
+                self.assertEqual(json.loads(user.to_json()), user.to_dict())
+                self.assertEqual(json.loads(user.to_json(include_sensitive=True)),
+                                 user.to_dict(include_sensitive=True))
+                self.assertNotIn('email', json.loads(user.to_json()))
+    
+    def test_other_models_match_to_dict(self):
+        """Test the profile, preferences, goal, activity and progress documents"""
+        user = _sample_user()
+        progress = LearningProgress('u1', 'quiz-1', 'quiz', notes='Retry later',
+                                    last_accessed=datetime(2024, 5, 2, 18, 15))
+        models = (user.profile, user.profile.preferences, user.profile.learning_goals[0],
+                  ActivityLog('u1', 'login', 'Logged in', datetime(2024, 5, 1, 9, 30),
+                              metadata={'ip': '127.0.0.1'}),
+                  progress)
+        for encoder in each_encoder():
+            for obj in models:
+                with self.subTest(encoder=encoder, model=type(obj).__name__):
+                    self.assertEqual(json.loads(obj.to_json()), obj.to_dict())
+    
+    def test_aware_utc_timestamps_round_trip_with_each_encoder(self):
+        """Test that from_dict reads the UTC offset every encoder writes"""
+        utc = datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc)
+        user = _sample_user()
+        user.created_at = user.updated_at = user.last_login = utc
+        progress = LearningProgress('u1', 'quiz-1', 'quiz', last_accessed=utc)
+        progress.completed_at = utc
+        log = ActivityLog('u1', 'login', 'Logged in', utc)
+        for encoder in each_encoder():
+            with self.subTest(encoder=encoder):
+                self.assertEqual(User.from_dict(json.loads(user.to_json(include_sensitive=True))),
+                                 user)
+                self.assertEqual(LearningProgress.from_dict(json.loads(progress.to_json())),
+                                 progress)
+                self.assertEqual(ActivityLog.from_dict(json.loads(log.to_json())), log)
+
+class TestSkillQueries(unittest.TestCase):
+    """Test cases for UserProfile.get_skills_at_or_above"""
+    
+    def test_levels_compare_in_declaration_order(self):
+        """Test the skills returned for each threshold"""
+        profile = _sample_user().profile
+        self.assertEqual(profile.get_skills_at_or_above(SkillLevel.NOVICE),
+                         ['python', 'sql', 'rust'])
+        self.assertEqual(profile.get_skills_at_or_above(SkillLevel.BEGINNER), ['python', 'sql'])
+        self.assertEqual(profile.get_skills_at_or_above('advanced'), ['python'])
+        self.assertEqual(profile.get_skills_at_or_above(SkillLevel.EXPERT), [])
+    
+    def test_empty_profile(self):
+        """Test that a profile without skills returns an empty list"""
+        self.assertEqual(UserProfile().get_skills_at_or_above('novice'), [])
+    
+    def test_unknown_level_raises(self):
+        """Test that the threshold must be a known skill level"""
+        with self.assertRaisesRegex(ValueError, "Invalid skill level: master"):
+            UserProfile().get_skills_at_or_above('master')
+
+class TestUpdateProfile(unittest.TestCase):
+    """Test cases for User.update_profile"""
+    
+    def test_known_fields_are_updated(self):
+        """Test that profile fields are set and the user is marked updated"""
+        user = _sample_user()
+        user.update_profile({'bio': 'Data engineer', 'timezone': 'Europe/Rome'})
+        self.assertEqual(user.profile.bio, 'Data engineer')
+        self.assertEqual(user.profile.timezone, 'Europe/Rome')
+        self.assertGreater(user.updated_at, user.created_at)
+    
+    def test_unknown_keys_and_method_names_are_ignored(self):
+        """Test that methods and unknown attributes cannot be overwritten"""
+        user = _sample_user()
+        user.update_profile({'to_dict': None, 'add_skill': 'x', 'nickname': 'dev'})
+        self.assertEqual(user.profile.to_dict()['bio'], 'Backend developer')
+        user.profile.add_skill('go', 'beginner')
+        self.assertIs(user.get_skill_level('go'), SkillLevel.BEGINNER)
+
+class TestInterests(unittest.TestCase):
+    """Test cases for adding and removing user interests"""
+    
+    def test_remove_interest(self):
+        """Test that a present interest is removed and the user marked updated"""
+        user = _sample_user()
+        self.assertTrue(user.remove_interest('python'))
+        self.assertEqual(user.profile.interests, ['databases'])
+        self.assertGreater(user.updated_at, user.created_at)
+    
+    def test_remove_missing_interest(self):
+        """Test that a missing interest leaves the user unchanged"""
+        user = _sample_user()
+        self.assertFalse(user.remove_interest('cooking'))
+        self.assertEqual(user.profile.interests, ['python', 'databases'])
+        self.assertEqual(user.updated_at, user.created_at)
+    
+    def test_add_interest_skips_duplicates(self):
+        """Test that interests are only added once"""
+        user = _sample_user()
+        user.add_interest('python')
+        user.add_interest('')
+        user.add_interest('rust')
+        self.assertEqual(user.profile.interests, ['python', 'databases', 'rust'])
+
+class TestTimestampParsing(unittest.TestCase):
+    """Test cases for parsing stored user model timestamps"""
+    
+    def test_parser_reads_isoformat(self):
+        """Test that the parser reads what isoformat writes"""
+        for value in (datetime(2024, 5, 1, 9, 30), datetime(2024, 5, 1, 9, 30, 0, 250),
+                      datetime(2024, 5, 1, 9, 30, tzinfo=timezone(timedelta(hours=2)))):
+            with self.subTest(value=value):
+                self.assertEqual(_compat.parse_datetime(value.isoformat()), value)
+    
+    def test_utc_z_suffix(self):
+        """Test that the Z offset msgspec writes is read on every Python version"""
+        utc = datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc)
+        for parse in (_compat.parse_datetime, _compat._parse_datetime_utc_z):
+            with self.subTest(parse=parse):
+                self.assertEqual(parse('2024-05-01T09:30:00Z'), utc)
+                self.assertEqual(parse('2024-05-01T09:30:00+00:00'), utc)
+                self.assertEqual(parse('2024-05-01T09:30:00'), utc.replace(tzinfo=None))
+        self.assertEqual(_compat._parse_datetime_utc_z('2024-05-01T09:30:00z'), utc)
+        with self.assertRaises(ValueError):
+            _compat._parse_datetime_utc_z('Z')
+    
+    def test_from_dict_round_trips(self):
+        """Test that every stored timestamp is restored by from_dict"""
+        user = _sample_user()
+        self.assertEqual(User.from_dict(user.to_dict(include_sensitive=True)), user)
+        
+        progress = LearningProgress('u1', 'quiz-1', 'quiz')
+        progress.complete_learning()
+        self.assertEqual(LearningProgress.from_dict(progress.to_dict()), progress)
+        
+        log = ActivityLog('u1', 'login', 'Logged in', datetime(2024, 5, 1, 9, 30, 15))
+        self.assertEqual(ActivityLog.from_dict(log.to_dict()), log)
+    
+    def test_invalid_timestamp_raises_value_error(self):
+        """Test that malformed timestamps are rejected"""
+        with self.assertRaises(ValueError):
+            ActivityLog.from_dict({'user_id': 'u1', 'activity_type': 'login',
+                                   'description': 'Logged in', 'timestamp': 'yesterday'})
+
+class TestPermissionSets(unittest.TestCase):
+    """Test cases for the per-role permission sets"""
+    
+    def test_each_role_has_exactly_its_permissions(self):
+        """Test the full permission list of every role"""
+        student = {'take_quizzes', 'view_content', 'track_progress'}
+        instructor = student | {'create_content', 'manage_quizzes', 'view_student_progress'}
+        admin = instructor | {'manage_users', 'manage_content', 'view_analytics'}
+        everything = admin | {'unknown_permission'}
+        
+        for role, expected in ((UserRole.STUDENT, student), (UserRole.INSTRUCTOR, instructor),
+                               (UserRole.ADMIN, admin), (UserRole.GUEST, set())):
+            with self.subTest(role=role.value):
+                user = User('u1', 'dev', 'dev@example.com', role=role)
+                granted = {permission for permission in everything
+                           if user.has_permission(permission)}
+                self.assertEqual(granted, expected)
+
+if __name__ == '__main__':
+    unittest.main()